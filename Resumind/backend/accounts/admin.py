@@ -1,6 +1,12 @@
 from django.contrib import admin
-from .models import User
+from .models import PurgeRequest, User
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'is_company', 'is_applicant', 'full_name')
+
+
+@admin.register(PurgeRequest)
+class PurgeRequestAdmin(admin.ModelAdmin):
+    list_display = ('owner', 'status', 'deleted', 'total', 'created_at', 'finished_at')
+    list_filter = ('status',)
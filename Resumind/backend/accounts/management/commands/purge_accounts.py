@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from accounts.models import PurgeRequest
+from accounts.tasks import ACTIVE_STATUSES, run_purge
+
+
+class Command(BaseCommand):
+    help = "Finish logout purges that are still pending or were interrupted, e.g. by a server restart."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=settings.PURGE_CHUNK_SIZE)
+        parser.add_argument("--pause", type=float, default=settings.PURGE_CHUNK_PAUSE_SECONDS,
+                            help="Seconds to wait between chunks.")
+
+    def handle(self, *args, **options):
+        # Interrupted runs are continued too; run_purge skips what is already gone
+        ids = list(PurgeRequest.objects.filter(status__in=ACTIVE_STATUSES).order_by("id").values_list("id", flat=True))
+        removed = sum(run_purge(purge_id, options["chunk_size"], options["pause"]) for purge_id in ids)
+        self.stdout.write(self.style.SUCCESS(f"{len(ids)} purge(s) finished, {removed} resume(s) deleted"))
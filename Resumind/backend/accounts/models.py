@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Max
 
 class User(AbstractUser):
     is_company = models.BooleanField(default=False)
@@ -10,3 +11,47 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.username
+
+
+ACTIVE_PURGE_STATUSES = ('pending', 'running')
+
+
+class PurgeRequest(models.Model):
+    """
+    A user's data queued for removal at logout. Resumes up to
+    up_to_resume_id (with their reports, skills and files) are deleted in
+    the background in small chunks; deleted counts them as they go.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+    ]
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='purge_requests')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    up_to_resume_id = models.BigIntegerField(default=0)  # resumes uploaded after the logout are kept
+    total = models.PositiveIntegerField(default=0)
+    deleted = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['owner', 'status'], name='purge_owner_status_idx')]
+
+    @classmethod
+    def cutoff_for(cls, owner):
+        """
+        Highest resume id an unfinished purge of owner covers, or 0. Those
+        resumes are hidden from the owner while they are being deleted.
+        """
+        owner_id = getattr(owner, 'pk', owner)
+        purges = cls.objects.filter(owner_id=owner_id, status__in=ACTIVE_PURGE_STATUSES)
+        return purges.aggregate(cutoff=Max('up_to_resume_id'))['cutoff'] or 0
+
+    @property
+    def remaining(self):
+        return max(self.total - self.deleted, 0)
+
+    def __str__(self):
+        return f"Purge {self.pk} of {self.owner} ({self.status})"
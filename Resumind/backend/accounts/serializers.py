@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import authenticate
+from .models import PurgeRequest
 
 User = get_user_model()  # <-- this fixes the custom user problem
 
@@ -40,3 +41,11 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         data = super().validate({'username': username, 'password': password})
         return data
+
+
+class PurgeRequestSerializer(serializers.ModelSerializer):
+    remaining = serializers.ReadOnlyField()
+
+    class Meta:
+        model = PurgeRequest
+        fields = ['id', 'status', 'total', 'deleted', 'remaining', 'created_at', 'started_at', 'finished_at']
@@ -0,0 +1,130 @@
+import os
+import time
+import shutil
+import logging
+import threading
+from collections import deque
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, Max
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from resumes.models import Resume
+from resumes.utils import delete_resumes_by_ids
+from .models import ACTIVE_PURGE_STATUSES as ACTIVE_STATUSES, PurgeRequest
+
+logger = logging.getLogger(__name__)
+
+
+def request_purge(user):
+    """
+    Queue the user's current resumes for deletion and return the purge, or
+    None when there is nothing to delete. From then on they are hidden from
+    the user (Resume.objects.owned_by) until the purge deletes them. A purge still in progress is
+    reused and extended to resumes uploaded since, so logging out twice
+    never starts a second one.
+    """
+    stats = Resume.objects.filter(owner=user).aggregate(count=Count("id"), last=Max("id"))
+    count, last = stats["count"], stats["last"] or 0
+    purge = PurgeRequest.objects.filter(owner=user, status__in=ACTIVE_STATUSES).order_by("-id").first()
+    if purge is not None and PurgeRequest.objects.filter(pk=purge.pk, status__in=ACTIVE_STATUSES).update(
+        up_to_resume_id=Greatest(F("up_to_resume_id"), last),
+        total=F("deleted") + count,
+    ):
+        purge.refresh_from_db()
+    elif count:
+        purge = PurgeRequest.objects.create(owner=user, up_to_resume_id=last, total=count)
+    else:
+        return None
+    purge_reclaimer.enqueue(purge.pk)
+    return purge
+
+
+def run_purge(purge_id, chunk_size=None, pause=None):
+    """
+    Delete the resumes a purge covers in chunks, pausing between chunks,
+    then mark it done. Only resumes still present are touched, so an
+    interrupted or finished purge can safely be run again. Returns the
+    number of resumes this run deleted.
+    """
+    chunk_size = chunk_size or settings.PURGE_CHUNK_SIZE
+    pause = settings.PURGE_CHUNK_PAUSE_SECONDS if pause is None else pause
+    PurgeRequest.objects.filter(pk=purge_id, status="pending").update(status="running", started_at=timezone.now())
+    purge = PurgeRequest.objects.filter(pk=purge_id, status="running").first()
+    if purge is None:
+        return 0
+    removed = 0
+    while True:
+        # Read the cutoff every round: a repeated logout may have moved it,
+        # and another runner may have finished the purge meanwhile
+        state = PurgeRequest.objects.filter(pk=purge_id).values_list("status", "up_to_resume_id").first()
+        if state is None or state[0] != "running":
+            break
+        cutoff = state[1]
+        ids = list(
+            Resume.objects.filter(owner_id=purge.owner_id, id__lte=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:chunk_size]
+        )
+        if not ids:
+            finished = PurgeRequest.objects.filter(pk=purge_id, status="running", up_to_resume_id=cutoff).update(
+                status="done", total=F("deleted"), finished_at=timezone.now()
+            )
+            if finished:
+                break
+            # The cutoff moved or the status changed; the next round tells which
+            continue
+        deleted = delete_resumes_by_ids(purge.owner_id, ids, wait=True)
+        # A concurrent runner may already have closed the purge with a lower total
+        PurgeRequest.objects.filter(pk=purge_id).update(
+            deleted=F("deleted") + deleted, total=Greatest(F("total"), F("deleted") + deleted)
+        )
+        removed += deleted
+        if pause:
+            time.sleep(pause)
+    resume_folder = os.path.join(settings.MEDIA_ROOT, "resumes")
+    if os.path.exists(resume_folder) and not os.listdir(resume_folder):
+        shutil.rmtree(resume_folder, ignore_errors=True)
+    return removed
+
+
+class PurgeReclaimer:
+    """
+    A single background thread per process that runs queued purges one
+    after another, so a wave of logouts deletes at the same steady rate as
+    one. The thread starts on demand and exits when the queue is empty.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self._queued = set()
+        self._thread = None
+
+    def enqueue(self, purge_id):
+        with self._lock:
+            if purge_id not in self._queued:
+                self._queued.add(purge_id)
+                self._queue.append(purge_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="account-purge", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        self._thread = None
+                        return
+                    purge_id = self._queue.popleft()
+                    self._queued.discard(purge_id)
+                try:
+                    run_purge(purge_id)
+                except Exception:
+                    logger.exception("Purge %s failed; manage.py purge_accounts resumes it", purge_id)
+        finally:
+            connection.close()
+
+
+purge_reclaimer = PurgeReclaimer()
@@ -1,3 +1,126 @@
-from django.test import TestCase  # noqa: F401
+import shutil
+import tempfile
+from unittest import mock
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from reports.models import Report
+from resumes.models import FileTombstone, Resume
+from resumes.utils import delete_resumes_by_ids
+from .models import PurgeRequest, User
+from .tasks import request_purge, run_purge
 
-# Create your tests here.
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class PurgeTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.other = User.objects.create_user("bob", "bob@example.com")
+        self.resumes = [self.resume(self.user, f"purge-{i}") for i in range(5)]
+        self.kept = self.resume(self.other, "purge-bob")
+        patch = mock.patch("accounts.tasks.purge_reclaimer")
+        self.reclaimer = patch.start()
+        self.addCleanup(patch.stop)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def resume(self, owner, key):
+        name = default_storage.save(f"resumes/{key}.txt", ContentFile(b"Python developer"))
+        resume = Resume.objects.create(owner=owner, file=name, status="processed", content_hash=key)
+        Report.objects.create(resume=resume, owner=owner, uploaded_at=resume.uploaded_at, score=1)
+        return resume
+
+    def test_logout_queues_one_purge_and_hides_the_data(self):
+        response = self.client.post("/api/accounts/logout-clear-media/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["purge"]["total"], 5)
+        self.reclaimer.enqueue.assert_called_once_with(response.data["purge"]["id"])
+        # Nothing is deleted yet, but the user no longer sees it
+        self.assertEqual(Resume.objects.filter(owner=self.user).count(), 5)
+        self.assertEqual(self.client.get("/api/resumes/").data["results"], [])
+        self.assertEqual(self.client.get(f"/api/resumes/{self.resumes[0].pk}/").status_code, 404)
+        self.assertEqual(self.client.get("/api/reports/").data["results"], [])
+
+        fresh = self.resume(self.user, "purge-new")
+        self.assertEqual([row["id"] for row in self.client.get("/api/resumes/").data["results"]], [fresh.pk])
+        again = self.client.post("/api/accounts/logout-clear-media/").data["purge"]
+        self.assertEqual((again["id"], again["total"]), (response.data["purge"]["id"], 6))
+        self.assertEqual(PurgeRequest.objects.count(), 1)
+
+    def test_run_purge_is_safe_to_run_twice(self):
+        purge = request_purge(self.user)
+        fresh = self.resume(self.user, "purge-new")
+        self.assertEqual(run_purge(purge.pk, chunk_size=2, pause=0), 5)
+        self.assertEqual(run_purge(purge.pk, chunk_size=2, pause=0), 0)
+        purge.refresh_from_db()
+        self.assertEqual((purge.status, purge.deleted, purge.total, purge.remaining), ("done", 5, 5, 0))
+        self.assertIsNotNone(purge.finished_at)
+        self.assertEqual(set(Resume.objects.values_list("pk", flat=True)), {fresh.pk, self.kept.pk})
+        self.assertEqual(Report.objects.count(), 2)
+        self.assertFalse(any(default_storage.exists(resume.file.name) for resume in self.resumes))
+        self.assertFalse(FileTombstone.objects.exists())
+        self.assertEqual(PurgeRequest.cutoff_for(self.user), 0)
+
+    def test_run_purge_skips_a_finished_purge(self):
+        purge = request_purge(self.user)
+        PurgeRequest.objects.filter(pk=purge.pk).update(status="done")
+        self.assertEqual(run_purge(purge.pk, pause=0), 0)
+        self.assertEqual(Resume.objects.filter(owner=self.user).count(), 5)
+
+    def test_concurrent_run_of_the_same_purge(self):
+        purge = request_purge(self.user)
+        real_delete = delete_resumes_by_ids
+        calls = []
+
+        def delete_and_race(owner_id, ids, wait=False):
+            calls.append(ids)
+            deleted = real_delete(owner_id, ids, wait=wait)
+            if len(calls) == 1:
+                # A second runner (the other worker, or purge_accounts) finishes it first
+                run_purge(purge.pk, chunk_size=2, pause=0)
+            return deleted
+
+        with mock.patch("accounts.tasks.delete_resumes_by_ids", side_effect=delete_and_race):
+            self.assertEqual(run_purge(purge.pk, chunk_size=2, pause=0), 2)
+        purge.refresh_from_db()
+        self.assertEqual((purge.status, purge.deleted, purge.total), ("done", 5, 5))
+        self.assertEqual(list(Resume.objects.values_list("pk", flat=True)), [self.kept.pk])
+
+    def test_cutoff_extended_mid_run(self):
+        purge = request_purge(self.user)
+        real_delete = delete_resumes_by_ids
+        late = []
+
+        def delete_then_logout_again(owner_id, ids, wait=False):
+            deleted = real_delete(owner_id, ids, wait=wait)
+            if not late:
+                late.append(self.resume(self.user, "purge-late"))
+                self.assertEqual(request_purge(self.user).pk, purge.pk)
+            return deleted
+
+        with mock.patch("accounts.tasks.delete_resumes_by_ids", side_effect=delete_then_logout_again):
+            self.assertEqual(run_purge(purge.pk, chunk_size=2, pause=0), 6)
+        purge.refresh_from_db()
+        self.assertEqual((purge.status, purge.deleted, purge.total), ("done", 6, 6))
+        self.assertEqual(purge.up_to_resume_id, late[0].pk)
+        self.assertEqual(list(Resume.objects.values_list("pk", flat=True)), [self.kept.pk])
+
+    def test_interrupted_purge_resumes_where_it_stopped(self):
+        purge = request_purge(self.user)
+        with mock.patch("accounts.tasks.delete_resumes_by_ids", side_effect=RuntimeError("database went away")):
+            with self.assertRaises(RuntimeError):
+                run_purge(purge.pk, pause=0)
+        self.assertEqual(PurgeRequest.objects.get(pk=purge.pk).status, "running")
+        self.assertEqual(run_purge(purge.pk, chunk_size=2, pause=0), 5)
+        self.assertEqual(self.client.get("/api/accounts/purge-status/").data["status"], "done")
+
+    def test_nothing_to_purge(self):
+        self.assertIsNone(request_purge(User.objects.create_user("carol")))
+        self.assertEqual(self.client.get("/api/accounts/purge-status/").status_code, 404)
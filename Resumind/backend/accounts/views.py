@@ -4,13 +4,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import get_user_model
-from django.conf import settings
-import os
-import shutil
-from resumes.models import Resume
-from reports.models import Report
-from .serializers import RegisterSerializer, MyTokenObtainPairSerializer
-from resumes.utils import delete_resumes_by_ids
+from .models import PurgeRequest
+from .serializers import RegisterSerializer, MyTokenObtainPairSerializer, PurgeRequestSerializer
+from .tasks import request_purge
 
 User = get_user_model()
 
@@ -28,12 +24,24 @@ class LoginView(TokenObtainPairView):
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def logout_and_clear_media(request):
-    user = request.user
-    ids = list(Resume.objects.filter(owner=user).values_list("id", flat=True))
-    if ids:
-        delete_resumes_by_ids(user, ids)
-    Report.objects.filter(resume__owner=user).delete()
-    resume_folder = os.path.join(settings.MEDIA_ROOT, "resumes")
-    if os.path.exists(resume_folder) and not os.listdir(resume_folder):
-        shutil.rmtree(resume_folder, ignore_errors=True)
-    return Response({"detail": "Logged out successfully"}, status=status.HTTP_200_OK)
+    """
+    Log out and queue the user's resumes, reports and files for deletion.
+    The data is removed in the background; purge-status/ follows it.
+    """
+    purge = request_purge(request.user)
+    return Response(
+        {"detail": "Logged out successfully", "purge": PurgeRequestSerializer(purge).data if purge else None},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def purge_status(request):
+    """
+    Progress of the user's latest purge.
+    """
+    purge = PurgeRequest.objects.filter(owner=request.user).order_by("-id").first()
+    if purge is None:
+        return Response({"detail": "No purge requested"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(PurgeRequestSerializer(purge).data)
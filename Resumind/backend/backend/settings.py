@@ -7,7 +7,7 @@ Adjusted for Resumind with MySQL (XAMPP) + REST Framework + JWT.
 """
 
 from pathlib import Path
-import os  # noqa: F401
+import os
 from datetime import timedelta
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     'resumes',
     'reports',
     'jobs',
+    'taxonomy',
 ]
 
 MIDDLEWARE = [
@@ -108,6 +109,33 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Uploads above this size are spooled to FILE_UPLOAD_TEMP_DIR rather than
+# held in memory. Keep the temp dir on the same filesystem as MEDIA_ROOT so
+# storing a spooled upload is a rename, not a second copy.
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.environ.get('FILE_UPLOAD_MAX_MEMORY_SIZE', 512 * 1024))
+FILE_UPLOAD_TEMP_DIR = os.environ.get('FILE_UPLOAD_TEMP_DIR', str(BASE_DIR / 'cache' / 'uploads'))
+
+# Resume ingestion: uploads are parsed by a pool of local worker processes
+RESUME_INGEST_WORKERS = int(os.environ.get('RESUME_INGEST_WORKERS', os.cpu_count() or 2))
+RESUME_EXTRACT_TIMEOUT = 60  # seconds per file
+RESUME_PDF_PAGES_PER_TASK = 4  # page range handed to one worker for large PDFs
+RESUME_PARSE_CACHE_DIR = BASE_DIR / 'cache' / 'parsed'
+RESUME_PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Semantic matching: a sentence-transformers model name (e.g. all-MiniLM-L6-v2)
+# run on the CPU, or empty for the offline hashing TF-IDF encoder
+RESUME_EMBEDDING_MODEL = os.environ.get('RESUME_EMBEDDING_MODEL', '')
+RESUME_EMBEDDING_DIR = BASE_DIR / 'cache' / 'embeddings'
+RESUME_EMBEDDING_DTYPE = 'float32'  # float16 halves the file but is much slower to score on most CPUs
+RESUME_IMPORT_CHECKPOINT_DIR = BASE_DIR / 'cache' / 'imports'  # progress of manage.py import_resumes
+FILE_DELETE_WORKERS = 8  # threads unlinking files of deleted resumes
+# Logout purges: a user's data is deleted in the background, this many
+# resumes at a time with a pause in between to leave room for live traffic
+PURGE_CHUNK_SIZE = 200
+PURGE_CHUNK_PAUSE_SECONDS = 0.2
+
+# Reports: criteria changes are rescored in the background once they settle
+RESCORE_DEBOUNCE_SECONDS = 2
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
@@ -0,0 +1,131 @@
+"""
+End-to-end latency of the upload and reports endpoints for accounts of a
+given size. Accounts are loaded straight into the database from synthetic
+profiles; the endpoints are exercised through the DRF test client.
+"""
+import hashlib
+import shutil
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from jobs.storage import set_criteria
+from resumes.models import Resume, ResumeSkill
+from resumes.parsing import identity_fields
+
+from .synthetic import synthetic_resumes
+
+LOAD_CHUNK = 2000
+BATCH_POLL_SECONDS = 0.05
+BATCH_TIMEOUT_SECONDS = 300
+
+
+def create_account(username, count, seed=0):
+    """
+    A user owning count processed resumes. Returns (user, load seconds).
+    """
+    user = get_user_model().objects.create_user(username, f"{username}@example.com", "bench-password")
+    start = time.perf_counter()
+    rows = synthetic_resumes(count, seed)
+    while True:
+        chunk = list(islice(rows, LOAD_CHUNK))
+        if not chunk:
+            break
+        resumes = []
+        for text, profile in chunk:
+            identity = identity_fields(profile)
+            identity["content_hash"] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            resumes.append(Resume(
+                file=f"resumes/synthetic/{identity['content_hash'][:16]}.pdf",
+                owner=user,
+                parsed_text=text,
+                skills=", ".join(profile["skills"]),
+                certifications=profile["certifications"],
+                education=profile["education"],
+                projects=profile["projects_count"],
+                experience_years=profile["experience_years"],
+                summary=profile,
+                status="processed",
+                **identity,
+            ))
+        Resume.objects.bulk_create(resumes)
+        ResumeSkill.objects.bulk_create([
+            ResumeSkill(resume_id=resume.pk, skill_id=skill_id)
+            for resume, (_, profile) in zip(resumes, chunk)
+            for skill_id in profile["skill_ids"]
+        ])
+    return user, time.perf_counter() - start
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    response = func(*args, **kwargs)
+    return response, round((time.perf_counter() - start) * 1000, 2)
+
+
+def measure_reports_list(client, repeat=5):
+    """
+    reports_list latency in ms: the first call after criteria changed,
+    which scores only the first page and leaves the rest to the background
+    rescore it schedules, then warm first pages, a second page by cursor
+    and a filtered page. Calls made before that rescore has finished serve
+    whatever reports are stored by then.
+    """
+    first, cold_ms = _timed(client.get, "/api/reports/")
+    warm = sorted(_timed(client.get, "/api/reports/")[1] for _ in range(repeat))
+    cursor = first.json().get("next_cursor")
+    page2_ms = _timed(client.get, "/api/reports/", {"cursor": cursor})[1] if cursor else None
+    filtered_ms = _timed(client.get, "/api/reports/", {"min_score": 40, "education": "master"})[1]
+    return {
+        "status": first.status_code,
+        "cold_ms": cold_ms,
+        "warm_p50_ms": warm[len(warm) // 2],
+        "page2_ms": page2_ms,
+        "filtered_ms": filtered_ms,
+    }
+
+
+def measure_upload(client, files):
+    """
+    Upload latency in ms for the sample files: the request itself and the
+    time until the background batch has finished parsing. The parse cache
+    is emptied first so every file is extracted.
+    """
+    shutil.rmtree(settings.RESUME_PARSE_CACHE_DIR, ignore_errors=True)
+    handles = [open(path, "rb") for path, _ in files]
+    try:
+        start = time.perf_counter()
+        response = client.post("/api/resumes/upload/", {"files": handles}, format="multipart")
+        request_ms = (time.perf_counter() - start) * 1000
+    finally:
+        for handle in handles:
+            handle.close()
+    batch_id = response.json().get("batch_id")
+    batch = {}
+    deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+    while batch_id and not batch.get("done") and time.monotonic() < deadline:
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = client.get(f"/api/resumes/batches/{batch_id}/").json()
+    return {
+        "status": response.status_code,
+        "files": len(files),
+        "request_ms": round(request_ms, 2),
+        "batch_done_ms": round((time.perf_counter() - start) * 1000, 2) if batch.get("done") else None,
+        "batch": {key: batch.get(key) for key in ("processed", "duplicates", "failed")},
+    }
+
+
+def run_size(count, files, criteria, seed=0):
+    user, load_s = create_account(f"bench-{count}", count, seed)
+    client = APIClient()
+    client.force_authenticate(user)
+    set_criteria(user, criteria["job_title"], criteria["skills"])
+    return {
+        "resumes": count,
+        "load_s": round(load_s, 3),
+        "reports_list": measure_reports_list(client),
+        "upload": measure_upload(client, files),
+    }
@@ -0,0 +1,78 @@
+"""
+Compare PDF text extraction backends on the sample resumes.
+
+    python -m benchmarks.pdf_backends [--folder DIR] [--repeat N] [--output FILE]
+
+Each backend is timed on its own and as the default fast-path chain. For
+every strategy the report gives wall time, characters extracted, pages
+per backend and how many files parse to the same details as pdfplumber.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from resumes.parsing import parse_resume_text
+from resumes.pdf_backends import DEFAULT_BACKENDS, extract_pdf_text, get_backend
+
+SAMPLES_DIR = Path(__file__).resolve().parents[3] / "Resumes_Folder"
+
+STRATEGIES = {
+    "pdfplumber": ("pdfplumber",),
+    "pypdf2": ("pypdf2",),
+    "default": DEFAULT_BACKENDS,
+}
+
+
+def _run(paths, backends, repeat):
+    best = None
+    for _ in range(repeat):
+        stats = {}
+        start = time.perf_counter()
+        texts = [extract_pdf_text(str(path), backends=backends, stats=stats) for path in paths]
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, texts, stats)
+    return best
+
+
+def run(folder=SAMPLES_DIR, repeat=3):
+    paths = sorted(Path(folder).glob("*.pdf"))
+    results = {"folder": str(folder), "files": len(paths), "repeat": repeat, "strategies": {}}
+    reference = None
+    for name, backends in STRATEGIES.items():
+        if not all(get_backend(backend) for backend in backends):
+            results["strategies"][name] = {"skipped": "backend not installed"}
+            continue
+        elapsed, texts, stats = _run(paths, backends, repeat)
+        details = [parse_resume_text(text) for text in texts]
+        if reference is None and name == "pdfplumber":
+            reference = details
+        results["strategies"][name] = {
+            "seconds": round(elapsed, 4),
+            "ms_per_file": round(elapsed / max(len(paths), 1) * 1000, 2),
+            "chars": sum(map(len, texts)),
+            "pages_by_backend": stats,
+            "same_details_as_pdfplumber": (
+                sum(a == b for a, b in zip(reference, details)) if reference is not None else None
+            ),
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--folder", default=SAMPLES_DIR, type=Path)
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+    report = json.dumps(run(args.folder, max(args.repeat, 1)), indent=2)
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
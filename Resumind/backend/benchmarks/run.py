@@ -0,0 +1,97 @@
+"""
+Benchmark suite for resume ingestion and scoring.
+
+    python -m benchmarks.run [--sizes 1000,10000,100000] [--output FILE]
+
+Runs against a fresh SQLite database (benchmarks.settings) and reports,
+as JSON:
+
+- pdf_backends: the PDF extraction backend comparison
+- stages: per-call timings of text extraction, contact, skill and
+  experience parsing on the sample and synthetic resumes, and of
+  compute_score
+- e2e: for each account size, reports_list latency (cold and warm) and
+  upload latency for the sample files
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, folder, seed=0, stage_texts=2000):
+    import django
+    django.setup()
+    from django.core.management import call_command
+    from resumes.models import Resume
+    from resumes.tasks import _reset_executor
+    from . import pdf_backends
+    from .e2e import run_size
+    from .stages import run_stages, sample_files
+    from .synthetic import synthetic_resumes
+
+    call_command("migrate", verbosity=0)
+    files = sample_files(folder)
+    criteria = {"job_title": "Software Engineer", "skills": ["Python", "SQL", "Machine Learning", "AWS", "Java"]}
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sizes": sizes,
+            "seed": seed,
+            "sample_files": len(files),
+        },
+        "pdf_backends": pdf_backends.run(folder, repeat=3)["strategies"],
+        "e2e": [],
+    }
+    try:
+        for count in sizes:
+            start = time.perf_counter()
+            results["e2e"].append(run_size(count, files, criteria, seed))
+            results["e2e"][-1]["seconds"] = round(time.perf_counter() - start, 3)
+        texts = [text for text, _ in synthetic_resumes(stage_texts, seed + 1)]
+        scored = list(Resume.objects.filter(status="processed").prefetch_related("skill_links")[:stage_texts])
+        results["stages"] = run_stages(files, texts, scored, criteria)
+    finally:
+        _reset_executor()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma separated account sizes")
+    parser.add_argument("--folder", type=Path, help="sample resumes (default: Resumes_Folder/)")
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--output", type=Path, help="write the JSON report here as well as to stdout")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    from .pdf_backends import SAMPLES_DIR
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    report = json.dumps(run(sizes, args.folder or SAMPLES_DIR, args.seed), indent=2)
+    if args.output:
+        args.output.write_text(report + "\n")
+    sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Settings for benchmark runs: the project settings on a throwaway SQLite
+database, with media, caches and upload spooling under BENCH_DIR.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from backend.settings import *  # noqa: F401,F403
+
+BENCH_DIR = Path(os.environ.get("BENCH_DIR") or tempfile.mkdtemp(prefix="resumind-bench-"))
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BENCH_DIR / "bench.sqlite3",
+    }
+}
+STATICFILES_DIRS = []
+MEDIA_ROOT = BENCH_DIR / "media"
+RESUME_PARSE_CACHE_DIR = BENCH_DIR / "cache" / "parsed"
+RESUME_EMBEDDING_DIR = BENCH_DIR / "cache" / "embeddings"
+RESUME_IMPORT_CHECKPOINT_DIR = BENCH_DIR / "cache" / "imports"
+FILE_UPLOAD_TEMP_DIR = str(BENCH_DIR / "cache" / "uploads")
+ALLOWED_HOSTS = ["testserver", "localhost"]
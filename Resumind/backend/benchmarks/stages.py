@@ -0,0 +1,62 @@
+"""
+Per-stage timings of the ingestion and scoring pipeline.
+"""
+import os
+import statistics
+import time
+
+from resumes.parsing import (
+    ALLOWED_EXTS,
+    _extract_contacts_and_links,
+    _extract_experience_years,
+    _extract_skills,
+    _extract_text_generic,
+)
+
+
+def time_calls(func, calls):
+    """
+    Call func(*args) for every args tuple in calls and summarise the
+    per-call wall times in microseconds.
+    """
+    durations = []
+    for args in calls:
+        start = time.perf_counter()
+        func(*args)
+        durations.append((time.perf_counter() - start) * 1e6)
+    if not durations:
+        return {"calls": 0}
+    durations.sort()
+    return {
+        "calls": len(durations),
+        "total_s": round(sum(durations) / 1e6, 4),
+        "mean_us": round(statistics.fmean(durations), 1),
+        "p50_us": round(durations[len(durations) // 2], 1),
+        "p95_us": round(durations[min(int(len(durations) * 0.95), len(durations) - 1)], 1),
+    }
+
+
+def sample_files(folder):
+    return sorted(
+        (str(path), ext)
+        for path, ext in ((os.path.join(folder, name), os.path.splitext(name)[1].lower()) for name in os.listdir(folder))
+        if ext in ALLOWED_EXTS
+    )
+
+
+def run_stages(files, texts, resumes, criteria):
+    """
+    files: (path, ext) samples to extract; texts: resume texts for the text
+    stages; resumes: Resume objects with skill_links prefetched, scored
+    against criteria.
+    """
+    from reports.utils import compute_score
+
+    single = [(text,) for text in texts]
+    return {
+        "_extract_text_generic": time_calls(_extract_text_generic, files),
+        "_extract_contacts_and_links": time_calls(_extract_contacts_and_links, single),
+        "_extract_skills": time_calls(_extract_skills, single),
+        "_extract_experience_years": time_calls(_extract_experience_years, single),
+        "compute_score": time_calls(compute_score, [(resume, criteria) for resume in resumes]),
+    }
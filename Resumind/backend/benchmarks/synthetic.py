@@ -0,0 +1,93 @@
+"""
+Deterministic synthetic resumes shaped like the samples in Resumes_Folder:
+contact header, skills, education, dated experience, projects and
+certifications. Each resume comes with the profile it was generated from,
+so large accounts can be loaded without parsing every text.
+"""
+import random
+from taxonomy.index import get_skill_index
+
+FIRST_NAMES = (
+    "Aarav", "Aisha", "Arjun", "Diya", "Emma", "Ishaan", "Kabir", "Karan", "Meera", "Neha",
+    "Nikhil", "Pooja", "Priya", "Rahul", "Riya", "Rohan", "Sara", "Sneha", "Varun", "Zoya",
+)
+LAST_NAMES = (
+    "Bose", "Chopra", "Das", "Gupta", "Iyer", "Jain", "Joshi", "Kapoor", "Khan", "Mehta",
+    "Menon", "Nair", "Patel", "Rao", "Reddy", "Sharma", "Singh", "Smith", "Verma", "Jones",
+)
+COMPANIES = ("Microsoft", "Infosys", "Swiggy", "Flipkart", "TCS", "Zoho", "Razorpay", "Wipro", "Adobe", "Atlassian")
+ROLES = ("Software Engineer", "Data Analyst", "Backend Developer", "ML Engineer", "DevOps Engineer", "Product Analyst")
+DEGREES = (
+    ("bachelor", "Bachelor of Technology in Computer Science"),
+    ("master", "Master of Science in Data Science"),
+    ("phd", "PhD in Computer Science"),
+    ("diploma", "Diploma in Information Technology"),
+)
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+CERTIFICATIONS = ("AWS", "Azure", "Kubernetes", "Data Analytics", "Scrum", "Google Cloud")
+
+
+def synthetic_resume(rng: random.Random, index: int):
+    """
+    (text, profile) for resume number index. profile holds the structured
+    values the text was built from, in parse_resume_text's keys.
+    """
+    skills = get_skill_index()
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    # The middle initial keeps names apart from the sample resumes
+    name = f"{first} {chr(ord('A') + index % 26)}. {last}"
+    handle = f"{first}{last}{index}".lower()
+    email = f"{handle}@example.com"
+    phone = f"+91 9{rng.randrange(10**8, 10**9)}"
+    skill_ids = sorted(rng.sample([s.id for s in skills], rng.randint(3, 12)))
+    skill_names = skills.names(skill_ids)
+    education, degree = rng.choice(DEGREES)
+
+    lines = [
+        name,
+        f"{email} | {phone}",
+        f"linkedin.com/in/{handle} | github.com/{handle}",
+        "SKILLS",
+        *(f"- {skill}" for skill in skill_names),
+        "EDUCATION",
+        f"{degree} | State University (2012-2016)",
+        "EXPERIENCE",
+    ]
+    months = 0
+    year = 2016
+    for _ in range(rng.randint(1, 4)):
+        start_month, length = rng.randrange(12), rng.randint(6, 36)
+        end_year, end_month = year + (start_month + length) // 12, (start_month + length) % 12
+        lines.append(
+            f"{rng.choice(ROLES)} | {rng.choice(COMPANIES)} "
+            f"({MONTHS[start_month]} {year} - {MONTHS[end_month]} {end_year})"
+        )
+        lines.append("- Delivered features used by thousands of customers.")
+        months += (end_year - year) * 12 + (end_month - start_month)
+        year = end_year + 1
+    projects = rng.randint(0, 4)
+    lines.append("PROJECTS")
+    lines.extend(f"Project {n + 1}: internal tooling and automation." for n in range(projects))
+    certifications = rng.sample(CERTIFICATIONS, rng.randint(0, 2))
+    lines.extend(f"Certified in {cert}" for cert in certifications)
+
+    profile = {
+        "name": name,
+        "email": email,
+        "phone": phone,
+        "linkedin": f"https://linkedin.com/in/{handle}",
+        "github": f"https://github.com/{handle}",
+        "skill_ids": skill_ids,
+        "skills": skill_names,
+        "education": education,
+        "experience_years": round(months / 12, 1),
+        "certifications": certifications,
+        "projects_count": projects,
+    }
+    return "\n".join(lines), profile
+
+
+def synthetic_resumes(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    for index in range(count):
+        yield synthetic_resume(rng, index)
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def delete_unowned_selections(apps, schema_editor):
+    # Selections were never persisted before criteria became per user
+    apps.get_model('jobs', 'JobSelection').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_unowned_selections, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='jobselection',
+            name='owner',
+            field=models.OneToOneField(default=None, on_delete=django.db.models.deletion.CASCADE, related_name='job_selection', to=settings.AUTH_USER_MODEL),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='jobselection',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='jobselection',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
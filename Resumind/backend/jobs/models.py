@@ -1,9 +1,17 @@
 from django.db import models
+from django.conf import settings
 
 class JobSelection(models.Model):
+    owner = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="job_selection"
+    )
     job_title = models.CharField(max_length=255)
     skills = models.JSONField(default=list, blank=True)  # ✅ works with MySQL
+    version = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.job_title} ({len(self.skills)} skills)"
@@ -1,5 +1,45 @@
+from django.db import IntegrityError
+from django.db.models import F
+from .models import JobSelection
 
-JOB_STORAGE = {
-    "job_title": "",
-    "skills": []
-}
+EMPTY_CRITERIA = {"job_title": "", "skills": []}
+
+# Per-process cache of each user's criteria: user id -> (version, criteria)
+_criteria_cache = {}
+
+
+def get_criteria(user):
+    """
+    The user's current job criteria. Only the version stamp is read on each
+    call; the row itself is fetched again when another process (or worker)
+    has saved newer criteria.
+    """
+    user_id = getattr(user, "pk", user)
+    version = JobSelection.objects.filter(owner_id=user_id).values_list("version", flat=True).first()
+    if version is None:
+        return EMPTY_CRITERIA
+    cached = _criteria_cache.get(user_id)
+    if cached and cached[0] == version:
+        return cached[1]
+    row = JobSelection.objects.filter(owner_id=user_id).values("version", "job_title", "skills").first()
+    if row is None:
+        return EMPTY_CRITERIA
+    criteria = {"job_title": row["job_title"], "skills": list(row["skills"] or [])}
+    _criteria_cache[user_id] = (row["version"], criteria)
+    return criteria
+
+
+def set_criteria(user, job_title, skills):
+    """
+    Persist the user's criteria and bump the version so every process drops
+    its cached copy.
+    """
+    user_id = getattr(user, "pk", user)
+    values = {"job_title": job_title, "skills": list(skills)}
+    if not JobSelection.objects.filter(owner_id=user_id).update(version=F("version") + 1, **values):
+        try:
+            JobSelection.objects.create(owner_id=user_id, **values)
+        except IntegrityError:
+            JobSelection.objects.filter(owner_id=user_id).update(version=F("version") + 1, **values)
+    _criteria_cache.pop(user_id, None)
+    return values
@@ -1,3 +1,48 @@
-from django.test import TestCase  # noqa: F401
+from unittest import mock
+from django.test import TestCase
+from rest_framework.test import APIClient
+from accounts.models import User
+from .models import JobSelection
+from .storage import EMPTY_CRITERIA, get_criteria, set_criteria
 
-# Create your tests here.
+
+class CriteriaStorageTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+
+    def test_criteria_are_stored_per_user_and_versioned(self):
+        self.assertEqual(get_criteria(self.user), EMPTY_CRITERIA)
+        set_criteria(self.user, "Backend developer", ["Python"])
+        set_criteria(self.user.pk, "Data engineer", ["SQL", "Spark"])
+        self.assertEqual(get_criteria(self.user), {"job_title": "Data engineer", "skills": ["SQL", "Spark"]})
+        self.assertEqual(JobSelection.objects.get(owner=self.user).version, 2)
+        other = User.objects.create_user("bob", "bob@example.com")
+        self.assertEqual(get_criteria(other), EMPTY_CRITERIA)
+
+    def test_cached_criteria_follow_saves_from_other_processes(self):
+        set_criteria(self.user, "Backend developer", ["Python"])
+        self.assertEqual(get_criteria(self.user)["skills"], ["Python"])
+        # Another process bumps the version without touching this cache
+        JobSelection.objects.filter(owner=self.user).update(skills=["Go"], version=5)
+        self.assertEqual(get_criteria(self.user)["skills"], ["Go"])
+
+
+class JobsViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_post_saves_criteria_and_schedules_one_rescore(self):
+        with mock.patch("jobs.views.schedule_rescore") as schedule:
+            response = self.client.post("/api/jobs/", {"job": "Backend developer", "skills": ["Python"]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        schedule.assert_called_once_with(self.user)
+        self.assertEqual(get_criteria(self.user), {"job_title": "Backend developer", "skills": ["Python"]})
+
+    def test_post_validates_input(self):
+        with mock.patch("jobs.views.schedule_rescore") as schedule:
+            self.assertEqual(self.client.post("/api/jobs/", {"skills": []}, format="json").status_code, 400)
+            response = self.client.post("/api/jobs/", {"job": "x", "skills": "Python"}, format="json")
+            self.assertEqual(response.status_code, 400)
+        schedule.assert_not_called()
@@ -1,3 +1,5 @@
+from taxonomy.index import get_skill_index
+
 jobs_skills = {
     "Software Engineer": ["Python", "Java", "Git", "Problem Solving", "C++"],
     "Data Analyst": ["Python", "SQL", "Excel", "Communication", "Tableau"],
@@ -24,5 +26,19 @@ jobs_skills = {
     "Administrative Assistant": ["Organization", "Communication", "Scheduling", "Documentation", "Time Management", "Office Management", "Meeting Coordination", "Data Entry"]
 }
 
+
+def _resolve_job_skills():
+    index = get_skill_index()
+    resolved = {}
+    for job, skills in jobs_skills.items():
+        unknown = [skill for skill in skills if index.id_for(skill) is None]
+        if unknown:
+            raise ValueError(f"Skills {unknown} of job {job!r} are missing from the taxonomy")
+        resolved[job] = index.ids_for(skills)
+    return resolved
+
+# Job definitions as taxonomy skill IDs; every skill must be known so it can match
+job_skill_ids = _resolve_job_skills()
+
 def get_skills_for_job(job_title):
-    return jobs_skills.get(job_title, [])
+    return get_skill_index().names(job_skill_ids.get(job_title, ()))
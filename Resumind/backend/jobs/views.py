@@ -1,8 +1,8 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from .storage import JOB_STORAGE
-from .utils import jobs_skills
-from reports.views import recompute_all_reports
+from .storage import set_criteria
+from .utils import jobs_skills, get_skills_for_job
+from reports.tasks import schedule_rescore
 
 # GET/POST: jobs list and save frontend skills
 @api_view(["GET", "POST"])
@@ -17,28 +17,22 @@ def jobs(request):
 
         if not job:
             return Response({"error": "Job title required"}, status=400)
+        if not isinstance(skills, list):
+            return Response({"error": "Skills must be a list"}, status=400)
 
-        # Save frontend-selected skills
-        JOB_STORAGE["job_title"] = job
-        JOB_STORAGE["skills"] = skills
+        # Apply frontend-selected skills for this user; rapid changes
+        # collapse into one background rescore of the latest criteria
+        set_criteria(request.user, job, skills)
+        schedule_rescore(request.user)
 
-        recompute_all_reports()
+        return Response({"job_title": job, "skills": skills, "rescore": "scheduled"}, status=200)
 
-        return Response({"job_title": job, "skills": skills}, status=200)
-
-# GET: fetch default skills for a job
+# GET: fetch default skills for a job (read-only; POST /api/jobs/ applies them)
 @api_view(["GET"])
 def get_skills(request):
     job = request.GET.get("job")
     if not job:
         return Response({"error": "Job title required"}, status=400)
 
-    skills = jobs_skills.get(job, [])
-
-    # Do not overwrite if frontend sends POST later
-    JOB_STORAGE["job_title"] = job
-    JOB_STORAGE["skills"] = skills
-
-    recompute_all_reports()
-
+    skills = get_skills_for_job(job)
     return Response({"job": job, "skills": skills})
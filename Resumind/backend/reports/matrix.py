@@ -0,0 +1,147 @@
+import numpy as np
+from taxonomy.index import get_skill_index
+
+EDUCATION_SCORES = {"phd": 100, "master": 80, "bachelor": 60, "diploma": 40}
+
+# Set bits per byte value, used to popcount packed skill rows
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def education_score(education):
+    education_text = (education or "").lower()
+    for key, val in EDUCATION_SCORES.items():
+        if key in education_text:
+            return val
+    return 0
+
+
+def certification_count(certifications):
+    return len([c for c in (certifications or []) if c.strip()])
+
+
+class ResumeMatrix:
+    """
+    Column-oriented features of a set of resumes: one packed bit row of
+    taxonomy skills per resume plus numeric experience, education,
+    certification and project arrays. Scoring every resume against a job
+    is a handful of array operations instead of a Python loop.
+    """
+
+    FIELDS = ("id", "experience_years", "education", "certifications", "projects", "uploaded_at")
+
+    def __init__(self, ids, skill_bits, experience, education, certifications, projects, education_labels, uploaded):
+        self.ids = ids
+        self.skill_bits = skill_bits
+        self.experience = experience
+        self.education = education
+        self.certifications = certifications
+        self.projects = projects
+        self.education_labels = education_labels
+        # Upload times in microseconds since the epoch, for tie-breaking
+        self.uploaded = uploaded
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, rows, skill_links):
+        """
+        Build from (id, experience_years, education, certifications, projects,
+        uploaded_at) tuples, e.g. Resume.objects.values_list(*ResumeMatrix.FIELDS), and the
+        (resume_id, skill_id) pairs of ResumeSkill for those resumes.
+        """
+        index = get_skill_index()
+        rows = list(rows)
+        n = len(rows)
+        bits = np.zeros((n, index.max_id + 1), dtype=bool)
+        ids = np.empty(n, dtype=np.int64)
+        experience = np.empty(n, dtype=np.float64)
+        education = np.empty(n, dtype=np.float64)
+        certifications = np.empty(n, dtype=np.float64)
+        projects = np.empty(n, dtype=np.float64)
+        education_labels = np.empty(n, dtype=object)
+        uploaded = np.empty(n, dtype=np.int64)
+        for row, (pk, years, edu, certs, proj, uploaded_at) in enumerate(rows):
+            ids[row] = pk
+            experience[row] = years or 0
+            education[row] = education_score(edu)
+            certifications[row] = certification_count(certs)
+            projects[row] = proj or 0
+            education_labels[row] = edu
+            uploaded[row] = int(uploaded_at.timestamp() * 1_000_000) if uploaded_at else 0
+
+        links = np.array(list(skill_links), dtype=np.int64).reshape(-1, 2)
+        if n and len(links):
+            order = np.argsort(ids)
+            pos = order[np.minimum(np.searchsorted(ids, links[:, 0], sorter=order), n - 1)]
+            keep = (ids[pos] == links[:, 0]) & (links[:, 1] <= index.max_id)
+            bits[pos[keep], links[keep, 1]] = True
+        return cls(
+            ids, np.packbits(bits, axis=1), experience, education, certifications, projects, education_labels, uploaded
+        )
+
+    def take(self, resume_ids):
+        """
+        Sub-matrix of the given resume ids that are present, in matrix order.
+        """
+        keep = np.isin(self.ids, np.fromiter(resume_ids, dtype=np.int64))
+        return ResumeMatrix(
+            self.ids[keep],
+            self.skill_bits[keep],
+            self.experience[keep],
+            self.education[keep],
+            self.certifications[keep],
+            self.projects[keep],
+            self.education_labels[keep],
+            self.uploaded[keep],
+        )
+
+    def _required_mask(self, required_ids):
+        mask = np.zeros(self.skill_bits.shape[1] * 8, dtype=bool)
+        mask[list(required_ids)] = True
+        return np.packbits(mask)
+
+    def required_hits(self, required_ids):
+        """
+        Boolean (resumes x len(required_ids)) matrix of which required skills
+        each resume has, in required_ids order.
+        """
+        required_ids = np.asarray(required_ids, dtype=np.int64)
+        columns = self.skill_bits[:, required_ids >> 3]
+        return ((columns >> (7 - (required_ids & 7)).astype(np.uint8)) & 1).astype(bool)
+
+    def score(self, required_ids, unknown_count, weights):
+        """
+        Integer scores for every resume, identical to compute_score.
+        """
+        required_count = len(required_ids) + unknown_count
+        score = np.zeros(len(self), dtype=np.float64)
+        if required_count and len(required_ids):
+            matched = _POPCOUNT[self.skill_bits & self._required_mask(required_ids)].sum(axis=1, dtype=np.int64)
+            score += matched / required_count * 100 * weights["skills"]
+        score += np.minimum(self.experience, 10) / 10 * 100 * weights["experience"]
+        score += self.education * weights["education"]
+        score += np.minimum(self.certifications, 5) / 5 * 100 * weights["certifications"]
+        score += np.minimum(self.projects, 10) / 10 * 100 * weights["projects"]
+        return score.astype(np.int64)
+
+    def has_skills(self, skill_ids):
+        """
+        Boolean mask of the resumes that have every one of skill_ids.
+        """
+        if not len(skill_ids):
+            return np.ones(len(self), dtype=bool)
+        return self.required_hits(skill_ids).all(axis=1)
+
+    def top(self, scores, k, mask=None):
+        """
+        Row numbers of the k best scores, ties broken by newer upload and
+        then higher id, best first. A partial sort finds the k-th best
+        score; only rows at or above it are fully ordered.
+        """
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if len(rows) > k:
+            kth = np.partition(scores[rows], len(rows) - k)[len(rows) - k]
+            rows = rows[scores[rows] >= kth]
+        order = np.lexsort((-self.ids[rows], -self.uploaded[rows], -scores[rows]))
+        return rows[order[:k]]
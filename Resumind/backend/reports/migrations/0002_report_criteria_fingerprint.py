@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='criteria_fingerprint',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=40),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:50
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def drop_duplicate_reports(apps, schema_editor):
+    Report = apps.get_model('reports', 'Report')
+    duplicates = (
+        Report.objects.values('resume_id', 'criteria_fingerprint')
+        .annotate(rows=Count('id'), keep=Max('id'))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates.iterator():
+        Report.objects.filter(
+            resume_id=group['resume_id'], criteria_fingerprint=group['criteria_fingerprint']
+        ).exclude(id=group['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_report_criteria_fingerprint'),
+        ('resumes', '0009_backfill_resume_identity_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_reports, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='report',
+            constraint=models.UniqueConstraint(fields=('resume', 'criteria_fingerprint'), name='report_resume_criteria_uniq'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_resume_columns(apps, schema_editor):
+    Report = apps.get_model('reports', 'Report')
+    Resume = apps.get_model('resumes', 'Resume')
+    resume = Resume.objects.filter(pk=OuterRef('resume_id'))
+    # The analysis-derived columns are filled in by rescoring, which the
+    # cleared fingerprint triggers on the next listing
+    Report.objects.update(
+        owner_id=Subquery(resume.values('owner_id')[:1]),
+        uploaded_at=Subquery(resume.values('uploaded_at')[:1]),
+        criteria_fingerprint='',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0003_report_resume_criteria_uniq'),
+        ('resumes', '0009_backfill_resume_identity_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='education_score',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='matched_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='matched_skill_ids',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='owner',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reports', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='uploaded_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(copy_resume_columns, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='report',
+            name='owner',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='uploaded_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['owner', 'criteria_fingerprint', '-score', '-uploaded_at', '-id'], name='report_owner_rank_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.conf import settings
 from resumes.models import Resume
 
 class Report(models.Model):
@@ -6,6 +7,30 @@ class Report(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     score = models.FloatField(null=True, blank=True)
     details = models.JSONField(default=dict, blank=True)
+    criteria_fingerprint = models.CharField(max_length=40, blank=True, default="", db_index=True)
+    # Copied from the resume and the analysis so listing, filtering and
+    # ordering run on one indexed table
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="reports"
+    )
+    uploaded_at = models.DateTimeField()
+    education_score = models.PositiveSmallIntegerField(default=0)
+    matched_count = models.PositiveSmallIntegerField(default=0)
+    # Matched taxonomy IDs as ",3,17,", so one skill is a contains lookup
+    matched_skill_ids = models.TextField(blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resume", "criteria_fingerprint"], name="report_resume_criteria_uniq"),
+        ]
+        indexes = [
+            models.Index(
+                fields=["owner", "criteria_fingerprint", "-score", "-uploaded_at", "-id"],
+                name="report_owner_rank_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Report {self.id} for Resume {self.resume.id}"
@@ -0,0 +1,63 @@
+import logging
+import threading
+from django.conf import settings
+from django.db import connection
+from .utils import refresh_stale_reports
+
+logger = logging.getLogger(__name__)
+
+
+class RescoreScheduler:
+    """
+    Debounced, coalesced background rescoring per owner. Every schedule()
+    call restarts the owner's timer, so a burst of criteria changes results
+    in one rescore once things are quiet. A request arriving while that
+    owner's rescore runs is folded into a single follow-up run. Each run
+    reads the owner's latest criteria.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._timers = {}
+        self._running = set()
+        self._dirty = set()
+
+    def schedule(self, owner_id):
+        with self._lock:
+            timer = self._timers.get(owner_id)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.delay, self._fire, args=(owner_id,))
+            timer.daemon = True
+            self._timers[owner_id] = timer
+            timer.start()
+
+    def _fire(self, owner_id):
+        with self._lock:
+            if self._timers.get(owner_id) is threading.current_thread():
+                del self._timers[owner_id]
+            if owner_id in self._running:
+                self._dirty.add(owner_id)
+                return
+            self._running.add(owner_id)
+        try:
+            while True:
+                try:
+                    refresh_stale_reports(owner_id)
+                except Exception:
+                    logger.exception("Background rescore failed for owner %s", owner_id)
+                with self._lock:
+                    if owner_id not in self._dirty:
+                        self._running.discard(owner_id)
+                        break
+                    self._dirty.discard(owner_id)
+        finally:
+            connection.close()
+
+
+rescore_scheduler = RescoreScheduler(settings.RESCORE_DEBOUNCE_SECONDS)
+
+
+def schedule_rescore(owner):
+    rescore_scheduler.schedule(getattr(owner, "pk", owner))
@@ -1,3 +1,209 @@
-from django.test import TestCase  # noqa: F401
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from jobs.storage import set_criteria
+from resumes.models import Resume, ResumeSkill
+from resumes.parsing import parse_resume_text
+from resumes.tasks import _store_result
+from taxonomy.index import get_skill_index
+from . import utils
+from .models import Report
+from .utils import (
+    WEIGHTS, compute_score, criteria_fingerprint, get_resume_matrix, refresh_stale_reports, required_skills,
+    save_reports,
+)
 
-# Create your tests here.
+CRITERIA = {"skills": ["Python", "Django", "SQL", "Klingon"]}
+
+
+class ReportTestCase(TestCase):
+    # (skills, experience years, education, certifications, projects)
+    RESUMES = [
+        (["Python", "Django", "SQL"], 12, "PhD in Physics", ["AWS", "GCP"], 3),
+        (["Python"], 2.5, "Bachelor of Science", [], 0),
+        (["Django", "SQL", "React"], 6, "Master of Arts", ["PMP", " ", "CKA"], 12),
+        ([], 0, "", [], 0),
+        (["Python", "SQL"], 2.5, "Bachelor of Science", [], 0),
+        (["Python", "SQL"], 2.5, "Bachelor of Science", [], 0),
+    ]
+
+    def setUp(self):
+        utils._matrix_cache.clear()
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        index = get_skill_index()
+        now = timezone.now()
+        self.resumes = []
+        for position, (skills, years, education, certifications, projects) in enumerate(self.RESUMES):
+            resume = Resume.objects.create(
+                owner=self.user,
+                file=f"resumes/r{position}.txt",
+                status="processed",
+                content_hash=f"hash{position}",
+                skills=", ".join(skills),
+                experience_years=years,
+                education=education,
+                certifications=certifications,
+                projects=projects,
+            )
+            ResumeSkill.objects.bulk_create(
+                [ResumeSkill(resume=resume, skill_id=skill_id) for skill_id in index.ids_for(skills)]
+            )
+            # The last two tie on score and upload time, so the id decides
+            uploaded_at = now - timedelta(minutes=min(position, 4))
+            Resume.objects.filter(pk=resume.pk).update(uploaded_at=uploaded_at)
+            resume.uploaded_at = uploaded_at
+            self.resumes.append(resume)
+
+
+class ResumeMatrixTests(ReportTestCase):
+    def test_score_matches_compute_score(self):
+        matrix = get_resume_matrix(self.user)
+        required_ids, unknown = required_skills(CRITERIA)
+        scores = dict(zip(matrix.ids.tolist(), matrix.score(required_ids, len(unknown), WEIGHTS).tolist()))
+        for resume in Resume.objects.filter(owner=self.user).prefetch_related("skill_links"):
+            self.assertEqual(scores[resume.pk], compute_score(resume, CRITERIA)[0], resume.file.name)
+
+    def test_top_orders_by_score_then_newest(self):
+        matrix = get_resume_matrix(self.user)
+        required_ids, unknown = required_skills(CRITERIA)
+        scores = matrix.score(required_ids, len(unknown), WEIGHTS)
+        resumes = Resume.objects.filter(owner=self.user).prefetch_related("skill_links")
+        expected = sorted(
+            resumes, key=lambda r: (compute_score(r, CRITERIA)[0], r.uploaded_at, r.pk), reverse=True
+        )
+        for k in (1, 3, len(expected), len(expected) + 2):
+            self.assertEqual(
+                matrix.ids[matrix.top(scores, k)].tolist(), [r.pk for r in expected[:k]], f"k={k}"
+            )
+
+    def test_top_with_must_have_mask(self):
+        matrix = get_resume_matrix(self.user)
+        required_ids, unknown = required_skills(CRITERIA)
+        scores = matrix.score(required_ids, len(unknown), WEIGHTS)
+        django_id = get_skill_index().id_for("Django")
+        rows = matrix.top(scores, 10, matrix.has_skills([django_id]))
+        self.assertEqual(sorted(matrix.ids[rows].tolist()), sorted([self.resumes[0].pk, self.resumes[2].pk]))
+
+
+    @mock.patch("resumes.tasks.embed_or_log")
+    def test_reparse_in_place_rebuilds_the_cached_matrix(self, _embed):
+        matrix = get_resume_matrix(self.user)
+        self.assertIs(get_resume_matrix(self.user), matrix)
+        resume = self.resumes[3]
+        text = "Zed Example\nSKILLS\nPython, Django, SQL\n"
+        _store_result(resume, text, parse_resume_text(text))
+        rebuilt = get_resume_matrix(self.user)
+        self.assertIsNot(rebuilt, matrix)
+        required_ids, unknown = required_skills(CRITERIA)
+        scores = dict(zip(rebuilt.ids.tolist(), rebuilt.score(required_ids, len(unknown), WEIGHTS).tolist()))
+        resume = Resume.objects.prefetch_related("skill_links").get(pk=resume.pk)
+        self.assertEqual(scores[resume.pk], compute_score(resume, CRITERIA)[0])
+        self.assertGreater(scores[resume.pk], 0)
+
+class SaveReportsTests(ReportTestCase):
+    def test_upsert_keeps_one_row_per_resume_and_criteria(self):
+        fingerprint = criteria_fingerprint(CRITERIA)
+        self.assertEqual(refresh_stale_reports(self.user, CRITERIA), len(self.resumes))
+        resume = self.resumes[0]
+        report = Report.objects.get(resume=resume)
+        analysis = {"education_score": 0, "required_skills_matched": ["Python"]}
+        save_reports([(resume.pk, self.user.pk, resume.uploaded_at, 7, analysis)], fingerprint)
+        updated = Report.objects.get(resume=resume)
+        self.assertEqual((updated.pk, updated.score, updated.matched_count), (report.pk, 7, 1))
+        self.assertEqual(Report.objects.count(), len(self.resumes))
+        self.assertEqual(refresh_stale_reports(self.user, CRITERIA), 0)
+
+    def test_new_criteria_replace_old_reports(self):
+        refresh_stale_reports(self.user, CRITERIA)
+        other = {"skills": ["React"]}
+        self.assertEqual(refresh_stale_reports(self.user, other), len(self.resumes))
+        self.assertEqual(
+            set(Report.objects.values_list("criteria_fingerprint", flat=True)), {criteria_fingerprint(other)}
+        )
+        self.assertEqual(Report.objects.count(), len(self.resumes))
+
+
+class ReportsListTests(ReportTestCase):
+    def setUp(self):
+        super().setUp()
+        set_criteria(self.user, "Backend developer", CRITERIA["skills"])
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        resumes = Resume.objects.filter(owner=self.user).prefetch_related("skill_links")
+        self.expected = [
+            r.pk for r in sorted(resumes, key=lambda r: (compute_score(r, CRITERIA)[0], r.uploaded_at, r.pk), reverse=True)
+        ]
+
+    def test_stale_first_page_is_exact_and_rest_is_left_to_the_background(self):
+        with mock.patch("reports.views.schedule_rescore") as schedule:
+            response = self.client.get("/api/reports/", {"limit": 2})
+        schedule.assert_called_once_with(self.user)
+        self.assertTrue(response.data["stale"])
+        self.assertEqual([row["id"] for row in response.data["results"]], self.expected[:2])
+        self.assertLess(Report.objects.count(), len(self.resumes))
+
+    def test_cursor_pages_cover_every_report_once(self):
+        refresh_stale_reports(self.user)
+        seen, cursor = [], None
+        while True:
+            response = self.client.get("/api/reports/", {"limit": 2, **({"cursor": cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(response.data["stale"])
+            seen += [row["id"] for row in response.data["results"]]
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(sorted(seen), sorted(self.expected))
+        self.assertEqual(
+            seen, list(Report.objects.order_by("-score", "-uploaded_at", "-id").values_list("resume_id", flat=True))
+        )
+
+    def test_bad_cursor_is_rejected(self):
+        for cursor in ("not-base64!", "bm9wZQ==", "WzEsICJub3QgYSBkYXRlIiwgMl0="):
+            response = self.client.get("/api/reports/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 400, cursor)
+
+
+class ReportsTopTests(ReportTestCase):
+    def setUp(self):
+        super().setUp()
+        set_criteria(self.user, "Backend developer", CRITERIA["skills"])
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        resumes = Resume.objects.filter(owner=self.user).prefetch_related("skill_links")
+        self.expected = [
+            r.pk for r in sorted(resumes, key=lambda r: (compute_score(r, CRITERIA)[0], r.uploaded_at, r.pk), reverse=True)
+        ]
+
+    def top(self, **params):
+        response = self.client.get("/api/reports/top/", params)
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_k_is_clamped(self):
+        refresh_stale_reports(self.user)
+        # Stored reports break exact ties by report id
+        self.expected = list(
+            Report.objects.order_by("-score", "-uploaded_at", "-id").values_list("resume_id", flat=True)
+        )
+        self.assertEqual(self.top(k=0), self.expected[:1])
+        self.assertEqual(self.top(k=-5), self.expected[:1])
+        with mock.patch("reports.views.TOP_MAX_K", 3):
+            self.assertEqual(self.top(k=1000), self.expected[:3])
+        self.assertEqual(self.top(), self.expected)
+        self.assertEqual(self.client.get("/api/reports/top/", {"k": "many"}).status_code, 400)
+
+    def test_must_have_filter_on_stale_and_stored_reports(self):
+        with_django = [pk for pk in self.expected if pk in (self.resumes[0].pk, self.resumes[2].pk)]
+        self.assertEqual(self.top(k=10, must_have="django"), with_django)
+        refresh_stale_reports(self.user)
+        self.assertEqual(self.top(k=10, must_have="Django"), with_django)
+        self.assertEqual(self.top(k=10, must_have="Django, React"), [self.resumes[2].pk])
+
+    def test_unknown_must_have_skill_is_rejected(self):
+        response = self.client.get("/api/reports/top/", {"must_have": "Python,Klingon"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "Unknown skill: Klingon")
@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import reports_list, report_detail
+from .views import reports_list, reports_top, report_detail
 
 urlpatterns = [
     path("", reports_list, name="reports-list"),
+    path("top/", reports_top, name="reports-top"),
     path("<int:pk>/", report_detail, name="report-detail"),
 ]
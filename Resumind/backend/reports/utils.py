@@ -0,0 +1,279 @@
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from django.db import connection, transaction
+from django.db.models import Count, Exists, Max, OuterRef
+from accounts.models import PurgeRequest
+from resumes.models import Resume, ResumeSkill
+from jobs.storage import get_criteria
+from taxonomy.index import get_skill_index, normalize
+from .matrix import ResumeMatrix, certification_count, education_score
+from .models import Report
+
+# Bump when the scoring formula changes so every stored report becomes stale.
+SCORING_VERSION = 2
+
+# Reports written per bulk upsert / transaction
+REPORT_WRITE_CHUNK = 1000
+
+WEIGHTS = {
+    "skills": 0.5,
+    "experience": 0.2,
+    "education": 0.1,
+    "certifications": 0.1,
+    "projects": 0.1,
+}
+
+
+@lru_cache(maxsize=128)
+def _resolve_required(skills):
+    """
+    Split required skill names into taxonomy IDs and names the taxonomy does
+    not know (those can never be matched, but still count as missing).
+    """
+    index = get_skill_index()
+    ids = {}
+    unknown = {}
+    for skill in skills:
+        skill_id = index.id_for(skill)
+        if skill_id is not None:
+            ids.setdefault(skill_id, None)
+        elif normalize(skill):
+            unknown.setdefault(normalize(skill), None)
+    return tuple(ids), tuple(unknown)
+
+
+def required_skills(criteria):
+    return _resolve_required(tuple(criteria.get("skills", [])))
+
+
+def criteria_fingerprint(criteria):
+    """
+    Stable hash of everything a score depends on besides the resume itself.
+    """
+    required_ids, unknown = required_skills(criteria)
+    payload = {
+        "version": SCORING_VERSION,
+        "weights": WEIGHTS,
+        "skills": sorted(required_ids),
+        "unknown_skills": sorted(unknown),
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def compute_score(resume, criteria):
+    score = 0
+
+    index = get_skill_index()
+    resume_ids = {link.skill_id for link in resume.skill_links.all()}
+    required_ids, unknown = required_skills(criteria)
+    required_count = len(required_ids) + len(unknown)
+
+    matched = index.names(i for i in required_ids if i in resume_ids)
+    skill_score = (len(matched) / required_count * 100) if required_count else 0
+    score += skill_score * WEIGHTS["skills"]
+
+    experience = resume.experience_years or 0
+    exp_score = min(experience, 10) / 10 * 100
+    score += exp_score * WEIGHTS["experience"]
+
+    edu_score = education_score(resume.education)
+    score += edu_score * WEIGHTS["education"]
+
+    cert_count = certification_count(resume.certifications)
+    cert_score = min(cert_count, 5) / 5 * 100
+    score += cert_score * WEIGHTS["certifications"]
+
+    projects_count = resume.projects or 0
+    proj_score = min(projects_count, 10) / 10 * 100
+    score += proj_score * WEIGHTS["projects"]
+
+    hits = [i in resume_ids for i in required_ids]
+    analysis = _analysis(required_ids, unknown, hits, experience, resume.education, edu_score, cert_count, projects_count)
+    return int(score), analysis
+
+
+def _analysis(required_ids, unknown, hits, experience, education, edu_score, cert_count, projects_count):
+    index = get_skill_index()
+    return {
+        "required_skills_matched": index.names(i for i, hit in zip(required_ids, hits) if hit),
+        "required_skills_missing": index.names(i for i, hit in zip(required_ids, hits) if not hit) + list(unknown),
+        "experience_years": experience,
+        "education": education,
+        "education_score": edu_score,
+        "certifications": cert_count,
+        "projects": projects_count,
+    }
+
+
+LISTING_FIELDS = ["owner", "uploaded_at", "education_score", "matched_count", "matched_skill_ids"]
+
+
+def matched_skill_token(skill_id):
+    return f",{skill_id},"
+
+
+def _report(resume_id, owner_id, uploaded_at, score, analysis, fingerprint):
+    matched_ids = get_skill_index().ids_for(analysis["required_skills_matched"])
+    return Report(
+        resume_id=resume_id,
+        owner_id=owner_id,
+        uploaded_at=uploaded_at,
+        score=score,
+        details=analysis,
+        criteria_fingerprint=fingerprint,
+        education_score=analysis["education_score"],
+        matched_count=len(matched_ids),
+        matched_skill_ids="," + ",".join(map(str, matched_ids)) + "," if matched_ids else "",
+    )
+
+
+def save_reports(rows, fingerprint):
+    """
+    Upsert (resume_id, owner_id, uploaded_at, score, analysis) rows under the
+    given fingerprint in chunks, one transaction and two round-trips per
+    chunk: a bulk upsert on the (resume, criteria_fingerprint) key and
+    removal of those resumes' reports for other criteria. Returns the number
+    of rows written.
+    """
+    upsert = {"update_conflicts": True, "update_fields": ["score", "details", *LISTING_FIELDS]}
+    if connection.features.supports_update_conflicts_with_target:
+        upsert["unique_fields"] = ["resume", "criteria_fingerprint"]
+    count = 0
+    rows = iter(rows)
+    while True:
+        chunk = [_report(*row, fingerprint) for row in islice(rows, REPORT_WRITE_CHUNK)]
+        if not chunk:
+            return count
+        with transaction.atomic():
+            Report.objects.bulk_create(chunk, **upsert)
+            Report.objects.filter(resume_id__in=[report.resume_id for report in chunk]).exclude(
+                criteria_fingerprint=fingerprint
+            ).delete()
+        count += len(chunk)
+
+
+def score_resumes(resumes, criteria):
+    """
+    Score the given resumes against the criteria and store the result,
+    stamped with the criteria fingerprint. Returns the number scored.
+    """
+    fingerprint = criteria_fingerprint(criteria)
+    rows = (
+        (resume.id, resume.owner_id, resume.uploaded_at, *compute_score(resume, criteria))
+        for resume in resumes
+    )
+    return save_reports(rows, fingerprint)
+
+
+# Per-process ResumeMatrix per owner: owner id -> (stamp, matrix), LRU order
+_matrix_cache = OrderedDict()
+MATRIX_CACHE_OWNERS = 32
+
+
+def get_resume_matrix(owner):
+    """
+    ResumeMatrix of the owner's parsed resumes, cached per process and
+    rebuilt when that set of resumes changes or one of them is re-parsed.
+    """
+    owner_id = getattr(owner, "pk", owner)
+    resumes = Resume.objects.owned_by(owner_id).filter(status="processed")
+    stamp = resumes.aggregate(count=Count("id"), last=Max("id"), parsed=Max("parsed_at"))
+    key = (stamp["count"], stamp["last"], stamp["parsed"])
+    cached = _matrix_cache.get(owner_id)
+    if cached and cached[0] == key:
+        _matrix_cache.move_to_end(owner_id)
+        return cached[1]
+    matrix = ResumeMatrix.from_rows(
+        resumes.values_list(*ResumeMatrix.FIELDS).iterator(),
+        ResumeSkill.objects.filter(resume__in=resumes).values_list("resume_id", "skill_id").iterator(),
+    )
+    _matrix_cache[owner_id] = (key, matrix)
+    while len(_matrix_cache) > MATRIX_CACHE_OWNERS:
+        _matrix_cache.popitem(last=False)
+    return matrix
+
+
+def stale_resumes(owner, criteria):
+    """
+    Parsed resumes of the owner without a report scored against criteria.
+    """
+    fingerprint = criteria_fingerprint(criteria)
+    return (
+        Resume.objects.owned_by(owner).filter(status="processed")
+        .exclude(reports__criteria_fingerprint=fingerprint)
+    )
+
+
+def refresh_stale_reports(owner, criteria=None):
+    """
+    Rescore only the owner's resumes whose stored report is missing or was
+    computed against different criteria, scoring them all at once on the
+    matrix.
+    """
+    criteria = get_criteria(owner) if criteria is None else criteria
+    fingerprint = criteria_fingerprint(criteria)
+    uploaded = dict(stale_resumes(owner, criteria).values_list("id", "uploaded_at"))
+    if not uploaded:
+        return 0
+    owner_id = getattr(owner, "pk", owner)
+    matrix = get_resume_matrix(owner).take(uploaded)
+    required_ids, unknown = required_skills(criteria)
+    scores = matrix.score(required_ids, len(unknown), WEIGHTS)
+    hits = matrix.required_hits(required_ids)
+    rows = (
+        (
+            resume_id,
+            owner_id,
+            uploaded[resume_id],
+            int(scores[row]),
+            _analysis(
+                required_ids,
+                unknown,
+                hits[row].tolist(),
+                matrix.experience[row].item(),
+                matrix.education_labels[row],
+                int(matrix.education[row]),
+                int(matrix.certifications[row]),
+                int(matrix.projects[row]),
+            ),
+        )
+        for row, resume_id in enumerate(matrix.ids.tolist())
+    )
+    return save_reports(rows, fingerprint)
+
+
+def top_report_ids(owner, k, must_have=(), criteria=None):
+    """
+    Ids of the owner's k best reports against criteria, best first and
+    newest upload first on ties, optionally only for resumes having every
+    skill id in must_have. When the stored reports are current, ORDER BY
+    ... LIMIT k runs on report_owner_rank_idx. While some are stale (just
+    after a criteria change) the resumes are ranked on the cached matrix
+    with a partial sort, and only the k winners are scored and stored; the
+    rest are left to the background rescore.
+    """
+    criteria = get_criteria(owner) if criteria is None else criteria
+    fingerprint = criteria_fingerprint(criteria)
+    reports = Report.objects.filter(
+        owner=owner, criteria_fingerprint=fingerprint, resume_id__gt=PurgeRequest.cutoff_for(owner)
+    )
+    if not stale_resumes(owner, criteria).exists():
+        for skill_id in must_have:
+            reports = reports.filter(
+                Exists(ResumeSkill.objects.filter(resume_id=OuterRef("resume_id"), skill_id=skill_id))
+            )
+        return list(reports.order_by("-score", "-uploaded_at", "-id").values_list("id", flat=True)[:k])
+
+    matrix = get_resume_matrix(owner)
+    required_ids, unknown = required_skills(criteria)
+    scores = matrix.score(required_ids, len(unknown), WEIGHTS)
+    resume_ids = matrix.ids[matrix.top(scores, k, matrix.has_skills(list(must_have)))].tolist()
+    stored = dict(reports.filter(resume_id__in=resume_ids).values_list("resume_id", "id"))
+    missing = [resume_id for resume_id in resume_ids if resume_id not in stored]
+    if missing:
+        score_resumes(Resume.objects.filter(id__in=missing).prefetch_related("skill_links"), criteria)
+        stored.update(reports.filter(resume_id__in=missing).values_list("resume_id", "id"))
+    return [stored[resume_id] for resume_id in resume_ids if resume_id in stored]
@@ -1,151 +1,189 @@
+import base64
 import json
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from resumes.models import Resume
 from .models import Report
-from jobs.storage import JOB_STORAGE
-
-WEIGHTS = {
-    "skills": 0.5,
-    "experience": 0.2,
-    "education": 0.1,
-    "certifications": 0.1,
-    "projects": 0.1,
-}
-
-
-def compute_score(resume):
-    score = 0
-    analysis = {}
-
-    skills_found = [s.strip().lower() for s in (resume.skills or "").split(",") if s.strip()]
-    required_skills = JOB_STORAGE.get("skills", [])
-    required_skills_lower = [s.lower() for s in required_skills]
-
-    matched = list(set(skills_found) & set(required_skills_lower))
-    missing = list(set(required_skills_lower) - set(skills_found))
-    skill_score = (len(matched) / len(required_skills_lower) * 100) if required_skills_lower else 0
-    score += skill_score * WEIGHTS["skills"]
-
-    summary = resume.summary or {}
-    if isinstance(summary, str):
-        try:
-            summary = json.loads(summary)
-        except Exception:
-            summary = {}
-
-    experience = summary.get("experience_years", 0)
-    exp_score = min(experience, 10) / 10 * 100
-    score += exp_score * WEIGHTS["experience"]
-
-    education_text = (resume.education or "").lower()
-    edu_map = {"phd": 100, "master": 80, "bachelor": 60, "diploma": 40}
-    edu_score = 0
-    for key, val in edu_map.items():
-        if key in education_text:
-            edu_score = val
-            break
-    score += edu_score * WEIGHTS["education"]
-
-    cert_count = resume.certifications or 0
-    cert_score = min(cert_count, 5) / 5 * 100
-    score += cert_score * WEIGHTS["certifications"]
-
-    projects_count = resume.projects or 0
-    proj_score = min(projects_count, 10) / 10 * 100
-    score += proj_score * WEIGHTS["projects"]
-
-    analysis.update({
-        "required_skills_matched": matched,
-        "required_skills_missing": missing,
-        "experience_years": experience,
-        "education": resume.education,
-        "education_score": edu_score,
-        "certifications": cert_count,
-        "projects": projects_count,
-    })
+from .matrix import EDUCATION_SCORES
+from accounts.models import PurgeRequest
+from jobs.storage import get_criteria
+from taxonomy.index import get_skill_index
+from .tasks import schedule_rescore
+from .utils import criteria_fingerprint, matched_skill_token, stale_resumes, top_report_ids
 
-    return int(score), analysis
+REPORTS_PAGE_SIZE = 50
+REPORTS_MAX_PAGE_SIZE = 200
+TOP_DEFAULT_K = 10
+TOP_MAX_K = 100
 
+# Resume columns a report row needs; parsed_text in particular stays unread
+REPORT_RESUME_FIELDS = ("resume__file", "resume__summary", "resume__status")
 
-def recompute_all_reports():
-    resumes = Resume.objects.all()
-    for resume in resumes:
-        score, analysis = compute_score(resume)
-        Report.objects.update_or_create(
-            resume=resume,
-            defaults={"score": score, "details": analysis}
-        )
 
+def _encode_cursor(report):
+    key = [report.score, report.uploaded_at.isoformat(), report.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
 
-@api_view(["GET"])
-def reports_list(request):
+
+def _decode_cursor(cursor):
+    try:
+        score, uploaded_at, pk = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        uploaded_at = parse_datetime(uploaded_at)
+        if uploaded_at is None:
+            raise ValueError
+        return float(score), uploaded_at, int(pk)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _after(cursor):
     """
-    Return all reports with resume details including absolute file_url.
+    Rows strictly after the cursor in (-score, -uploaded_at, -id) order.
     """
-    recompute_all_reports()
-    reports = Report.objects.select_related("resume").all()
-
-    reports_data = []
-    for report in reports:
-        resume = report.resume
-        summary = resume.summary or {}
-        if isinstance(summary, str):
-            try:
-                summary = json.loads(summary)
-            except Exception:
-                summary = {}
-
-        name = summary.get("name") or getattr(resume, "name", None) or resume.file.name
-
-        # Build absolute file_url using request context
-        file_url = None
-        if resume.file and hasattr(resume.file, "url"):
-            file_url = request.build_absolute_uri(resume.file.url)
-
-        reports_data.append({
-            "id": resume.id,
-            "name": name,
-            "file_url": file_url,
-            "date": resume.uploaded_at.strftime("%Y-%m-%d %H:%M"),
-            "score": report.score,
-            "status": resume.status.title() if resume.status else "Completed",
-            "analysis": report.details,
-        })
-
-    # Sort by score descending, then date
-    reports_data.sort(key=lambda r: (-r["score"], r["date"]))
-    return Response(reports_data)
+    score, uploaded_at, pk = _decode_cursor(cursor)
+    return (
+        Q(score__lt=score)
+        | Q(score=score, uploaded_at__lt=uploaded_at)
+        | Q(score=score, uploaded_at=uploaded_at, id__lt=pk)
+    )
 
 
-@api_view(["GET"])
-def report_detail(request, pk):
+def _skill_ids(value):
     """
-    Return single report details including absolute file_url.
+    Taxonomy ids of a comma separated list of skill names.
     """
-    try:
-        report = Report.objects.select_related("resume").get(pk=pk)
-    except Report.DoesNotExist:
-        return Response({"error": "Report not found"}, status=404)
+    index = get_skill_index()
+    ids = []
+    for skill in filter(None, (s.strip() for s in value.split(","))):
+        skill_id = index.id_for(skill)
+        if skill_id is None:
+            raise ValueError(f"Unknown skill: {skill}")
+        ids.append(skill_id)
+    return ids
+
 
+def _filters(params):
+    """
+    Q for the min_score, min_matched, min_experience (years), skills
+    (comma separated, all required) and education (minimum level) query
+    parameters.
+    """
+    query = Q()
+    try:
+        if params.get("min_score"):
+            query &= Q(score__gte=float(params["min_score"]))
+        if params.get("min_matched"):
+            query &= Q(matched_count__gte=int(params["min_matched"]))
+        if params.get("min_experience"):
+            query &= Q(resume__experience_years__gte=float(params["min_experience"]))
+    except ValueError:
+        raise ValueError("min_score, min_matched and min_experience must be numbers")
+    for skill_id in _skill_ids(params.get("skills", "")):
+        query &= Q(matched_skill_ids__contains=matched_skill_token(skill_id))
+    education = params.get("education", "").strip().lower()
+    if education:
+        if education not in EDUCATION_SCORES:
+            raise ValueError(f"education must be one of: {', '.join(EDUCATION_SCORES)}")
+        query &= Q(education_score__gte=EDUCATION_SCORES[education])
+    return query
+
+
+def _report_data(request, report):
     resume = report.resume
-    summary = resume.summary or {}
-    if isinstance(summary, str):
-        try:
-            summary = json.loads(summary)
-        except Exception:
-            summary = {}
+    name = (resume.summary or {}).get("name") or getattr(resume, "name", None) or resume.file.name
 
-    name = summary.get("name") or getattr(resume, "name", None) or resume.file.name
-    file_url = request.build_absolute_uri(resume.file.url) if resume.file else None
+    # Build absolute file_url using request context
+    file_url = None
+    if resume.file and hasattr(resume.file, "url"):
+        file_url = request.build_absolute_uri(resume.file.url)
 
-    data = {
+    return {
         "id": resume.id,
         "name": name,
         "file_url": file_url,
-        "date": resume.uploaded_at.strftime("%Y-%m-%d %H:%M"),
+        "date": report.uploaded_at.strftime("%Y-%m-%d %H:%M"),
         "score": report.score,
         "status": resume.status.title() if resume.status else "Completed",
         "analysis": report.details,
     }
-    return Response(data)
+
+
+@api_view(["GET"])
+def reports_list(request):
+    """
+    Return one page of the user's reports, best score first (newest upload
+    on ties), with resume details including absolute file_url. Paging is by
+    cursor: pass back next_cursor to get the following page. Stored reports
+    are served as they are; while some are missing or scored against older
+    criteria ("stale" in the response) the rest are rescored in the
+    background, and an unfiltered first page is made exact by scoring its
+    winners now.
+    """
+    try:
+        limit = min(max(int(request.query_params.get("limit", REPORTS_PAGE_SIZE)), 1), REPORTS_MAX_PAGE_SIZE)
+        query = _filters(request.query_params)
+        if request.query_params.get("cursor"):
+            query &= _after(request.query_params["cursor"])
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    criteria = get_criteria(request.user)
+    stale = stale_resumes(request.user, criteria).exists()
+    if stale:
+        schedule_rescore(request.user)
+        if not query:
+            top_report_ids(request.user, limit, criteria=criteria)
+    reports = list(
+        Report.objects.select_related("resume")
+        .only("score", "details", "uploaded_at", *REPORT_RESUME_FIELDS)
+        .filter(owner=request.user, criteria_fingerprint=criteria_fingerprint(criteria))
+        .filter(resume_id__gt=PurgeRequest.cutoff_for(request.user))
+        .filter(query)
+        .order_by("-score", "-uploaded_at", "-id")[:limit + 1]
+    )
+
+    next_cursor = _encode_cursor(reports[limit - 1]) if len(reports) > limit else None
+    return Response({
+        "results": [_report_data(request, report) for report in reports[:limit]],
+        "next_cursor": next_cursor,
+        "stale": stale,
+    })
+
+
+@api_view(["GET"])
+def reports_top(request):
+    """
+    The user's k best reports (k defaults to 10, at most 100), best score
+    first and newest upload on ties. must_have (comma separated skills)
+    keeps only resumes that have all of them, whether or not the job
+    criteria ask for them.
+    """
+    try:
+        k = min(max(int(request.query_params.get("k", TOP_DEFAULT_K)), 1), TOP_MAX_K)
+        must_have = _skill_ids(request.query_params.get("must_have", ""))
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    ids = top_report_ids(request.user, k, must_have)
+    reports = (
+        Report.objects.select_related("resume")
+        .only("score", "details", "uploaded_at", *REPORT_RESUME_FIELDS)
+        .in_bulk(ids)
+    )
+    return Response({"results": [_report_data(request, reports[pk]) for pk in ids if pk in reports]})
+
+
+@api_view(["GET"])
+def report_detail(request, pk):
+    """
+    Return single report details including absolute file_url.
+    """
+    try:
+        report = Report.objects.select_related("resume").get(
+            pk=pk, owner=request.user, resume_id__gt=PurgeRequest.cutoff_for(request.user)
+        )
+    except Report.DoesNotExist:
+        return Response({"error": "Report not found"}, status=404)
+
+    return Response(_report_data(request, report))
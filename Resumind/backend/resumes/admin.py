@@ -1,8 +1,12 @@
 from django.contrib import admin
-from .models import Resume
+from .models import Resume, UploadBatch
 
 @admin.register(Resume)
 class ResumeAdmin(admin.ModelAdmin):
     list_display = ("id", "owner", "uploaded_at", "status")
-    readonly_fields = ("parsed_text", "skills", "summary")
+    readonly_fields = ("parsed_text", "skills", "summary", "certifications", "experience_years")
     list_filter = ("status",)
+
+@admin.register(UploadBatch)
+class UploadBatchAdmin(admin.ModelAdmin):
+    list_display = ("id", "owner", "created_at", "total", "processed", "duplicates", "failed", "finished_at")
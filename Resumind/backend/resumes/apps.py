@@ -1,6 +1,13 @@
+import os
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ResumesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'resumes'
+
+    def ready(self):
+        # Django spools large uploads here but does not create the directory
+        if settings.FILE_UPLOAD_TEMP_DIR:
+            os.makedirs(settings.FILE_UPLOAD_TEMP_DIR, exist_ok=True)
@@ -0,0 +1,91 @@
+import os
+import json
+import threading
+import tempfile
+from pathlib import Path
+from django.conf import settings
+
+
+class ParseCache:
+    """
+    Content-addressed store of extraction/parse results, one JSON file per
+    SHA-256 digest. Reads refresh a file's mtime and eviction removes the
+    oldest files first, which makes the directory an LRU bounded by max_bytes.
+    It lives outside MEDIA_ROOT so clearing media does not cold-start it.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._size = None
+        self._lock = threading.Lock()
+
+    def _path(self, digest):
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def get(self, digest):
+        path = self._path(digest)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return record
+
+    def put(self, digest, record):
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(record, ensure_ascii=False).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield stat.st_mtime, stat.st_size, path
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        # Trim to 90% so a full cache does not rescan on every write
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+_parse_cache = None
+
+
+def get_parse_cache():
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = ParseCache(settings.RESUME_PARSE_CACHE_DIR, settings.RESUME_PARSE_CACHE_MAX_BYTES)
+    return _parse_cache
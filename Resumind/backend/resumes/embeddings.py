@@ -0,0 +1,375 @@
+import os
+import re
+import json
+import zlib
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+from django.conf import settings
+from taxonomy.index import get_skill_index
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialised within a process
+    fcntl = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+# Characters of a resume that are embedded; models truncate long inputs anyway
+EMBED_TEXT_CHARS = 4000
+# Rows scored per matrix product when searching
+SEARCH_BLOCK_ROWS = 16384
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it of on or our the to was were with "
+    "we i my me you your this that these those will using used use".split()
+)
+
+
+class HashingEncoder:
+    """
+    Offline TF-IDF style encoder: words are hashed into a fixed number of
+    signed buckets with log term frequencies, and every taxonomy skill
+    mention adds a token for its skill ID, so aliases ("K8s", "Kubernetes")
+    land in the same bucket. Document vectors carry no IDF; it is applied to
+    the query from the bucket document frequencies of the index (lnc.ltc
+    weighting), so vectors never need re-encoding as the corpus grows.
+    """
+
+    uses_idf = True
+    skill_weight = 3.0
+
+    def __init__(self, dim=256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _tokens(self, text):
+        text = text or ""
+        counts = {}
+        for word in _TOKEN_RE.findall(text.lower()):
+            if word not in STOPWORDS:
+                counts[word] = counts.get(word, 0) + 1
+        for skill_id in get_skill_index().find_ids(text):
+            counts[f"skill:{skill_id}"] = counts.get(f"skill:{skill_id}", 0) + self.skill_weight
+        return counts
+
+    def encode(self, texts):
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token, count in self._tokens(text[:EMBED_TEXT_CHARS]).items():
+                h = zlib.crc32(token.encode("utf-8"))
+                vectors[row, h % self.dim] += (1.0 + np.log(count)) * (1.0 if h & 0x80000000 else -1.0)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+class SentenceTransformerEncoder:
+    """
+    A local sentence-transformers model run on the CPU. Vectors are
+    normalised, so a dot product is the cosine similarity.
+    """
+
+    uses_idf = False
+
+    def __init__(self, model_name):
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"st:{model_name}"
+
+    def encode(self, texts):
+        vectors = self.model.encode(
+            [(text or "")[:EMBED_TEXT_CHARS] for text in texts],
+            batch_size=32,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dim)
+
+
+@lru_cache(maxsize=None)
+def get_encoder():
+    """
+    The configured sentence-transformers model when it is set and can be
+    loaded, otherwise the hashing encoder.
+    """
+    model_name = settings.RESUME_EMBEDDING_MODEL
+    if model_name and SentenceTransformer is not None:
+        try:
+            return SentenceTransformerEncoder(model_name)
+        except Exception:
+            logger.exception("Could not load embedding model %s; using the hashing encoder", model_name)
+    return HashingEncoder()
+
+
+class EmbeddingIndex:
+    """
+    Append-only on-disk matrix of resume embeddings, memory-mapped for
+    search. vectors.bin holds one row per embedded resume and rows.bin the
+    matching (resume id, owner id) pairs; meta.json names the encoder and
+    dtype. Writers append under a file lock. Readers remap when rows.bin
+    has grown, so rows added by other processes show up without a restart.
+
+    A resume's current row is Resume.embedding_row; rows of deleted or
+    re-embedded resumes stay in the files until the index is rebuilt and
+    are skipped at search time.
+    """
+
+    def __init__(self, directory, encoder, dtype="float32"):
+        self.directory = Path(directory)
+        self.encoder = encoder
+        self.dim = encoder.dim
+        self.dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+        self._rows = 0
+        # (vectors, ids) memmaps, swapped as one so readers see a matching pair
+        self._maps = None
+        self._idf = None
+
+    def _path(self, name):
+        return self.directory / name
+
+    def _meta(self):
+        return {"encoder": self.encoder.name, "dim": self.dim, "dtype": self.dtype.name}
+
+    def _file_lock(self):
+        return _FileLock(self._path("lock"))
+
+    def open(self):
+        """
+        Create the files, or start over when they were written by another
+        encoder or dtype: every resume then has to be embedded again.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._file_lock():
+            try:
+                meta = json.loads(self._path("meta.json").read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                meta = None
+            if meta != self._meta():
+                self._reset_files()
+        self.refresh()
+        return self
+
+    def _reset_files(self):
+        from .models import Resume
+
+        for name in ("vectors.bin", "rows.bin"):
+            with open(self._path(name), "wb"):
+                pass
+        self._path("meta.json").write_text(json.dumps(self._meta()), encoding="utf-8")
+        Resume.objects.exclude(embedding_row=None).update(embedding_row=None)
+        self._rows, self._maps, self._idf = 0, None, None
+
+    def reset(self):
+        with self._lock, self._file_lock():
+            self._reset_files()
+
+    def _row_count(self):
+        try:
+            return os.path.getsize(self._path("rows.bin")) // 16
+        except OSError:
+            return 0
+
+    def refresh(self):
+        """
+        Map rows appended since the last call.
+        """
+        rows = self._row_count()
+        if rows == self._rows:
+            return
+        with self._lock:
+            if rows:
+                self._maps = (
+                    np.memmap(self._path("vectors.bin"), dtype=self.dtype, mode="r", shape=(rows, self.dim)),
+                    np.memmap(self._path("rows.bin"), dtype=np.int64, mode="r", shape=(rows, 2)),
+                )
+            else:
+                self._maps = None
+            self._rows, self._idf = rows, None
+
+    def __len__(self):
+        return self._rows
+
+    def append(self, resume_ids, owner_ids, vectors):
+        """
+        Store vectors for the given resumes and return their row numbers.
+        Vectors are written before their id rows, so a row that is visible
+        always has its vector.
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=self.dtype).reshape(-1, self.dim)
+        pairs = np.column_stack([np.asarray(resume_ids, dtype=np.int64), np.asarray(owner_ids, dtype=np.int64)])
+        with self._lock, self._file_lock():
+            start = self._row_count()
+            with open(self._path("vectors.bin"), "r+b") as f:
+                f.seek(start * self.dim * self.dtype.itemsize)
+                f.write(vectors.tobytes())
+            with open(self._path("rows.bin"), "r+b") as f:
+                f.seek(start * 16)
+                f.write(pairs.tobytes())
+        self.refresh()
+        return list(range(start, start + len(pairs)))
+
+    def _query_weights(self):
+        """
+        Per-bucket IDF over every stored row, for encoders whose document
+        vectors leave it out. Recomputed only when rows were added.
+        """
+        maps = self._maps
+        if not self.encoder.uses_idf or maps is None:
+            return None
+        if self._idf is None:
+            vectors = maps[0]
+            df = np.zeros(self.dim, dtype=np.int64)
+            for start in range(0, len(vectors), SEARCH_BLOCK_ROWS):
+                df += (vectors[start:start + SEARCH_BLOCK_ROWS] != 0).sum(axis=0)
+            self._idf = (np.log((1 + len(vectors)) / (1 + df)) + 1).astype(np.float32)
+        return self._idf
+
+    def encode_query(self, text):
+        query = self.encoder.encode([text])[0]
+        weights = self._query_weights()
+        if weights is not None:
+            query = query * weights
+            norm = np.linalg.norm(query)
+            query = query / norm if norm else query
+        return query
+
+    def search(self, owner_id, query, k):
+        """
+        (rows, similarities) of the owner's k nearest rows to an encoded
+        query, best first. Rows are scored in blocks of SEARCH_BLOCK_ROWS and
+        only the running top k is kept. When the owner holds most rows of
+        the range they span, whole slices are scored and other owners' rows
+        masked out, which beats gathering rows one by one.
+        """
+        self.refresh()
+        maps = self._maps
+        if maps is None or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        vectors, ids = maps
+        owned = ids[:, 1] == owner_id
+        candidates = np.flatnonzero(owned)
+        if not len(candidates):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        first, last = candidates[0], candidates[-1] + 1
+        dense = len(candidates) * 2 >= last - first
+        query = np.asarray(query, dtype=vectors.dtype)
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        blocks = range(first, last, SEARCH_BLOCK_ROWS) if dense else range(0, len(candidates), SEARCH_BLOCK_ROWS)
+        for start in blocks:
+            if dense:
+                rows = np.flatnonzero(owned[start:start + SEARCH_BLOCK_ROWS]) + start
+                scores = (vectors[start:start + SEARCH_BLOCK_ROWS] @ query)[rows - start]
+            else:
+                rows = candidates[start:start + SEARCH_BLOCK_ROWS]
+                scores = vectors[rows] @ query
+            scores = scores.astype(np.float32)
+            rows = np.concatenate([best_rows, rows])
+            scores = np.concatenate([best_scores, scores])
+            if len(scores) > k:
+                keep = np.argpartition(-scores, k - 1)[:k]
+                rows, scores = rows[keep], scores[keep]
+            best_rows, best_scores = rows, scores
+        order = np.argsort(-best_scores, kind="stable")
+        return best_rows[order], best_scores[order]
+
+    def resume_ids(self, rows):
+        return self._maps[1][np.asarray(rows, dtype=np.int64), 0] if len(rows) else np.empty(0, dtype=np.int64)
+
+
+class _FileLock:
+    """
+    Exclusive lock on a file, held across processes where fcntl exists.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_embedding_index():
+    """
+    The process-wide embedding index, opened (and memory-mapped) on first use.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = EmbeddingIndex(
+                settings.RESUME_EMBEDDING_DIR, get_encoder(), settings.RESUME_EMBEDDING_DTYPE
+            ).open()
+        return _index
+
+
+def embed_resumes(resumes):
+    """
+    Encode the resumes' parsed text in one batch, append the vectors to the
+    index and record each resume's row. Returns the number embedded.
+    """
+    from .models import Resume
+
+    resumes = [resume for resume in resumes if resume.pk]
+    if not resumes:
+        return 0
+    index = get_embedding_index()
+    vectors = index.encoder.encode([resume.parsed_text or "" for resume in resumes])
+    rows = index.append([resume.pk for resume in resumes], [resume.owner_id for resume in resumes], vectors)
+    for resume, row in zip(resumes, rows):
+        resume.embedding_row = row
+    Resume.objects.bulk_update(resumes, ["embedding_row"])
+    return len(resumes)
+
+
+def similar_resumes(owner, text, k, exclude=()):
+    """
+    [(resume id, similarity)] of the owner's k resumes closest to text,
+    leaving out the ids in exclude. Rows that no longer are a resume's
+    current row are dropped, widening the search until k live resumes are
+    found or the owner's rows run out.
+    """
+    from .models import Resume
+
+    owner_id = getattr(owner, "pk", owner)
+    index = get_embedding_index()
+    query = index.encode_query(text)
+    wanted = k + len(exclude)
+    while True:
+        rows, scores = index.search(owner_id, query, wanted)
+        ids = index.resume_ids(rows)
+        current = dict(
+            Resume.objects.owned_by(owner_id).filter(id__in=ids.tolist(), status="processed")
+            .exclude(id__in=exclude)
+            .values_list("id", "embedding_row")
+        )
+        found = [
+            (int(resume_id), float(score))
+            for row, resume_id, score in zip(rows.tolist(), ids.tolist(), scores.tolist())
+            if current.get(resume_id) == row
+        ]
+        if len(found) >= k or len(rows) < wanted:
+            return found[:k]
+        wanted *= 2
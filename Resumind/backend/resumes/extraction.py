@@ -0,0 +1,96 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from .parsing import _extract_text_generic
+from .pdf_backends import extract_pdf_text, pdf_page_count
+
+# PDFs at least this large are split into page ranges so one long document
+# spreads over several workers instead of pinning a single core.
+PDF_SPLIT_MIN_BYTES = 256 * 1024
+
+
+def _extract_pdf_pages(path: str, start: int, stop: int) -> str:
+    return extract_pdf_text(path, start, stop)
+
+
+def _plan(path: str, ext: str, pages_per_task: int) -> list:
+    """
+    Work units for one file: a single whole-file task, or one task per page
+    range for large PDFs.
+    """
+    if ext == ".pdf" and pages_per_task and os.path.getsize(path) >= PDF_SPLIT_MIN_BYTES:
+        try:
+            count = pdf_page_count(path)
+        except Exception:
+            count = 0
+        if count > pages_per_task:
+            return [
+                (_extract_pdf_pages, (path, start, min(start + pages_per_task, count)))
+                for start in range(0, count, pages_per_task)
+            ]
+    return [(_extract_text_generic, (path, ext))]
+
+
+def iter_extracted_texts(executor, sources, timeout=None, pages_per_task=4, workers=None):
+    """
+    Extract text from (path, ext) sources in parallel on executor.
+
+    Work units are submitted as workers free up, at most workers at a time,
+    so a unit starts right after it is submitted and its timeout counts from
+    then. Texts are yielded in input order as soon as each file is complete.
+    A file with a unit that raises or runs longer than timeout seconds
+    yields None. A running unit cannot be cancelled: one that timed out
+    keeps its worker until it returns, so later files wait for the
+    remaining workers. BrokenProcessPool is re-raised since no later file
+    can complete either.
+    """
+    workers = workers or os.cpu_count() or 1
+    plans = []
+    for path, ext in sources:
+        try:
+            plans.append(_plan(path, ext, pages_per_task))
+        except OSError:
+            plans.append(None)
+    queued = deque((index, func, args) for index, units in enumerate(plans) if units for func, args in units)
+    submitted = [[] for _ in plans]  # (future, deadline) per file
+    running = set()
+
+    def fill():
+        running.difference_update([future for future in running if future.done()])
+        while queued and len(running) < workers:
+            index, func, args = queued.popleft()
+            future = executor.submit(func, *args)
+            running.add(future)
+            submitted[index].append((future, None if timeout is None else time.monotonic() + timeout))
+
+    for index, units in enumerate(plans):
+        if units is None:
+            yield None
+            continue
+        failed = False
+        while True:
+            fill()
+            entries = submitted[index]
+            now = time.monotonic()
+            for future, deadline in entries:
+                if future.done():
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        raise error
+                    failed = failed or error is not None
+                elif deadline is not None and deadline <= now:
+                    failed = True
+            if failed or (len(entries) == len(units) and all(future.done() for future, _ in entries)):
+                break
+            deadlines = [deadline for future, deadline in entries if deadline is not None and not future.done()]
+            wait(running, timeout=max(min(deadlines) - now, 0) if deadlines else None, return_when=FIRST_COMPLETED)
+        if failed:
+            for future, _ in entries:
+                future.cancel()
+            for unit in [unit for unit in queued if unit[0] == index]:
+                queued.remove(unit)
+            yield None
+            continue
+        yield "\n".join(future.result() for future, _ in entries)
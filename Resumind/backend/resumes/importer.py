@@ -0,0 +1,270 @@
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import IDENTITY_FIELDS, FileTombstone, Resume, ResumeSkill, UploadBatch
+from .extraction import iter_extracted_texts
+from .parsing import ALLOWED_EXTS, identity_fields
+from .search import index_resumes
+from .tasks import cached_result, embed_or_log, parse_and_cache
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_resume_files(root, after=()):
+    """
+    Supported files under root as (key, path, ext), where key is the tuple
+    of path components relative to root. Directories are listed one at a
+    time and visited in sorted order, so keys come out sorted and a walk
+    can be resumed after a given key without revisiting anything before it.
+    Hidden files and directories are skipped; symlinked directories are
+    not followed.
+    """
+    after = tuple(after)
+
+    def walk(directory, parts):
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            key = parts + (entry.name,)
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                # Descend only into directories at or after the checkpoint
+                if after and key < after and after[:len(key)] != key:
+                    continue
+                yield from walk(entry.path, key)
+                continue
+            if after and key <= after:
+                continue
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in ALLOWED_EXTS:
+                yield key, entry.path, ext
+
+    yield from walk(os.fspath(root), ())
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImportCheckpoint:
+    """
+    Progress of one directory import for one owner, kept as a small JSON
+    file: the key of the last file handled, the batch the rows belong to
+    and running counts. It is rewritten atomically after every chunk.
+    """
+
+    def __init__(self, path, root, owner_id):
+        self.path = Path(path)
+        self.root = os.path.abspath(root)
+        self.owner_id = owner_id
+        self.last = ()
+        self.batch_id = None
+        self.counts = {"seen": 0, "imported": 0, "skipped": 0, "duplicates": 0, "failed": 0}
+
+    @classmethod
+    def default_path(cls, directory, root, owner_id):
+        name = hashlib.sha1(f"{owner_id}:{os.path.abspath(root)}".encode("utf-8")).hexdigest()
+        return Path(directory) / f"{name}.json"
+
+    def load(self) -> bool:
+        """
+        Restore saved progress; False if there is none for this root and owner.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get("root") != self.root or state.get("owner_id") != self.owner_id:
+            return False
+        self.last = tuple(state.get("last") or ())
+        self.batch_id = state.get("batch_id")
+        self.counts.update(state.get("counts") or {})
+        return True
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "root": self.root,
+            "owner_id": self.owner_id,
+            "last": list(self.last),
+            "batch_id": self.batch_id,
+            "counts": self.counts,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def clear(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _known_identities(owner, candidates):
+    """
+    (field, value) pairs of the candidates' identity values that the owner
+    already has, found with one IN query per identity field.
+    """
+    known = set()
+    for field in IDENTITY_FIELDS:
+        values = {identity[field] for _, _, identity in candidates if identity[field]}
+        if values:
+            existing = Resume.objects.owned_by(owner).filter(**{f"{field}__in": values}).values_list(field, flat=True)
+            known.update((field, value) for value in existing)
+    return known
+
+
+def import_chunk(owner, batch, files, executor, seen_hashes, timeout=None, pages_per_task=4, workers=None):
+    """
+    Import one chunk of (key, path, ext) files for owner into batch. Files
+    whose content the owner already has are skipped before extraction; the
+    rest are extracted on executor (or taken from the parse cache), checked
+    against the owner's identities, inserted and indexed with bulk writes
+    and embedded in one batch. seen_hashes collects the content hashes handled
+    in this run; workers is the size of executor. Returns counts for the
+    chunk.
+    """
+    counts = {"seen": len(files), "imported": 0, "skipped": 0, "duplicates": 0, "failed": 0}
+    hashed = []
+    for _, path, ext in files:
+        try:
+            hashed.append((path, ext, file_sha256(path)))
+        except OSError:
+            counts["failed"] += 1
+    existing = set(
+        Resume.objects.owned_by(owner).filter(content_hash__in=[digest for _, _, digest in hashed])
+        .values_list("content_hash", flat=True)
+    )
+    queued = []
+    for path, ext, digest in hashed:
+        if digest in existing or digest in seen_hashes:
+            counts["skipped"] += 1
+            continue
+        seen_hashes.add(digest)
+        queued.append((path, ext, digest))
+    if not queued:
+        return counts
+
+    parsed = {}
+    to_extract = []
+    for path, ext, digest in queued:
+        cached = cached_result(digest)
+        if cached:
+            parsed[digest] = cached
+        else:
+            to_extract.append((path, ext, digest))
+    texts = iter_extracted_texts(
+        executor,
+        [(path, ext) for path, ext, _ in to_extract],
+        timeout=timeout,
+        pages_per_task=pages_per_task,
+        workers=workers,
+    )
+    for (_, _, digest), text in zip(to_extract, texts):
+        details = parse_and_cache(digest, text)
+        if details is not None:
+            parsed[digest] = (text, details)
+
+    candidates = []
+    for path, _, digest in queued:
+        if digest not in parsed:
+            counts["failed"] += 1
+            continue
+        identity = identity_fields(parsed[digest][1])
+        identity["content_hash"] = digest
+        candidates.append((path, parsed[digest], identity))
+    known = _known_identities(owner, candidates)
+    fresh = []
+    for path, result, identity in candidates:
+        values = {(field, value) for field, value in identity.items() if value}
+        if values & known:
+            counts["duplicates"] += 1
+            continue
+        known |= values
+        fresh.append((path, result, identity))
+
+    saved = []
+    try:
+        for path, _, _ in fresh:
+            with open(path, "rb") as f:
+                saved.append(default_storage.save(os.path.join("resumes", os.path.basename(path)), File(f)))
+        # Tombstoned until their rows commit, so a crash in between leaves
+        # files that manage.py sweep_deleted_files removes, not orphans
+        FileTombstone.objects.bulk_create([FileTombstone(name=name) for name in saved])
+        parsed_at = timezone.now()
+        resumes = [
+            Resume(
+                file=name,
+                owner=owner,
+                batch=batch,
+                parsed_text=text[:20000],
+                skills=", ".join(details.get("skills", [])),
+                certifications=list(details.get("certifications", [])),
+                education=details.get("education", ""),
+                projects=details.get("projects_count", 0),
+                experience_years=details.get("experience_years", 0) or 0,
+                summary=details,
+                status="processed",
+                parsed_at=parsed_at,
+                **identity,
+            )
+            for name, (_, (text, details), identity) in zip(saved, fresh)
+        ]
+        with transaction.atomic():
+            Resume.objects.bulk_create(resumes)
+            if any(resume.pk is None for resume in resumes):
+                # Backends that do not return primary keys from bulk inserts
+                ids = dict(
+                    Resume.objects.owned_by(owner).filter(content_hash__in=[r.content_hash for r in resumes])
+                    .values_list("content_hash", "id")
+                )
+                for resume in resumes:
+                    resume.pk = ids[resume.content_hash]
+            ResumeSkill.objects.bulk_create([
+                ResumeSkill(resume_id=resume.pk, skill_id=skill_id)
+                for resume, (_, (_, details), _) in zip(resumes, fresh)
+                for skill_id in details.get("skill_ids", [])
+            ])
+            index_resumes(resumes)
+            FileTombstone.objects.filter(name__in=saved).delete()
+            counts["imported"] = len(resumes)
+            UploadBatch.objects.filter(pk=batch.pk).update(
+                total=F("total") + len(queued),
+                processed=F("processed") + counts["imported"],
+                duplicates=F("duplicates") + counts["duplicates"],
+                failed=F("failed") + len(queued) - counts["imported"] - counts["duplicates"],
+            )
+    except Exception:
+        for name in saved:
+            default_storage.delete(name)
+        FileTombstone.objects.filter(name__in=saved).delete()
+        raise
+    embed_or_log(resumes)
+    return counts
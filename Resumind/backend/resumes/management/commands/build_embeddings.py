@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from resumes.embeddings import embed_resumes, get_embedding_index
+from resumes.models import Resume
+
+
+class Command(BaseCommand):
+    help = (
+        "Embed parsed resumes that have no vector yet. With --rebuild the index is emptied first and every "
+        "resume is embedded again, which also drops rows left behind by deleted resumes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rebuild", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=256)
+
+    def handle(self, *args, **options):
+        index = get_embedding_index()
+        if options["rebuild"]:
+            index.reset()
+        resumes = Resume.objects.filter(status="processed", embedding_row__isnull=True).only(
+            "id", "owner_id", "parsed_text"
+        )
+        total = 0
+        last_id = 0
+        while True:
+            batch = list(resumes.filter(id__gt=last_id).order_by("id")[:options["batch_size"]])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            total += embed_resumes(batch)
+            self.stdout.write(f"{total} resume(s) embedded")
+        self.stdout.write(self.style.SUCCESS(
+            f"{total} resume(s) embedded with {index.encoder.name}; the index holds {len(index)} row(s)"
+        ))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from resumes.models import Resume, SearchPosting
+from resumes.search import index_resumes
+
+
+class Command(BaseCommand):
+    help = (
+        "Add parsed resumes that are not in the full-text index yet. With --rebuild every posting is dropped "
+        "and all resumes are indexed again, e.g. after the tokenizer changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rebuild", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        resumes = Resume.objects.filter(status="processed").only(
+            "id", "owner_id", "parsed_text", "skills", "certifications"
+        )
+        if options["rebuild"]:
+            SearchPosting.objects.all().delete()
+        else:
+            resumes = resumes.filter(search_length=0)
+        total = 0
+        last_id = 0
+        while True:
+            batch = list(resumes.filter(id__gt=last_id).order_by("id")[:options["batch_size"]])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            with transaction.atomic():
+                index_resumes(batch)
+            total += len(batch)
+            self.stdout.write(f"{total} resume(s) indexed")
+        self.stdout.write(self.style.SUCCESS(f"{total} resume(s) indexed"))
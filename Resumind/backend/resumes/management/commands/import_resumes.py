@@ -0,0 +1,105 @@
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+from reports.utils import refresh_stale_reports
+from resumes.importer import ImportCheckpoint, import_chunk, iter_resume_files
+from resumes.models import UploadBatch
+
+
+class Command(BaseCommand):
+    help = (
+        "Import every resume under a server-side directory for one user, extracting in parallel and "
+        "inserting in chunks. Progress is checkpointed, so an interrupted import continues where it "
+        "stopped; files the user already has are skipped, so re-running is safe."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory")
+        parser.add_argument("--owner", required=True, help="Username or email of the user to import for.")
+        parser.add_argument("--workers", type=int, default=settings.RESUME_INGEST_WORKERS)
+        parser.add_argument("--chunk-size", type=int, default=200, help="Files hashed, parsed and inserted together.")
+        parser.add_argument("--checkpoint", help="Checkpoint file (default: one per directory and owner).")
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+
+    def handle(self, *args, **options):
+        root = options["directory"]
+        if not os.path.isdir(root):
+            raise CommandError(f"{root} is not a directory")
+        if options["workers"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--workers and --chunk-size must be at least 1")
+        owner = self._owner(options["owner"])
+
+        checkpoint = ImportCheckpoint(
+            options["checkpoint"] or ImportCheckpoint.default_path(settings.RESUME_IMPORT_CHECKPOINT_DIR, root, owner.pk),
+            root,
+            owner.pk,
+        )
+        if not options["restart"] and checkpoint.load():
+            self.stdout.write(f"Resuming after {os.path.join(*checkpoint.last) if checkpoint.last else 'the start'}")
+        batch = UploadBatch.objects.filter(pk=checkpoint.batch_id, owner=owner).first() if checkpoint.batch_id else None
+        if batch is None:
+            batch = UploadBatch.objects.create(owner=owner)
+            checkpoint.batch_id = batch.pk
+
+        files = iter_resume_files(root, after=checkpoint.last)
+        seen_hashes = set()
+        started = time.monotonic()
+        handled = 0
+        executor = ProcessPoolExecutor(
+            max_workers=options["workers"], mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            while True:
+                chunk = list(islice(files, options["chunk_size"]))
+                if not chunk:
+                    break
+                try:
+                    counts = import_chunk(
+                        owner,
+                        batch,
+                        chunk,
+                        executor,
+                        seen_hashes,
+                        timeout=settings.RESUME_EXTRACT_TIMEOUT,
+                        pages_per_task=settings.RESUME_PDF_PAGES_PER_TASK,
+                        workers=options["workers"],
+                    )
+                except BrokenProcessPool:
+                    raise CommandError("A worker process died; run the command again to continue from the checkpoint")
+                for key, value in counts.items():
+                    checkpoint.counts[key] += value
+                checkpoint.last = chunk[-1][0]
+                checkpoint.save()
+                handled += len(chunk)
+                self._progress(checkpoint.counts, handled / max(time.monotonic() - started, 1e-9))
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        UploadBatch.objects.filter(pk=batch.pk).update(finished_at=timezone.now())
+        scored = refresh_stale_reports(owner)
+        checkpoint.clear()
+        self.stdout.write(self.style.SUCCESS(
+            f"Import finished: {checkpoint.counts['imported']} imported, {checkpoint.counts['skipped']} already "
+            f"present, {checkpoint.counts['duplicates']} duplicates, {checkpoint.counts['failed']} failed; "
+            f"{scored} report(s) scored"
+        ))
+
+    def _owner(self, value):
+        users = list(get_user_model().objects.filter(Q(username=value) | Q(email=value))[:2])
+        if len(users) != 1:
+            raise CommandError(f"No single user matches {value!r}")
+        return users[0]
+
+    def _progress(self, counts, rate):
+        self.stdout.write(
+            f"{counts['seen']} files: {counts['imported']} imported, {counts['skipped']} already present, "
+            f"{counts['duplicates']} duplicates, {counts['failed']} failed ({rate:.1f} files/s)"
+        )
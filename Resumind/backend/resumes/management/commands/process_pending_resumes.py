@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from resumes.models import Resume
+from resumes.tasks import process_batch
+
+
+class Command(BaseCommand):
+    help = "Parse resumes left pending, e.g. after a server restart interrupted their batch."
+
+    def handle(self, *args, **options):
+        batch_ids = (
+            Resume.objects.filter(status="pending", batch__isnull=False)
+            .values_list("batch_id", flat=True)
+            .distinct()
+        )
+        batch_ids = list(batch_ids)
+        for batch_id in batch_ids:
+            process_batch(batch_id)
+            self.stdout.write(f"Processed batch {batch_id}")
+        self.stdout.write(self.style.SUCCESS(f"{len(batch_ids)} batch(es) processed"))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from resumes.utils import sweep_file_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Unlink files of deleted resumes, or of imports that never committed, that are still tombstoned, "
+        "e.g. after a crash during cleanup."
+    )
+
+    def handle(self, *args, **options):
+        removed = sweep_file_tombstones()
+        self.stdout.write(self.style.SUCCESS(f"{removed} file(s) removed"))
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0007_uploadbatch'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='email_normalized',
+            field=models.CharField(blank=True, default='', max_length=254),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='github_handle',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='linkedin_handle',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='name_normalized',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='phone_normalized',
+            field=models.CharField(blank=True, default='', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', 'email_normalized'], name='resume_owner_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', 'phone_normalized'], name='resume_owner_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', 'linkedin_handle'], name='resume_owner_linkedin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', 'github_handle'], name='resume_owner_github_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', 'name_normalized'], name='resume_owner_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', 'content_hash'], name='resume_owner_hash_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:43
+
+import json
+import re
+
+from django.db import migrations
+
+IDENTITY_COLUMNS = ['email_normalized', 'phone_normalized', 'linkedin_handle', 'github_handle', 'name_normalized']
+
+
+def _handle(url, host):
+    if not url:
+        return ""
+    match = re.search(host + r"/(?:in/|pub/)?([^/?#\s]+)", url, re.IGNORECASE)
+    return match.group(1).lower()[:100] if match else ""
+
+
+def backfill_identity_fields(apps, schema_editor):
+    Resume = apps.get_model('resumes', 'Resume')
+    batch = []
+    for resume in Resume.objects.exclude(summary__isnull=True).exclude(summary="").only('id', 'summary').iterator():
+        try:
+            details = json.loads(resume.summary)
+        except (TypeError, ValueError):
+            continue
+        phone_digits = re.sub(r"\D", "", details.get("phone") or "")
+        resume.email_normalized = (details.get("email") or "").strip().lower()[:254]
+        resume.phone_normalized = phone_digits[-10:]
+        resume.linkedin_handle = _handle(details.get("linkedin"), r"linkedin\.com")
+        resume.github_handle = _handle(details.get("github"), r"github\.com")
+        resume.name_normalized = " ".join((details.get("name") or "").lower().split())[:100]
+        batch.append(resume)
+        if len(batch) >= 1000:
+            Resume.objects.bulk_update(batch, IDENTITY_COLUMNS)
+            batch = []
+    if batch:
+        Resume.objects.bulk_update(batch, IDENTITY_COLUMNS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0008_resume_identity_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_identity_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0009_backfill_resume_identity_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['owner', '-uploaded_at', '-id'], name='resume_owner_recent_idx'),
+        ),
+    ]
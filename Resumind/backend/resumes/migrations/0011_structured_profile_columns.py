@@ -0,0 +1,101 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:20
+
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CHUNK = 1000
+
+
+def _load(value):
+    try:
+        return json.loads(value) if value else {}
+    except (TypeError, ValueError):
+        return {}
+
+
+def copy_to_structured_columns(apps, schema_editor):
+    from taxonomy.index import get_skill_index
+
+    Resume = apps.get_model('resumes', 'Resume')
+    ResumeSkill = apps.get_model('resumes', 'ResumeSkill')
+    index = get_skill_index()
+    resumes = []
+    links = []
+
+    def flush():
+        Resume.objects.bulk_update(resumes, ['summary_data', 'certification_list', 'experience_years'])
+        ResumeSkill.objects.bulk_create(links, ignore_conflicts=True)
+        resumes.clear()
+        links.clear()
+
+    for resume in Resume.objects.only('id', 'summary', 'certifications', 'skills').iterator(chunk_size=CHUNK):
+        details = _load(resume.summary)
+        if not isinstance(details, dict):
+            details = {}
+        resume.summary_data = details
+        resume.certification_list = [c.strip() for c in (resume.certifications or '').split(',') if c.strip()]
+        resume.experience_years = float(details.get('experience_years') or 0)
+        skill_ids = details.get('skill_ids') or index.ids_for((resume.skills or '').split(','))
+        links.extend(ResumeSkill(resume_id=resume.id, skill_id=skill_id) for skill_id in skill_ids)
+        resumes.append(resume)
+        if len(resumes) >= CHUNK:
+            flush()
+    flush()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0010_resume_owner_recent_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill_id', models.PositiveSmallIntegerField()),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='resumes.resume')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill_id', 'resume'], name='resume_skill_skill_idx')],
+                'constraints': [models.UniqueConstraint(fields=('resume', 'skill_id'), name='resume_skill_uniq')],
+            },
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='experience_years',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='summary_data',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='certification_list',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(copy_to_structured_columns, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='resume',
+            name='summary',
+        ),
+        migrations.RemoveField(
+            model_name='resume',
+            name='certifications',
+        ),
+        migrations.RenameField(
+            model_name='resume',
+            old_name='summary_data',
+            new_name='summary',
+        ),
+        migrations.RenameField(
+            model_name='resume',
+            old_name='certification_list',
+            new_name='certifications',
+        ),
+    ]
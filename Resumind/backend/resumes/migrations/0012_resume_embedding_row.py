@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0011_structured_profile_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='embedding_row',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0012_resume_embedding_row'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='search_length',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=40)),
+                ('tf', models.PositiveSmallIntegerField()),
+                ('doc_length', models.PositiveIntegerField()),
+                ('positions', models.TextField(blank=True, default='')),
+                ('owner', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('resume', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='resumes.resume')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['owner', 'term', 'resume'], name='posting_owner_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('resume', 'term'), name='posting_resume_term_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0014_file_tombstone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='filetombstone',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='resumes/'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0015_index_file_names'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='parsed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,9 +1,54 @@
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
-import json
+from django.core.exceptions import ValidationError
+from accounts.models import PurgeRequest
+
+IDENTITY_FIELDS = (
+    "email_normalized",
+    "phone_normalized",
+    "linkedin_handle",
+    "github_handle",
+    "name_normalized",
+    "content_hash",
+)
+
+class UploadBatch(models.Model):
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="upload_batches"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    duplicates = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Batch {self.id} ({self.owner.email})"
+
+    @property
+    def pending(self):
+        return max(self.total - self.processed - self.duplicates - self.failed, 0)
+
+class ResumeQuerySet(models.QuerySet):
+    def owned_by(self, owner):
+        """
+        The owner's resumes, without those a logout purge is still deleting.
+        """
+        owner_id = getattr(owner, "pk", owner)
+        resumes = self.filter(owner_id=owner_id)
+        cutoff = PurgeRequest.cutoff_for(owner_id)
+        return resumes.filter(id__gt=cutoff) if cutoff else resumes
 
 class Resume(models.Model):
-    file = models.FileField(upload_to="resumes/")
+    # Indexed so the file sweeper can tell which tombstoned names are still in use
+    file = models.FileField(upload_to="resumes/", db_index=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -12,10 +57,30 @@ class Resume(models.Model):
     )
     parsed_text = models.TextField(blank=True, null=True)
     skills = models.TextField(blank=True, null=True)
-    certifications = models.TextField(blank=True, null=True)
+    certifications = models.JSONField(default=list, blank=True)
     education = models.TextField(blank=True, null=True)
     projects = models.IntegerField(blank=True, null=True, default=0)
-    summary = models.TextField(blank=True, null=True)
+    experience_years = models.FloatField(default=0)
+    summary = models.JSONField(default=dict, blank=True)
+    email_normalized = models.CharField(max_length=254, blank=True, default="")
+    phone_normalized = models.CharField(max_length=20, blank=True, default="")
+    linkedin_handle = models.CharField(max_length=100, blank=True, default="")
+    github_handle = models.CharField(max_length=100, blank=True, default="")
+    name_normalized = models.CharField(max_length=100, blank=True, default="")
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    # When the parsed fields were last written, so caches notice a re-parse
+    parsed_at = models.DateTimeField(blank=True, null=True)
+    # Row of this resume's vector in the embedding index (resumes.embeddings)
+    embedding_row = models.PositiveIntegerField(blank=True, null=True)
+    # Tokens indexed for full-text search (resumes.search); 0 until indexed
+    search_length = models.PositiveIntegerField(default=0)
+    batch = models.ForeignKey(
+        UploadBatch,
+        on_delete=models.SET_NULL,
+        related_name="resumes",
+        blank=True,
+        null=True
+    )
 
     STATUS_CHOICES = [
         ("pending", "Pending"),
@@ -23,28 +88,101 @@ class Resume(models.Model):
     ]
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
 
+    objects = ResumeQuerySet.as_manager()
+
     class Meta:
         ordering = ["-uploaded_at"]
+        indexes = [
+            models.Index(fields=["owner", "email_normalized"], name="resume_owner_email_idx"),
+            models.Index(fields=["owner", "phone_normalized"], name="resume_owner_phone_idx"),
+            models.Index(fields=["owner", "linkedin_handle"], name="resume_owner_linkedin_idx"),
+            models.Index(fields=["owner", "github_handle"], name="resume_owner_github_idx"),
+            models.Index(fields=["owner", "name_normalized"], name="resume_owner_name_idx"),
+            models.Index(fields=["owner", "content_hash"], name="resume_owner_hash_idx"),
+            models.Index(fields=["owner", "-uploaded_at", "-id"], name="resume_owner_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.file.name} ({self.owner.email})"
 
+    def find_duplicate(self):
+        """
+        Another resume of the same owner sharing any identity value. Each
+        branch of the OR is served by an (owner, field) index.
+        """
+        lookups = Q()
+        for field in IDENTITY_FIELDS:
+            value = getattr(self, field)
+            if value:
+                lookups |= Q(**{field: value})
+        if not lookups:
+            return None
+        return Resume.objects.owned_by(self.owner_id).filter(lookups).exclude(pk=self.pk).first()
+
     def clean(self):
-        if self.summary:
-            try:
-                summary_data = json.loads(self.summary)
-                email = summary_data.get("email")
-                phone = summary_data.get("phone")
-                linkedin = summary_data.get("linkedin")
-                github = summary_data.get("github")
-                name = summary_data.get("name")
-                qs = Resume.objects.filter(owner=self.owner)
-                for field_value in [email, phone, linkedin, github, name]:
-                    if field_value and qs.filter(summary__contains=f'"{field_value}"').exists():
-                        raise models.ValidationError(f"Resume with {field_value} already exists for this owner.")
-            except json.JSONDecodeError:
-                pass
+        duplicate = self.find_duplicate()
+        if duplicate:
+            raise ValidationError(f"Resume {duplicate.pk} with the same identity already exists for this owner.")
 
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
+
+class ResumeSkill(models.Model):
+    """
+    One taxonomy skill found in a resume. skill_id refers to taxonomy.skills,
+    which lives in code rather than in a table.
+    """
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="skill_links")
+    skill_id = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resume", "skill_id"], name="resume_skill_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["skill_id", "resume"], name="resume_skill_skill_idx"),
+        ]
+
+    def __str__(self):
+        return f"Skill {self.skill_id} of Resume {self.resume_id}"
+
+class SearchPosting(models.Model):
+    """
+    One term of one resume in the full-text index: how often it occurs,
+    where (token positions, for phrase queries) and the resume's indexed
+    length, so BM25 needs no second lookup. owner is copied from the
+    resume to keep every query on the (owner, term) index.
+    """
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+", db_index=False)
+    # Lookups by resume use the (resume, term) unique index
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="postings", db_index=False)
+    term = models.CharField(max_length=40)
+    tf = models.PositiveSmallIntegerField()
+    doc_length = models.PositiveIntegerField()
+    # Space separated token positions, capped per term
+    positions = models.TextField(blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resume", "term"], name="posting_resume_term_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["owner", "term", "resume"], name="posting_owner_term_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.term!r} in Resume {self.resume_id}"
+
+class FileTombstone(models.Model):
+    """
+    A stored resume file whose row has been deleted but which may not be
+    unlinked yet. Written in the transaction that deletes the rows and
+    removed once the file is gone, so a crash in between leaves a record
+    for the sweeper instead of an orphaned file.
+    """
+    name = models.CharField(max_length=255, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,216 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from dateutil import parser as date_parser
+from taxonomy.index import get_skill_index
+from .pdf_backends import extract_pdf_text
+from .sections import count_entries, entries, split_sections, text_without
+
+try:
+    from docx import Document
+except Exception:
+    Document = None
+
+ALLOWED_EXTS = {".pdf", ".docx", ".txt"}
+
+# Bump whenever parse_resume_text output changes so cached parses are redone
+PARSER_VERSION = 6
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_RE = re.compile(r"(?:\+?\d[\d\s\-()]{8,})")
+LINKEDIN_RE = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/[^\s)]+", re.IGNORECASE)
+GITHUB_RE = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[^\s)]+", re.IGNORECASE)
+DATE_RANGE_RE = re.compile(
+    r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sept|Sep|Oct|Nov|Dec|"
+    r"January|February|March|April|May|June|July|August|September|October|November|December)?\.?\s?\d{4})"
+    r"\s?[-–to]+\s?"
+    r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sept|Sep|Oct|Nov|Dec|"
+    r"January|February|March|April|May|June|July|August|September|October|November|December)?\.?\s?\d{4}|Present|Current)",
+    re.IGNORECASE
+)
+DATE_TOKEN_RE = re.compile(r"^([A-Za-z]+)?\.?\s?(\d{4})$")
+PRESENT_RE = re.compile(r"present|current", re.IGNORECASE)
+CERTIFICATION_RE = re.compile(r"(?:certified in|certificate in|certification in)\s+([A-Za-z &]+)", re.IGNORECASE)
+MAX_CERTIFICATIONS = 20
+# Highest level first. Short abbreviations only count in capitals so that
+# words like "be" or "ms" in running text do not look like degrees.
+EDUCATION_LEVELS = (
+    ("phd", re.compile(r"\b(?i:ph\.?\s?d|doctorate|doctor of philosophy)\b")),
+    ("master", re.compile(r"\b(?:(?i:masters?|m\.?\s?sc|m\.?\s?tech|mba|mca)|M\.S|M\.E)\b")),
+    ("bachelor", re.compile(r"\b(?:(?i:bachelors?|b\.?\s?sc|b\.?\s?tech|b\.?\s?com|bca|bba)|B\.?E|B\.?A)\b")),
+    ("diploma", re.compile(r"\b(?i:diploma)\b")),
+)
+MONTHS = {name: number for number, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+)}
+
+def _extract_text_from_pdf(path: str) -> str:
+    return extract_pdf_text(path)
+
+def _extract_text_from_docx(path: str) -> str:
+    if not Document:
+        return ""
+    doc = Document(path)
+    return "\n".join(p.text for p in doc.paragraphs)
+
+def _extract_text_generic(path: str, ext: str) -> str:
+    ext = (ext or "").lower()
+    if ext == ".pdf":
+        return _extract_text_from_pdf(path)
+    if ext == ".docx":
+        return _extract_text_from_docx(path)
+    if ext == ".txt":
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except Exception:
+            return ""
+    return ""
+
+def _extract_skill_ids(text: str) -> tuple:
+    return get_skill_index().find_ids(text)
+
+def _extract_skills(text: str) -> list:
+    return get_skill_index().names(_extract_skill_ids(text))
+
+def _extract_contacts_and_links(text: str) -> dict:
+    email = EMAIL_RE.search(text)
+    phone = PHONE_RE.search(text)
+    linkedin = LINKEDIN_RE.search(text)
+    github = GITHUB_RE.search(text)
+    linkedin_url = linkedin.group(0) if linkedin else None
+    github_url = github.group(0) if github else None
+    if linkedin_url and not linkedin_url.lower().startswith("http"):
+        linkedin_url = "https://" + linkedin_url
+    if github_url and not github_url.lower().startswith("http"):
+        github_url = "https://" + github_url
+    return {
+        "email": email.group(0) if email else None,
+        "phone": phone.group(0) if phone else None,
+        "linkedin": linkedin_url,
+        "github": github_url,
+    }
+
+def _guess_name(text: str) -> str | None:
+    for line in text.splitlines():
+        cand = line.strip()
+        if 5 <= len(cand) <= 60 and len(cand.split()) in (2, 3) and re.match(r"^[A-Za-z .'-]+$", cand):
+            return cand
+    return None
+
+def _education_level(text: str) -> str:
+    for level, pattern in EDUCATION_LEVELS:
+        if pattern.search(text):
+            return level
+    return ""
+
+def _extract_certifications(sections: dict) -> list:
+    """
+    Items of a certifications section plus "certified in X" phrases found
+    anywhere else, without repeats.
+    """
+    found = entries(sections.get("certifications", ""))[:MAX_CERTIFICATIONS]
+    found += [c.strip() for c in CERTIFICATION_RE.findall(text_without(sections, "certifications"))]
+    return [c[:100] for c in dict.fromkeys(found) if c]
+
+@lru_cache(maxsize=1024)
+def _parse_date_token(token: str) -> tuple | None:
+    """
+    (year, month) of a date-range endpoint such as "Jan 2020", "March. 2019"
+    or "2018". A bare year counts from January. Other forms go through
+    dateutil's fuzzy parser; None if that fails too.
+    """
+    match = DATE_TOKEN_RE.match(token)
+    if match:
+        month = MONTHS.get(match.group(1)[:3].lower(), 1) if match.group(1) else 1
+        return int(match.group(2)), month
+    try:
+        parsed = date_parser.parse(token, fuzzy=True)
+    except (ValueError, OverflowError):
+        return None
+    return parsed.year, parsed.month
+
+def _extract_experience_years(text: str) -> float:
+    today = datetime.now()
+    ranges = []
+    for start_str, end_str in DATE_RANGE_RE.findall(text):
+        start = _parse_date_token(start_str.strip())
+        if PRESENT_RE.search(end_str):
+            end = (today.year, today.month)
+        else:
+            end = _parse_date_token(end_str.strip())
+        if start is None or end is None or end < start:
+            continue
+        ranges.append((start[0] * 12 + start[1], end[0] * 12 + end[1]))
+    # Merge overlapping ranges so concurrent roles are not counted twice
+    total_months = 0
+    current_start = current_end = None
+    for start, end in sorted(ranges):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total_months += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total_months += current_end - current_start
+    if total_months == 0:
+        month_matches = re.findall(r"(\d+)\s+(?:years?|yrs?)", text, re.IGNORECASE)
+        for m in month_matches:
+            total_months += int(m) * 12
+    return round(total_months / 12, 1)
+
+def parse_resume_text(text: str) -> dict:
+    """
+    Structured details of a resume. The text is split into sections once;
+    each field is then read from the section it belongs to (contacts and
+    name from the header, degrees from education, date ranges from
+    experience, ...) and from the whole text only when that section is
+    missing. Skills count wherever they are mentioned.
+    """
+    sections = split_sections(text)
+    header = sections.get("header", "")
+
+    details = _extract_contacts_and_links(header)
+    if not all(details.values()):
+        body = _extract_contacts_and_links(text_without(sections, "header"))
+        details = {key: value or body[key] for key, value in details.items()}
+    details["name"] = _guess_name(header) or _guess_name(text)
+
+    skill_ids = _extract_skill_ids(text)
+    details["skills"] = sorted(set(get_skill_index().names(skill_ids)))
+    details["skill_ids"] = sorted(skill_ids)
+
+    details["education"] = _education_level(sections.get("education", text))
+
+    if "projects" in sections:
+        details["projects_count"] = count_entries(sections["projects"])
+    else:
+        details["projects_count"] = text.lower().count("project")
+
+    details["certifications"] = _extract_certifications(sections)
+
+    if "experience" in sections:
+        details["experience_years"] = _extract_experience_years(sections["experience"])
+    else:
+        details["experience_years"] = _extract_experience_years(text_without(sections, "education"))
+    return details
+
+def _profile_handle(url: str | None, host: str) -> str:
+    if not url:
+        return ""
+    match = re.search(host + r"/(?:in/|pub/)?([^/?#\s]+)", url, re.IGNORECASE)
+    return match.group(1).lower()[:100] if match else ""
+
+def identity_fields(details: dict) -> dict:
+    """
+    Normalized identity values used for indexed duplicate detection.
+    """
+    phone_digits = re.sub(r"\D", "", details.get("phone") or "")
+    return {
+        "email_normalized": (details.get("email") or "").strip().lower()[:254],
+        "phone_normalized": phone_digits[-10:],
+        "linkedin_handle": _profile_handle(details.get("linkedin"), r"linkedin\.com"),
+        "github_handle": _profile_handle(details.get("github"), r"github\.com"),
+        "name_normalized": " ".join((details.get("name") or "").lower().split())[:100],
+    }
@@ -0,0 +1,221 @@
+import re
+from abc import ABC, abstractmethod
+
+try:
+    from PyPDF2 import PdfReader
+except Exception:
+    PdfReader = None
+
+try:
+    import pdfplumber
+except Exception:
+    pdfplumber = None
+
+# Characters kept per page; anything beyond is table or boilerplate noise
+PAGE_CHAR_BUDGET = 10000
+# Extraction stops once a document has produced this many characters
+TEXT_CHAR_BUDGET = 60000
+# A page with less text than this from the fast backend is re-read with layout
+MIN_PAGE_CHARS = 40
+
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_WORD_RE = re.compile(r"\S+")
+# PyPDF2 turns kerning before punctuation into a space. Only trailing
+# sentence punctuation ("Python ,"), dashes between digits ("2020 -2024")
+# and dots inside an email domain ("gmail .com") are joined back; tokens
+# that start with punctuation (".NET", "-x") are left alone.
+_KERNED_PUNCT_RE = re.compile(r"(?<=\w)[ \t]+(?=[.,;:!?](?:\s|$))|(?<=\d)[ \t]+(?=-\d)")
+_KERNED_DOMAIN_RE = re.compile(r"(@[\w-]+(?:\.[\w-]+)*)[ \t]+(?=\.[A-Za-z]{2,}\b)")
+
+_backends = {}
+
+
+class PdfBackend(ABC):
+    """
+    One way of reading page text out of a PDF. open() returns a handle that
+    page_count() and page_text() accept; close() releases it.
+    """
+
+    name = ""
+    # Layout-aware backends are used to re-read pages the fast ones garble
+    layout = False
+
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def open(self, path: str):
+        ...
+
+    @abstractmethod
+    def page_count(self, handle) -> int:
+        ...
+
+    @abstractmethod
+    def page_text(self, handle, index: int) -> str:
+        ...
+
+    def close(self, handle):
+        pass
+
+
+def join_kerned(text: str) -> str:
+    return _KERNED_DOMAIN_RE.sub(r"\1", _KERNED_PUNCT_RE.sub("", text))
+
+
+def register_backend(backend: PdfBackend):
+    _backends[backend.name] = backend
+    return backend
+
+
+def get_backend(name: str) -> PdfBackend | None:
+    backend = _backends.get(name)
+    return backend if backend and backend.available() else None
+
+
+class PyPDF2Backend(PdfBackend):
+    """
+    Content-stream text extraction without layout analysis, several times
+    faster than pdfplumber on ordinary single-column resumes.
+    """
+
+    name = "pypdf2"
+
+    def available(self):
+        return PdfReader is not None
+
+    def open(self, path):
+        return PdfReader(path)
+
+    def page_count(self, handle):
+        return len(handle.pages)
+
+    def page_text(self, handle, index):
+        return join_kerned(handle.pages[index].extract_text() or "")
+
+
+class PdfplumberBackend(PdfBackend):
+    """
+    Character-level layout analysis: slow, but reads columns, tables and
+    unusual encodings that the fast path mangles.
+    """
+
+    name = "pdfplumber"
+    layout = True
+
+    def available(self):
+        return pdfplumber is not None
+
+    def open(self, path):
+        return pdfplumber.open(path)
+
+    def page_count(self, handle):
+        return len(handle.pages)
+
+    def page_text(self, handle, index):
+        page = handle.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            page.flush_cache()
+
+    def close(self, handle):
+        handle.close()
+
+
+register_backend(PyPDF2Backend())
+register_backend(PdfplumberBackend())
+
+DEFAULT_BACKENDS = ("pypdf2", "pdfplumber")
+
+
+def needs_layout(text: str) -> bool:
+    """
+    Whether fast-path page text looks unusable: (almost) empty, or words run
+    together because spacing was dropped.
+    """
+    stripped = text.strip()
+    if len(stripped) < MIN_PAGE_CHARS:
+        return True
+    words = _WORD_RE.findall(stripped)
+    return sum(map(len, words)) / len(words) > 15
+
+
+def _clean(text: str) -> str:
+    return _TRAILING_SPACE_RE.sub("", text)[:PAGE_CHAR_BUDGET]
+
+
+def pdf_page_count(path: str, backends=DEFAULT_BACKENDS) -> int:
+    for name in backends:
+        backend = get_backend(name)
+        if backend is None:
+            continue
+        try:
+            handle = backend.open(path)
+        except Exception:
+            continue
+        try:
+            return backend.page_count(handle)
+        finally:
+            backend.close(handle)
+    return 0
+
+
+def extract_pdf_text(path: str, start: int = 0, stop: int | None = None, backends=DEFAULT_BACKENDS, stats=None) -> str:
+    """
+    Text of pages [start, stop) of a PDF. Each page is read with the first
+    available backend; pages that look garbled are re-read with the first
+    layout-aware backend after it. Pages are capped at PAGE_CHAR_BUDGET and
+    reading stops once TEXT_CHAR_BUDGET characters were collected. If given,
+    stats (a dict) counts pages per backend that produced them.
+    """
+    chain = [backend for backend in map(get_backend, backends) if backend]
+    if not chain:
+        return ""
+    handles = {}
+    try:
+        # The first backend that can open the file reads every page
+        for position, primary in enumerate(chain):
+            try:
+                handles[primary.name] = primary.open(path)
+                count = primary.page_count(handles[primary.name])
+                break
+            except Exception:
+                if primary.name in handles:
+                    primary.close(handles.pop(primary.name))
+                if position == len(chain) - 1:
+                    raise
+        fallbacks = [b for b in chain[position + 1:] if b.layout]
+        stop = count if stop is None else min(stop, count)
+        parts = []
+        total = 0
+        for index in range(start, stop):
+            try:
+                text = primary.page_text(handles[primary.name], index)
+            except Exception:
+                text = ""
+            used = primary.name
+            if needs_layout(text) and fallbacks:
+                fallback = fallbacks[0]
+                try:
+                    if fallback.name not in handles:
+                        handles[fallback.name] = fallback.open(path)
+                    retry = fallback.page_text(handles[fallback.name], index)
+                except Exception:
+                    # Keep the fast-path text; a file the fallback cannot open is not retried
+                    if fallback.name not in handles:
+                        fallbacks = fallbacks[1:]
+                else:
+                    if len(retry.strip()) > len(text.strip()) or not needs_layout(retry):
+                        text, used = retry, fallback.name
+            text = _clean(text)
+            if stats is not None:
+                stats[used] = stats.get(used, 0) + 1
+            parts.append(text)
+            total += len(text)
+            if total >= TEXT_CHAR_BUDGET:
+                break
+        return "\n".join(parts)
+    finally:
+        for name, handle in handles.items():
+            _backends[name].close(handle)
@@ -0,0 +1,190 @@
+import re
+import heapq
+import math
+from django.db.models import Count, Sum
+from accounts.models import PurgeRequest
+from .models import Resume, SearchPosting
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+# Query syntax: words, "quoted phrases", OR between alternatives, -word or NOT word
+QUERY_TOKEN_RE = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+MAX_TERM_LENGTH = 40
+# Positions stored per term; later occurrences do not count for phrases
+MAX_POSITIONS = 64
+POSTING_WRITE_CHUNK = 1000
+# Candidate sets up to this size restrict later posting fetches with IN
+CANDIDATE_IN_LIMIT = 2000
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text) -> list:
+    return [token[:MAX_TERM_LENGTH] for token in TOKEN_RE.findall((text or "").lower())]
+
+
+def searchable_text(resume) -> str:
+    return "\n".join([resume.parsed_text or "", resume.skills or "", " ".join(resume.certifications or [])])
+
+
+def _postings(resume):
+    tokens = tokenize(searchable_text(resume))
+    positions = {}
+    for position, token in enumerate(tokens):
+        positions.setdefault(token, []).append(position)
+    return len(tokens), [
+        SearchPosting(
+            owner_id=resume.owner_id,
+            resume_id=resume.pk,
+            term=term,
+            tf=min(len(found), 32767),
+            doc_length=len(tokens),
+            positions=" ".join(map(str, found[:MAX_POSITIONS])),
+        )
+        for term, found in positions.items()
+    ]
+
+
+def index_resumes(resumes):
+    """
+    Replace the postings of the given saved resumes and record their
+    indexed length. Call it in the transaction that stores the resumes, so
+    the index never disagrees with them; deleting a resume removes its
+    postings by cascade.
+    """
+    resumes = [resume for resume in resumes if resume.pk]
+    if not resumes:
+        return
+    SearchPosting.objects.filter(resume_id__in=[resume.pk for resume in resumes]).delete()
+    postings = []
+    for resume in resumes:
+        resume.search_length, rows = _postings(resume)
+        postings.extend(rows)
+    SearchPosting.objects.bulk_create(postings, batch_size=POSTING_WRITE_CHUNK)
+    Resume.objects.bulk_update(resumes, ["search_length"])
+
+
+def parse_query(text):
+    """
+    (clauses, excluded) of a query. Every clause must match and is a list of
+    alternatives joined by OR; excluded phrases must not match. Each
+    alternative or exclusion is a phrase: a tuple of terms that have to
+    appear next to each other (one term for a plain word).
+    """
+    clauses, excluded = [], []
+    join_next = negate_next = False
+    for negated, quoted, word in QUERY_TOKEN_RE.findall(text or ""):
+        if word == "OR":
+            join_next = bool(clauses)
+            continue
+        if word == "AND":
+            continue
+        if word == "NOT":
+            negate_next = True
+            continue
+        if word.startswith("-") and len(word) > 1:
+            negated, word = "-", word[1:]
+        phrase = tuple(tokenize(word or quoted))
+        if not phrase:
+            continue
+        if negated or negate_next:
+            excluded.append(phrase)
+        elif join_next:
+            clauses[-1].append(phrase)
+        else:
+            clauses.append([phrase])
+        join_next = negate_next = False
+    return clauses, excluded
+
+
+def _fetch(owner_id, cutoff, terms, candidates, with_positions):
+    """
+    {term: {resume id: (tf, doc length, positions)}} for the owner's
+    postings of terms on resumes after cutoff (see PurgeRequest.cutoff_for),
+    limited to candidates when that set is small.
+    """
+    postings = SearchPosting.objects.filter(owner_id=owner_id, term__in=terms, resume_id__gt=cutoff)
+    if candidates is not None and len(candidates) <= CANDIDATE_IN_LIMIT:
+        postings = postings.filter(resume_id__in=candidates)
+    fields = ("term", "resume_id", "tf", "doc_length") + (("positions",) if with_positions else ())
+    found = {term: {} for term in terms}
+    for term, resume_id, tf, length, *positions in postings.values_list(*fields).iterator(chunk_size=5000):
+        found[term][resume_id] = (tf, length, positions[0] if positions else "")
+    return found
+
+
+def _phrase_matches(phrase, postings):
+    """
+    Resume ids where the terms of phrase occur consecutively.
+    """
+    matches = set(postings[phrase[0]])
+    for term in phrase[1:]:
+        matches &= postings[term].keys()
+    if len(phrase) == 1:
+        return matches
+    result = set()
+    for resume_id in matches:
+        starts = {int(p) for p in postings[phrase[0]][resume_id][2].split()}
+        for offset, term in enumerate(phrase[1:], start=1):
+            starts &= {int(p) - offset for p in postings[term][resume_id][2].split()}
+            if not starts:
+                break
+        if starts:
+            result.add(resume_id)
+    return result
+
+
+def search_resumes(owner, query, limit=20, offset=0):
+    """
+    (total matches, [(resume id, BM25 score)]) of the owner's resumes for a
+    query, best first, newest first among equal scores. Clauses are matched
+    rarest first, so later posting fetches can be limited to the resumes
+    still in the running.
+    """
+    owner_id = getattr(owner, "pk", owner)
+    clauses, excluded = parse_query(query)
+    if not clauses:
+        return 0, []
+    cutoff = PurgeRequest.cutoff_for(owner_id)
+    query_terms = {term for clause in clauses for phrase in clause for term in phrase}
+    excluded_terms = {term for phrase in excluded for term in phrase}
+    df = dict(
+        SearchPosting.objects.filter(owner_id=owner_id, term__in=query_terms | excluded_terms, resume_id__gt=cutoff)
+        .values_list("term")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    def estimate(clause):
+        return sum(min(df.get(term, 0) for term in phrase) for phrase in clause)
+
+    candidates = None
+    scored = {}
+    for clause in sorted(clauses, key=estimate):
+        if not estimate(clause):
+            return 0, []
+        terms = {term for phrase in clause for term in phrase}
+        postings = _fetch(owner_id, cutoff, terms, candidates, any(len(phrase) > 1 for phrase in clause))
+        matched = set().union(*(_phrase_matches(phrase, postings) for phrase in clause))
+        candidates = matched if candidates is None else candidates & matched
+        scored.update(postings)
+        if not candidates:
+            return 0, []
+    for phrase in excluded:
+        if all(df.get(term) for term in phrase):
+            postings = _fetch(owner_id, cutoff, set(phrase), candidates, len(phrase) > 1)
+            candidates -= _phrase_matches(phrase, postings)
+
+    stats = Resume.objects.filter(owner_id=owner_id, id__gt=cutoff, search_length__gt=0).aggregate(
+        count=Count("id"), total=Sum("search_length")
+    )
+    count = max(stats["count"] or 0, 1)
+    average_length = (stats["total"] or 0) / count or 1
+    idf = {term: math.log(1 + (count - df.get(term, 0) + 0.5) / (df.get(term, 0) + 0.5)) for term in query_terms}
+    scores = dict.fromkeys(candidates, 0.0)
+    for term, postings in scored.items():
+        for resume_id, (tf, length, _) in postings.items():
+            if resume_id in scores:
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[resume_id] += idf[term] * tf * (BM25_K1 + 1) / norm
+    top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: (item[1], item[0]))
+    return len(scores), top[offset:]
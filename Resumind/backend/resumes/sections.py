@@ -0,0 +1,84 @@
+import re
+
+# Heading text (lowercased, first part of "A / B" headings) -> section
+SECTION_HEADINGS = {
+    "summary": (
+        "summary", "professional summary", "profile", "professional profile", "objective",
+        "career objective", "about", "about me",
+    ),
+    "skills": (
+        "skills", "technical skills", "key skills", "core skills", "core competencies", "skills and tools",
+    ),
+    "education": (
+        "education", "academic background", "academics", "qualifications", "educational qualifications",
+        "academic qualifications",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "internships", "internship", "internship experience",
+    ),
+    "projects": ("projects", "academic projects", "personal projects", "key projects", "selected projects"),
+    "certifications": (
+        "certifications", "certification", "certificates", "licenses and certifications", "courses",
+        "courses and certifications",
+    ),
+    "other": (
+        "achievements", "awards", "hobbies", "interests", "languages", "publications", "volunteering",
+        "position of responsibility", "positions of responsibility", "extracurricular activities",
+        "extra-curricular activities", "references",
+    ),
+}
+
+_HEADING_LOOKUP = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+# A whole line that is a known heading, optionally followed by more names
+# ("ACHIEVEMENTS / HOBBIES") or by inline content ("Skills: Python, SQL")
+_HEADING_RE = re.compile(
+    r"^[ \t]*("
+    + "|".join(re.escape(h).replace(r"\ ", r"\s+") for h in sorted(_HEADING_LOOKUP, key=len, reverse=True))
+    + r")(?:[ \t]*(?:/|\||&|\band\b)[^\n:]*)?[ \t]*(?::[ \t]*([^\n]*))?$",
+    re.IGNORECASE | re.MULTILINE,
+)
+BULLET_RE = re.compile(r"^\s*(?:(?:[-•*▪●◦–]\s*)+|\d+[.)]\s+)")
+
+
+def split_sections(text: str) -> dict:
+    """
+    Resume text by section, found with one regex pass over the text. Text
+    before the first heading (name and contact details) is the "header"
+    section; a heading repeated later appends to its section.
+    """
+    sections = {}
+    section, position = "header", 0
+    for match in _HEADING_RE.finditer(text):
+        sections.setdefault(section, []).append(text[position:match.start()])
+        section = _HEADING_LOOKUP[" ".join(match.group(1).lower().split())]
+        position = match.end()
+        if match.group(2):
+            sections.setdefault(section, []).append(match.group(2))
+    sections.setdefault(section, []).append(text[position:])
+    return {name: "\n".join(parts).strip() for name, parts in sections.items()}
+
+
+def text_without(sections: dict, *names) -> str:
+    return "\n".join(text for name, text in sections.items() if name not in names)
+
+
+def _lines(text: str) -> list:
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def count_entries(text: str) -> int:
+    """
+    Items in a list section. When titles are followed by bullet points,
+    each run of non-bullet lines is one item; when every line is a bullet
+    (or none is), each line is one.
+    """
+    bullets = [bool(BULLET_RE.match(line)) for line in _lines(text)]
+    if all(bullets) or not any(bullets):
+        return len(bullets)
+    return sum(1 for i, bullet in enumerate(bullets) if not bullet and (i == 0 or bullets[i - 1]))
+
+
+def entries(text: str) -> list:
+    items = (BULLET_RE.sub("", line).strip() for line in _lines(text))
+    return [item for item in items if item]
@@ -1,9 +1,8 @@
 from rest_framework import serializers
-from .models import Resume
-import json
+from .models import Resume, UploadBatch
+import os
 
 class ResumeSerializer(serializers.ModelSerializer):
-    summary = serializers.SerializerMethodField()
     file_url = serializers.SerializerMethodField()
 
     class Meta:
@@ -21,14 +20,73 @@ class ResumeSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["uploaded_at", "parsed_text", "skills", "summary", "status"]
 
-    def get_summary(self, obj):
-        try:
-            return json.loads(obj.summary) if obj.summary else {}
-        except Exception:
-            return {}
+    def get_file_url(self, obj):
+        request = self.context.get("request")
+        if obj.file and hasattr(obj.file, "url"):
+            return request.build_absolute_uri(obj.file.url) if request else obj.file.url
+        return None
+
+class ResumeListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight row for listings. Pass fields=[...] to serialize a subset;
+    the full parsed text is only served by resume_detail.
+    """
+
+    # Model columns each listed field reads, for only()
+    SOURCE_COLUMNS = {
+        "id": ("id",),
+        "name": ("summary", "file"),
+        "file_url": ("file",),
+        "uploaded_at": ("uploaded_at",),
+        "status": ("status",),
+        "skills": ("skills",),
+    }
+
+    name = serializers.SerializerMethodField()
+    file_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Resume
+        fields = ["id", "name", "file_url", "uploaded_at", "status", "skills"]
+        read_only_fields = fields
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def columns_for(cls, fields):
+        return {column for field in fields for column in cls.SOURCE_COLUMNS[field]}
+
+    def get_name(self, obj):
+        return (obj.summary or {}).get("name") or os.path.basename(obj.file.name)
 
     def get_file_url(self, obj):
         request = self.context.get("request")
         if obj.file and hasattr(obj.file, "url"):
             return request.build_absolute_uri(obj.file.url) if request else obj.file.url
         return None
+
+class UploadBatchSerializer(serializers.ModelSerializer):
+    pending = serializers.IntegerField(read_only=True)
+    done = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadBatch
+        fields = [
+            "id",
+            "created_at",
+            "finished_at",
+            "total",
+            "processed",
+            "duplicates",
+            "failed",
+            "pending",
+            "done",
+        ]
+        read_only_fields = fields
+
+    def get_done(self, obj):
+        return obj.finished_at is not None
@@ -0,0 +1,218 @@
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from jobs.storage import get_criteria
+from reports.utils import score_resumes
+from .models import IDENTITY_FIELDS, Resume, ResumeSkill, UploadBatch
+from .extraction import iter_extracted_texts
+from .cache import get_parse_cache
+from .embeddings import embed_resumes
+from .search import index_resumes
+from .utils import delete_resumes_by_ids
+from .parsing import PARSER_VERSION, identity_fields, parse_resume_text
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Process pool shared by all batches of this server process. Workers are
+    spawned rather than forked so they never inherit DB connections.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.RESUME_INGEST_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def enqueue_batch(batch_id):
+    """
+    Process a batch in the background; the upload request returns at once.
+    """
+    thread = threading.Thread(
+        target=process_batch,
+        args=(batch_id,),
+        name=f"resume-batch-{batch_id}",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def process_batch(batch_id):
+    """
+    Parse and store every pending resume of a batch. Files already in the
+    parse cache are stored straight away; the rest are extracted in the
+    worker pool and stored as soon as each text is ready. Pending rows are
+    the durable queue, so an interrupted batch can simply be processed again.
+    """
+    try:
+        to_extract = []
+        for resume in Resume.objects.filter(batch_id=batch_id, status="pending"):
+            cached = cached_result(resume.content_hash)
+            if cached:
+                _store_or_fail(resume, *cached)
+            else:
+                to_extract.append(resume)
+        sources = [
+            (default_storage.path(resume.file.name), os.path.splitext(resume.file.name)[1].lower())
+            for resume in to_extract
+        ]
+        texts = iter_extracted_texts(
+            get_executor(),
+            sources,
+            timeout=settings.RESUME_EXTRACT_TIMEOUT,
+            pages_per_task=settings.RESUME_PDF_PAGES_PER_TASK,
+            workers=settings.RESUME_INGEST_WORKERS,
+        )
+        done = 0
+        try:
+            for resume, text in zip(to_extract, texts):
+                details = parse_and_cache(resume.content_hash, text)
+                _store_or_fail(resume, text, details)
+                done += 1
+        except BrokenProcessPool:
+            _reset_executor()
+            for resume in to_extract[done:]:
+                _discard(resume, "failed")
+    except Exception:
+        logger.exception("Processing batch %s stopped early", batch_id)
+    finally:
+        try:
+            UploadBatch.objects.filter(pk=batch_id).update(finished_at=timezone.now())
+        finally:
+            connection.close()
+
+
+def _store_or_fail(resume, text, details):
+    """
+    Store one result; a resume that cannot be stored (e.g. its row was
+    deleted meanwhile) counts as failed instead of ending the batch.
+    """
+    try:
+        _store_result(resume, text, details)
+    except Exception:
+        logger.exception("Could not store resume %s", resume.pk)
+        try:
+            _discard(resume, "failed")
+        except Exception:
+            logger.exception("Could not discard resume %s", resume.pk)
+
+
+def parse_and_cache(digest, text):
+    """
+    Parsed details of an extracted text, stored in the parse cache under
+    the file's digest; None when there is no text or parsing fails.
+    """
+    if text is None:
+        return None
+    try:
+        details = parse_resume_text(text)
+    except Exception:
+        return None
+    if digest:
+        get_parse_cache().put(digest, {"parser_version": PARSER_VERSION, "text": text, "details": details})
+    return details
+
+
+def cached_result(digest):
+    """
+    (text, details) for a previously seen file, reparsing the cached text
+    when the parser changed since it was stored.
+    """
+    record = get_parse_cache().get(digest) if digest else None
+    if not record or not isinstance(record.get("text"), str):
+        return None
+    details = record.get("details")
+    if record.get("parser_version") != PARSER_VERSION:
+        details = parse_and_cache(digest, record["text"])
+    if details is None:
+        return None
+    return record["text"], details
+
+
+def _store_result(resume, text, details):
+    if details is None:
+        _discard(resume, "failed")
+        return
+
+    for field, value in identity_fields(details).items():
+        setattr(resume, field, value)
+    if resume.find_duplicate():
+        _discard(resume, "duplicates")
+        return
+
+    resume.parsed_text = text[:20000]
+    resume.skills = ", ".join(details.get("skills", []))
+    resume.certifications = list(details.get("certifications", []))
+    resume.education = details.get("education", "")
+    resume.projects = details.get("projects_count", 0)
+    resume.experience_years = details.get("experience_years", 0) or 0
+    resume.summary = details
+    resume.status = "processed"
+    with transaction.atomic():
+        Resume.objects.filter(pk=resume.pk).update(
+            parsed_text=resume.parsed_text,
+            skills=resume.skills,
+            certifications=resume.certifications,
+            education=resume.education,
+            projects=resume.projects,
+            experience_years=resume.experience_years,
+            summary=resume.summary,
+            status=resume.status,
+            parsed_at=timezone.now(),
+            **{field: getattr(resume, field) for field in IDENTITY_FIELDS},
+        )
+        ResumeSkill.objects.filter(resume_id=resume.pk).delete()
+        ResumeSkill.objects.bulk_create(
+            [ResumeSkill(resume_id=resume.pk, skill_id=skill_id) for skill_id in details.get("skill_ids", [])],
+            ignore_conflicts=True,
+        )
+        index_resumes([resume])
+    UploadBatch.objects.filter(pk=resume.batch_id).update(processed=F("processed") + 1)
+    score_resumes([resume], get_criteria(resume.owner_id))
+    embed_or_log([resume])
+
+
+def embed_or_log(resumes):
+    """
+    Embed stored resumes, logging instead of raising on failure: a resume
+    without a vector is only missing from semantic search, and manage.py
+    build_embeddings fills such gaps later.
+    """
+    try:
+        embed_resumes(resumes)
+    except Exception:
+        logger.exception("Could not embed resumes %s", [resume.pk for resume in resumes])
+
+
+def _discard(resume, counter):
+    """
+    Delete a rejected resume, its file going through a tombstone like any
+    other deletion, and count it in the batch.
+    """
+    delete_resumes_by_ids(resume.owner_id, [resume.pk], wait=True)
+    UploadBatch.objects.filter(pk=resume.batch_id).update(**{counter: F(counter) + 1})
@@ -1,3 +1,693 @@
-from django.test import TestCase  # noqa: F401
+import json
+import time
+from datetime import timedelta
+import os
+import shutil
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from reports.models import Report
+from taxonomy.index import get_skill_index
+from . import embeddings, extraction, importer, pdf_backends, tasks, views
+from .cache import ParseCache
+from .parsing import PARSER_VERSION, _extract_experience_years, identity_fields, parse_resume_text
+from .search import index_resumes, parse_query, search_resumes
+from .sections import count_entries, split_sections
+from .models import FileTombstone, Resume, ResumeSkill, SearchPosting, UploadBatch
+from .utils import delete_resumes_by_ids, sweep_file_tombstones
 
-# Create your tests here.
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class UploadBatchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_no_batch_when_every_file_is_skipped(self):
+        content = b"Alice\nPython developer"
+        Resume.objects.create(
+            owner=self.user, file="resumes/alice.txt", status="processed",
+            content_hash=hashlib.sha256(content).hexdigest(),
+        )
+        files = [SimpleUploadedFile("again.txt", content), SimpleUploadedFile("notes.xyz", b"x")]
+        response = self.client.post("/api/resumes/upload/", {"files": files}, format="multipart")
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(response.data["batch_id"])
+        self.assertEqual(
+            [item["status"] for item in response.data["extracted"]], ["skipped_duplicate", "skipped_unsupported"]
+        )
+        self.assertFalse(UploadBatch.objects.exists())
+
+    @mock.patch("resumes.views.enqueue_batch")
+    def test_large_upload_is_streamed_from_its_temp_file(self, enqueue):
+        spool = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, spool, ignore_errors=True)
+        # Several hash chunks, far above the in-memory limit
+        content = b"Asha Kumar\nPython developer\n" * 100000
+        spooled = []
+        real_hash = views._content_hash
+
+        def content_hash(file):
+            spooled.append(isinstance(file, TemporaryUploadedFile))
+            return real_hash(file)
+
+        with override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=1024, FILE_UPLOAD_TEMP_DIR=spool), \
+                mock.patch.object(views, "_content_hash", side_effect=content_hash):
+            response = self.client.post(
+                "/api/resumes/upload/", {"files": [SimpleUploadedFile("asha.txt", content)]}, format="multipart"
+            )
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(spooled, [True])
+        resume = Resume.objects.get(pk=response.data["extracted"][0]["id"])
+        self.assertEqual(resume.content_hash, hashlib.sha256(content).hexdigest())
+        with default_storage.open(resume.file.name, "rb") as f:
+            self.assertEqual(f.read(), content)
+        enqueue.assert_called_once_with(response.data["batch_id"])
+
+    @mock.patch.object(tasks, "connection")
+    def test_store_error_fails_one_resume_and_finishes_batch(self, _connection):
+        batch = UploadBatch.objects.create(owner=self.user, total=2)
+        for name in ("a", "b"):
+            Resume.objects.create(
+                owner=self.user, file=f"resumes/{name}.txt", batch=batch, status="pending", content_hash=name
+            )
+        stored = []
+
+        def store(resume, text, details):
+            if resume.content_hash == "a":
+                raise IntegrityError("row went away")
+            stored.append(resume.content_hash)
+
+        with mock.patch.object(tasks, "cached_result", return_value=("text", {})), \
+                mock.patch.object(tasks, "_store_result", side_effect=store), \
+                self.assertLogs("resumes.tasks", "ERROR"):
+            tasks.process_batch(batch.pk)
+        batch.refresh_from_db()
+        self.assertEqual(stored, ["b"])
+        self.assertEqual(batch.failed, 1)
+        self.assertIsNotNone(batch.finished_at)
+        self.assertFalse(Resume.objects.filter(content_hash="a").exists())
+
+
+def _slow_text(path):
+    time.sleep(float(path))
+    return f"text {path}"
+
+
+class ExtractionTimeoutTests(TestCase):
+    def extract(self, delays, timeout, workers):
+        plan = mock.patch.object(extraction, "_plan", side_effect=lambda path, ext, pages: [(_slow_text, (path,))])
+        with plan, ThreadPoolExecutor(workers) as executor:
+            return list(extraction.iter_extracted_texts(
+                executor, [(str(delay), ".txt") for delay in delays], timeout=timeout, workers=workers
+            ))
+
+    def test_timeout_counts_from_when_a_file_gets_a_worker(self):
+        # Queued behind each other on one worker, every file still fits its own timeout
+        self.assertEqual(self.extract([0.1, 0.1, 0.1], timeout=0.25, workers=1), ["text 0.1"] * 3)
+
+    def test_slow_file_yields_none_and_others_complete(self):
+        self.assertEqual(self.extract([0.5, 0.0, 0.0], timeout=0.2, workers=2), [None, "text 0.0", "text 0.0"])
+
+
+class ResumeListTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        other = User.objects.create_user("bob", "bob@example.com")
+        Resume.objects.create(owner=other, file="resumes/bob.txt", status="processed", content_hash="bob")
+        now = timezone.now()
+        for position in range(5):
+            resume = Resume.objects.create(
+                owner=self.user, file=f"resumes/r{position}.txt", status="processed", content_hash=f"r{position}"
+            )
+            # Two resumes share an upload time, so the id breaks the tie
+            Resume.objects.filter(pk=resume.pk).update(uploaded_at=now - timedelta(minutes=min(position, 3)))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_cursor_pages_cover_every_resume_once(self):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2, "fields": "id,uploaded_at", **({"cursor": cursor} if cursor else {})}
+            response = self.client.get("/api/resumes/", params)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(all(set(row) == {"id", "uploaded_at"} for row in response.data["results"]))
+            seen += [row["id"] for row in response.data["results"]]
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                break
+        expected = Resume.objects.filter(owner=self.user).order_by("-uploaded_at", "-id").values_list("id", flat=True)
+        self.assertEqual(seen, list(expected))
+
+    def test_bad_cursor_limit_and_fields_are_rejected(self):
+        for params in ({"cursor": "not-base64!"}, {"cursor": "WzFd"}, {"cursor": "WyJub3BlIiwgMV0="},
+                       {"limit": "ten"}, {"fields": "id,parsed_text"}):
+            response = self.client.get("/api/resumes/", params)
+            self.assertEqual(response.status_code, 400, params)
+
+
+class _FakeBackend(pdf_backends.PdfBackend):
+    def __init__(self, name, pages, layout=False, fail_open=False, fail_page=None):
+        self.name, self.pages, self.layout = name, pages, layout
+        self.fail_open, self.fail_page = fail_open, fail_page
+
+    def open(self, path):
+        if self.fail_open:
+            raise OSError("cannot open")
+        return self.pages
+
+    def page_count(self, handle):
+        return len(handle)
+
+    def page_text(self, handle, index):
+        if index == self.fail_page:
+            raise ValueError("bad page")
+        return handle[index]
+
+
+class PdfBackendTests(TestCase):
+    FAST_PAGES = ["short", "x" * 20 + " enough words on this page to be read as is", "tiny"]
+
+    def extract(self, *backends):
+        stats = {}
+        with mock.patch.dict(pdf_backends._backends):
+            for backend in backends:
+                pdf_backends.register_backend(backend)
+            text = pdf_backends.extract_pdf_text("x.pdf", backends=[b.name for b in backends], stats=stats)
+        return text.split("\n"), stats
+
+    def test_layout_fallback_rereads_garbled_pages(self):
+        layout_pages = [f"page {i} read with layout analysis, long enough to keep" for i in range(3)]
+        pages, stats = self.extract(
+            _FakeBackend("test-fast", self.FAST_PAGES), _FakeBackend("test-layout", layout_pages, layout=True)
+        )
+        self.assertEqual(pages, [layout_pages[0], self.FAST_PAGES[1], layout_pages[2]])
+        self.assertEqual(stats, {"test-layout": 2, "test-fast": 1})
+
+    def test_fallback_failure_keeps_fast_path_text(self):
+        layout_pages = ["ok"] * 3
+        for broken in (_FakeBackend("test-layout", layout_pages, layout=True, fail_open=True),
+                       _FakeBackend("test-layout", layout_pages, layout=True, fail_page=0)):
+            pages, _ = self.extract(_FakeBackend("test-fast", self.FAST_PAGES), broken)
+            self.assertEqual(pages[:2], self.FAST_PAGES[:2])
+
+    def test_backend_must_implement_page_access(self):
+        with self.assertRaises(TypeError):
+            type("Partial", (pdf_backends.PdfBackend,), {"open": lambda self, path: None})()
+
+    def test_kerned_punctuation(self):
+        cases = {
+            "Python , Django .": "Python, Django.",
+            "Led migration ;\nnext": "Led migration;\nnext",
+            "C# .NET developer": "C# .NET developer",
+            "run with -x flag": "run with -x flag",
+            "B.Tech (2020 -2024)": "B.Tech (2020-2024)",
+            "pooja.deshmukh@gmail .com | +91": "pooja.deshmukh@gmail.com | +91",
+        }
+        for raw, expected in cases.items():
+            self.assertEqual(pdf_backends.join_kerned(raw), expected)
+
+
+class ExperienceYearsTests(TestCase):
+    def test_overlapping_ranges_are_merged(self):
+        text = "Engineer, Acme  Jan 2018 - Dec 2019\nConsultant, Beta  Jun 2019 - Jun 2020"
+        self.assertEqual(_extract_experience_years(text), 2.4)
+
+    def test_disjoint_ranges_are_summed(self):
+        self.assertEqual(_extract_experience_years("Acme 2015 - 2016\nBeta March 2018 to March 2019"), 2.0)
+
+    def test_open_range_runs_to_today(self):
+        today = timezone.now()
+        months = (today.year - 2020) * 12 + today.month - 1
+        self.assertEqual(_extract_experience_years("Acme Jan 2020 - Present"), round(months / 12, 1))
+
+    def test_backwards_ranges_are_ignored_and_stated_years_used(self):
+        self.assertEqual(_extract_experience_years("Acme 2020 - 2018"), 0)
+        self.assertEqual(_extract_experience_years("Over 5 years of backend work"), 5.0)
+
+    def test_education_dates_do_not_count(self):
+        text = "Asha Rao\nasha@example.com\nEDUCATION\nB.Tech, Delhi University 2016 - 2020\n"
+        self.assertEqual(parse_resume_text(text)["experience_years"], 0)
+        text = "Asha Rao\nEDUCATION\nB.Tech 2016 - 2020\nPROJECTS\nShop, Jan 2021 - Jan 2023\n"
+        self.assertEqual(parse_resume_text(text)["experience_years"], 2.0)
+        text += "EXPERIENCE\nDeveloper, Acme  Mar 2023 - Mar 2024\n"
+        self.assertEqual(parse_resume_text(text)["experience_years"], 1.0)
+
+
+class SplitSectionsTests(TestCase):
+    def test_headings_split_the_text(self):
+        text = (
+            "Asha Rao\nasha@example.com\n"
+            "PROFESSIONAL SUMMARY\nBackend developer.\n"
+            "Technical   Skills: Python, SQL\n"
+            "Work Experience\nAcme 2020 - 2022\n"
+            "ACHIEVEMENTS / HOBBIES\nChess\n"
+            "experience\nBeta 2022 - 2023\n"
+        )
+        sections = {name: section.split() for name, section in split_sections(text).items()}
+        self.assertEqual(sections, {
+            "header": ["Asha", "Rao", "asha@example.com"],
+            "summary": ["Backend", "developer."],
+            "skills": ["Python,", "SQL"],
+            "experience": ["Acme", "2020", "-", "2022", "Beta", "2022", "-", "2023"],
+            "other": ["Chess"],
+        })
+
+    def test_heading_words_inside_sentences_do_not_split(self):
+        text = "Asha Rao\nGained experience in Python projects\nSkills matter"
+        self.assertEqual(split_sections(text), {"header": text})
+
+    def test_count_entries(self):
+        self.assertEqual(count_entries("- Shop\n- Chat app\n- Blog"), 3)
+        self.assertEqual(count_entries("Shop\n- Django\n- React\nChat app\n- WebSockets"), 2)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ImportChunkTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.batch = UploadBatch.objects.create(owner=self.user)
+        source = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source, ignore_errors=True)
+        for name, email in (("asha.txt", "asha@example.com"), ("ravi.txt", "ravi@example.com")):
+            with open(os.path.join(source, name), "w") as f:
+                f.write(f"{name[:4].title()} Kumar\n{email}\nSKILLS\nPython, SQL\n")
+        self.files = list(importer.iter_resume_files(source))
+        for patch in (
+            mock.patch.object(importer, "cached_result", return_value=None),
+            mock.patch.object(importer, "parse_and_cache", side_effect=lambda digest, text: parse_resume_text(text)),
+            mock.patch.object(importer, "embed_or_log"),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def import_chunk(self):
+        with ThreadPoolExecutor(2) as executor:
+            return importer.import_chunk(self.user, self.batch, self.files, executor, set(), workers=2)
+
+    def test_committed_files_are_not_tombstoned(self):
+        self.assertEqual(self.import_chunk()["imported"], 2)
+        names = list(Resume.objects.values_list("file", flat=True))
+        self.assertTrue(all(os.path.exists(os.path.join(MEDIA_ROOT, name)) for name in names))
+        self.assertFalse(FileTombstone.objects.exists())
+
+    def test_failed_insert_leaves_neither_files_nor_tombstones(self):
+        folder = os.path.join(MEDIA_ROOT, "resumes")
+        os.makedirs(folder, exist_ok=True)
+        before = set(os.listdir(folder))
+        with mock.patch.object(importer, "index_resumes", side_effect=RuntimeError("index down")):
+            with self.assertRaises(RuntimeError):
+                self.import_chunk()
+        self.assertEqual(set(os.listdir(folder)), before)
+        self.assertFalse(Resume.objects.exists())
+        self.assertFalse(FileTombstone.objects.exists())
+
+
+class SearchTests(TestCase):
+    TEXTS = {
+        "django": "Backend developer building REST APIs with Django and PostgreSQL",
+        "flask": "Python developer, Flask and Django REST framework, machine learning",
+        "ml": "Machine learning engineer: Python, PyTorch, learning machine models",
+        "java": "Java developer with Spring Boot",
+    }
+
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        other = User.objects.create_user("bob", "bob@example.com")
+        self.ids = {}
+        resumes = []
+        for key, text in self.TEXTS.items():
+            resume = Resume.objects.create(
+                owner=self.user, file=f"resumes/{key}.txt", status="processed", content_hash=key, parsed_text=text
+            )
+            self.ids[key] = resume.pk
+            resumes.append(resume)
+        resumes.append(Resume.objects.create(
+            owner=other, file="resumes/bob.txt", status="processed", content_hash="bob", parsed_text="Django developer"
+        ))
+        index_resumes(resumes)
+
+    def search(self, query):
+        total, matches = search_resumes(self.user, query)
+        self.assertEqual(total, len(matches))
+        by_id = {pk: key for key, pk in self.ids.items()}
+        return {by_id[pk] for pk, _ in matches}
+
+    def test_parse_query(self):
+        self.assertEqual(
+            parse_query('python "machine learning" OR pytorch -java NOT "spring boot" AND'),
+            ([[("python",)], [("machine", "learning"), ("pytorch",)]], [("java",), ("spring", "boot")]),
+        )
+        self.assertEqual(parse_query("OR -java NOT"), ([], [("java",)]))
+
+    def test_words_must_all_match(self):
+        self.assertEqual(self.search("developer django"), {"django", "flask"})
+        self.assertEqual(self.search("django cobol"), set())
+
+    def test_phrases_need_adjacent_terms(self):
+        self.assertEqual(self.search('"machine learning"'), {"flask", "ml"})
+        self.assertEqual(self.search('"learning machine"'), {"ml"})
+        self.assertEqual(self.search('"django postgresql"'), set())
+
+    def test_or_and_exclusions(self):
+        self.assertEqual(self.search("flask OR spring"), {"flask", "java"})
+        self.assertEqual(self.search("developer -django"), {"java"})
+        self.assertEqual(self.search('developer NOT "rest framework"'), {"django", "java"})
+
+    def test_exclusion_only_query_matches_nothing(self):
+        self.assertEqual(search_resumes(self.user, "-java"), (0, []))
+        self.assertEqual(search_resumes(self.user, "NOT java OR"), (0, []))
+
+    def test_scores_rank_denser_matches_first(self):
+        _, matches = search_resumes(self.user, "learning")
+        self.assertEqual(matches[0][0], self.ids["ml"])
+        self.assertGreater(matches[0][1], matches[1][1])
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class DeleteResumesTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.other = User.objects.create_user("bob", "bob@example.com")
+        self.resumes = [self.resume(self.user, f"delete-{i}") for i in range(3)]
+        self.foreign = self.resume(self.other, "delete-bob")
+
+    def resume(self, owner, key):
+        name = default_storage.save(f"resumes/{key}.txt", ContentFile(b"Python developer"))
+        resume = Resume.objects.create(
+            owner=owner, file=name, status="processed", content_hash=key, parsed_text="Python developer"
+        )
+        ResumeSkill.objects.create(resume=resume, skill_id=1)
+        Report.objects.create(resume=resume, owner=owner, uploaded_at=resume.uploaded_at, score=1)
+        index_resumes([resume])
+        return resume
+
+    def exists(self, resume):
+        return default_storage.exists(resume.file.name)
+
+    def test_rows_cascade_and_files_are_unlinked(self):
+        doomed = self.resumes[:2]
+        ids = [resume.pk for resume in doomed] + [self.foreign.pk]
+        self.assertEqual(delete_resumes_by_ids(self.user, ids, wait=True), 2)
+        self.assertEqual(set(Resume.objects.values_list("pk", flat=True)), {self.resumes[2].pk, self.foreign.pk})
+        for model in (ResumeSkill, Report, SearchPosting):
+            self.assertFalse(model.objects.filter(resume_id__in=[r.pk for r in doomed]).exists(), model.__name__)
+        self.assertEqual([self.exists(r) for r in self.resumes + [self.foreign]], [False, False, True, True])
+        self.assertFalse(FileTombstone.objects.exists())
+
+    def test_tombstones_outlive_the_rows_until_swept(self):
+        with mock.patch("resumes.utils.threading.Thread"):
+            self.assertEqual(delete_resumes_by_ids(self.user, [self.resumes[0].pk]), 1)
+        self.assertEqual(list(FileTombstone.objects.values_list("name", flat=True)), [self.resumes[0].file.name])
+        self.assertTrue(self.exists(self.resumes[0]))
+        self.assertEqual(sweep_file_tombstones([self.resumes[0].file.name]), 1)
+        self.assertFalse(self.exists(self.resumes[0]))
+        self.assertFalse(FileTombstone.objects.exists())
+
+    def test_discarded_upload_is_tombstoned_until_its_file_is_gone(self):
+        batch = UploadBatch.objects.create(owner=self.user, total=1)
+        resume = self.resumes[0]
+        Resume.objects.filter(pk=resume.pk).update(batch=batch)
+        resume.batch_id = batch.pk
+        with mock.patch("resumes.utils._unlink", return_value=False):
+            tasks._discard(resume, "failed")
+        self.assertFalse(Resume.objects.filter(pk=resume.pk).exists())
+        self.assertEqual(UploadBatch.objects.get(pk=batch.pk).failed, 1)
+        # The unlink failed, so the tombstone stays for the next sweep
+        self.assertEqual(list(FileTombstone.objects.values_list("name", flat=True)), [resume.file.name])
+        self.assertEqual(sweep_file_tombstones([resume.file.name]), 1)
+        self.assertFalse(self.exists(resume))
+
+    def test_sweep_keeps_files_that_are_in_use(self):
+        FileTombstone.objects.create(name=self.resumes[1].file.name)
+        self.assertEqual(sweep_file_tombstones([self.resumes[1].file.name]), 0)
+        self.assertTrue(self.exists(self.resumes[1]))
+        self.assertFalse(FileTombstone.objects.exists())
+
+
+class ParseCacheTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def record(self, n):
+        return {"parser_version": PARSER_VERSION, "text": "x" * 100, "details": {"n": n}}
+
+    def test_get_and_put(self):
+        cache = ParseCache(self.directory, 1 << 20)
+        self.assertIsNone(cache.get("ab" * 32))
+        cache.put("ab" * 32, self.record(1))
+        self.assertEqual(cache.get("ab" * 32), self.record(1))
+
+    def test_evicts_least_recently_read_when_over_the_cap(self):
+        digests = [c * 64 for c in "abcd"]
+        size = len(json.dumps(self.record(0)).encode())
+        cache = ParseCache(self.directory, int(size * 3.5))
+        for position, digest in enumerate(digests[:3]):
+            cache.put(digest, self.record(position))
+            os.utime(cache._path(digest), (1000 + position, 1000 + position))
+        self.assertIsNotNone(cache.get(digests[0]))  # a read makes the oldest entry the newest
+        cache.put(digests[3], self.record(3))
+        self.assertEqual([cache.get(d) is not None for d in digests], [True, False, True, True])
+
+    def test_cached_result_reparses_after_a_parser_change(self):
+        cache = ParseCache(self.directory, 1 << 20)
+        text = "Asha Kumar\nasha@example.com\nSKILLS\nPython, SQL\n"
+        fresh, stale = "cd" * 32, "ef" * 32
+        cache.put(fresh, {"parser_version": PARSER_VERSION, "text": text, "details": {"skills": ["cached"]}})
+        cache.put(stale, {"parser_version": PARSER_VERSION - 1, "text": text, "details": {"skills": ["old"]}})
+        with mock.patch.object(tasks, "get_parse_cache", return_value=cache):
+            with mock.patch.object(tasks, "parse_resume_text", wraps=parse_resume_text) as parse:
+                self.assertEqual(tasks.cached_result(fresh), (text, {"skills": ["cached"]}))
+                parse.assert_not_called()
+                _, details = tasks.cached_result(stale)
+                parse.assert_called_once_with(text)
+        self.assertEqual(details, parse_resume_text(text))
+        self.assertEqual(cache.get(stale)["parser_version"], PARSER_VERSION)
+        self.assertIsNone(tasks.cached_result(None))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class DuplicateResumeTests(TestCase):
+    DETAILS = {
+        "name": "Asha  Kumar",
+        "email": "Asha@Example.com",
+        "phone": "+91 98765-43210",
+        "linkedin": "https://www.linkedin.com/in/asha-k/",
+        "github": "https://github.com/AshaK",
+    }
+
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.other = User.objects.create_user("bob", "bob@example.com")
+        self.original = Resume.objects.create(
+            owner=self.user, file="resumes/asha.pdf", status="processed", content_hash="asha",
+            **identity_fields(self.DETAILS),
+        )
+
+    def pending(self, owner, **identity):
+        return Resume(owner=owner, file="resumes/new.pdf", content_hash="new", **identity)
+
+    def test_any_shared_identity_value_is_a_duplicate(self):
+        for key in ("name", "email", "phone", "linkedin", "github"):
+            details = {key: self.DETAILS[key]}
+            self.assertEqual(self.pending(self.user, **identity_fields(details)).find_duplicate(), self.original, key)
+        self.assertEqual(self.pending(self.user, email_normalized="asha@example.com").find_duplicate(), self.original)
+        self.assertIsNone(self.pending(self.user, email_normalized="ravi@example.com").find_duplicate())
+        self.assertIsNone(self.pending(self.user).find_duplicate())
+
+    def test_other_owners_are_not_duplicates(self):
+        resume = self.pending(self.other, **identity_fields(self.DETAILS))
+        self.assertIsNone(resume.find_duplicate())
+        resume.save()
+        with self.assertRaises(ValidationError):
+            self.pending(self.user, phone_normalized="9876543210").save()
+
+    @mock.patch.object(tasks, "embed_or_log")
+    def test_processing_rejects_a_duplicate_upload(self, _embed):
+        batch = UploadBatch.objects.create(owner=self.user, total=2)
+        text = "Asha Kumar\nasha@example.com\nSKILLS\nPython, SQL\n"
+        names = [default_storage.save(f"resumes/{key}.txt", ContentFile(text.encode())) for key in ("dup", "new")]
+        duplicate = Resume.objects.create(owner=self.user, file=names[0], batch=batch, content_hash="dup")
+        fresh = Resume.objects.create(owner=self.other, file=names[1], batch=batch, content_hash="new")
+        details = parse_resume_text(text)
+        tasks._store_result(duplicate, text, details)
+        tasks._store_result(fresh, text, details)
+        batch.refresh_from_db()
+        self.assertEqual((batch.processed, batch.duplicates), (1, 1))
+        self.assertEqual(set(Resume.objects.values_list("pk", flat=True)), {self.original.pk, fresh.pk})
+        self.assertEqual([default_storage.exists(name) for name in names], [False, True])
+        self.assertFalse(FileTombstone.objects.exists())
+
+
+class MigrationTestCase(TransactionTestCase):
+    """
+    Migrates the resumes app back to migrate_from, lets the test insert
+    rows through the historical models in self.apps, then migrate() applies
+    migrate_to. The schema is brought back to the latest state afterwards.
+    """
+    migrate_from = migrate_to = None
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("resumes", self.migrate_from)])
+        self.apps = executor.loader.project_state([("resumes", self.migrate_from)]).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("resumes", self.migrate_to)])
+        return executor.loader.project_state([("resumes", self.migrate_to)]).apps
+
+    def create_user(self):
+        return self.apps.get_model("accounts", "User").objects.create(username="alice")
+
+
+class BackfillIdentityMigrationTests(MigrationTestCase):
+    migrate_from = "0008_resume_identity_fields"
+    migrate_to = "0009_backfill_resume_identity_fields"
+
+    def test_backfill_matches_identity_fields(self):
+        owner = self.create_user()
+        Resume = self.apps.get_model("resumes", "Resume")
+        summaries = {"parsed": json.dumps(DuplicateResumeTests.DETAILS), "empty": "", "broken": "{not json"}
+        ids = {
+            key: Resume.objects.create(owner=owner, file=f"resumes/{key}.pdf", summary=summary).pk
+            for key, summary in summaries.items()
+        }
+        Resume = self.migrate().get_model("resumes", "Resume")
+        columns = list(identity_fields({}))
+        parsed = Resume.objects.values(*columns).get(pk=ids["parsed"])
+        self.assertEqual(parsed, identity_fields(DuplicateResumeTests.DETAILS))
+        for key in ("empty", "broken"):
+            self.assertEqual(Resume.objects.values(*columns).get(pk=ids[key]), identity_fields({}), key)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, RESUME_EMBEDDING_MODEL="")
+class SimilarResumesTests(TestCase):
+    TEXTS = {
+        "kube": "DevOps engineer running Kubernetes clusters, Terraform and Docker",
+        "ml": "Data scientist: Machine Learning with Python and PyTorch",
+        "web": "Frontend developer building React apps in JavaScript",
+    }
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        settings = override_settings(RESUME_EMBEDDING_DIR=directory)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        patch = mock.patch.object(embeddings, "_index", None)
+        patch.start()
+        self.addCleanup(patch.stop)
+        embeddings.get_encoder.cache_clear()
+        self.addCleanup(embeddings.get_encoder.cache_clear)
+        self.user = User.objects.create_user("alice", "alice@example.com")
+        self.other = User.objects.create_user("bob", "bob@example.com")
+        self.resumes = {key: self.resume(self.user, key, text) for key, text in self.TEXTS.items()}
+        self.foreign = self.resume(self.other, "bob-kube", self.TEXTS["kube"])
+        embeddings.embed_resumes([*self.resumes.values(), self.foreign])
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def resume(self, owner, key, text):
+        return Resume.objects.create(
+            owner=owner, file=f"resumes/{key}.txt", status="processed", content_hash=key, parsed_text=text
+        )
+
+    def similar(self, **params):
+        response = self.client.get("/api/resumes/similar/", params)
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_results_are_scoped_to_the_owner(self):
+        ids = self.similar(q="Kubernetes Terraform Docker", k=10)
+        self.assertEqual(sorted(ids), sorted(r.pk for r in self.resumes.values()))
+        self.assertEqual(ids[0], self.resumes["kube"].pk)
+        self.assertEqual(
+            [resume_id for resume_id, _ in embeddings.similar_resumes(self.other, "Kubernetes", 10)], [self.foreign.pk]
+        )
+
+    def test_alias_matches_its_canonical_skill(self):
+        self.assertEqual(self.similar(q="K8s", k=1), [self.resumes["kube"].pk])
+        self.assertEqual(self.similar(q="ML", k=1), [self.resumes["ml"].pk])
+
+    def test_stale_and_deleted_rows_are_skipped(self):
+        kube, web = self.resumes["kube"], self.resumes["web"]
+        old_row = kube.embedding_row
+        kube.parsed_text = self.TEXTS["ml"]
+        embeddings.embed_resumes([kube])
+        self.assertNotEqual(kube.embedding_row, old_row)
+        Resume.objects.filter(pk=web.pk).delete()
+        ids = self.similar(q="Kubernetes Terraform Docker", k=10)
+        self.assertEqual(sorted(ids), sorted([kube.pk, self.resumes["ml"].pk]))
+        self.assertNotEqual(ids[0], kube.pk)
+
+    def test_requested_resume_is_left_out(self):
+        kube = self.resumes["kube"]
+        ids = self.similar(resume=kube.pk, k=2)
+        self.assertEqual(len(ids), 2)
+        self.assertNotIn(kube.pk, ids)
+        self.assertEqual(self.client.get("/api/resumes/similar/", {"resume": self.foreign.pk}).status_code, 404)
+
+
+class StructuredColumnsMigrationTests(MigrationTestCase):
+    migrate_from = "0010_resume_owner_recent_idx"
+    migrate_to = "0011_structured_profile_columns"
+
+    def test_existing_rows_are_converted(self):
+        owner = self.create_user()
+        Resume = self.apps.get_model("resumes", "Resume")
+        rows = {
+            "ids": ({"name": "Asha", "experience_years": 4.5, "skill_ids": [1, 7]}, "Java", "AWS, , PMP"),
+            "names": ({"name": "Ravi"}, "Python, Kubernetes, Klingon", ""),
+            "broken": ("{not json", "SQL", None),
+        }
+        ids = {
+            key: Resume.objects.create(
+                owner=owner, file=f"resumes/{key}.pdf",
+                summary=summary if isinstance(summary, str) else json.dumps(summary),
+                skills=skills, certifications=certifications,
+            ).pk
+            for key, (summary, skills, certifications) in rows.items()
+        }
+        apps = self.migrate()
+        Resume, ResumeSkill = apps.get_model("resumes", "Resume"), apps.get_model("resumes", "ResumeSkill")
+        converted = {
+            key: Resume.objects.values("summary", "certifications", "experience_years").get(pk=pk)
+            for key, pk in ids.items()
+        }
+        self.assertEqual(converted["ids"], {
+            "summary": rows["ids"][0], "certifications": ["AWS", "PMP"], "experience_years": 4.5,
+        })
+        self.assertEqual(converted["names"], {"summary": {"name": "Ravi"}, "certifications": [], "experience_years": 0})
+        self.assertEqual(converted["broken"], {"summary": {}, "certifications": [], "experience_years": 0})
+
+        def skills(key):
+            return sorted(ResumeSkill.objects.filter(resume_id=ids[key]).values_list("skill_id", flat=True))
+
+        index = get_skill_index()
+        self.assertEqual(skills("ids"), [1, 7])
+        self.assertEqual(skills("names"), sorted(index.ids_for(["Python", "Kubernetes"])))
+        self.assertEqual(skills("broken"), [index.id_for("SQL")])
@@ -1,9 +1,12 @@
 from django.urls import path
-from .views import ResumeUploadView, resume_list, resume_detail, resume_delete, resume_bulk_delete
+from .views import ResumeUploadView, resume_list, resume_detail, resume_delete, resume_bulk_delete, resume_search, resume_similar, upload_batch_detail
 
 urlpatterns = [
     path("upload/", ResumeUploadView.as_view(), name="resume-upload"),
+    path("batches/<int:pk>/", upload_batch_detail, name="upload-batch-detail"),
     path("", resume_list, name="resume-list"),
+    path("similar/", resume_similar, name="resume-similar"),
+    path("search/", resume_search, name="resume-search"),
     path("<int:pk>/", resume_detail, name="resume-detail"),
     path("<int:pk>/delete/", resume_delete, name="resume-delete"),
     path("bulk-delete/", resume_bulk_delete, name="resume-bulk-delete"),
@@ -1,24 +1,22 @@
-import re
 import os  # noqa: F401
-import pdfplumber # pyright: ignore[reportMissingImports]
+import threading
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from docx import Document # pyright: ignore[reportMissingImports]
-from resumes.models import Resume
+from resumes.models import FileTombstone, Resume
+from django.conf import settings
 from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.utils import timezone
+from taxonomy.index import get_skill_index
+from .pdf_backends import extract_pdf_text
 
-# basic keyword list for demo; extend with master list later
-SKILL_KEYWORDS = [
-    'python','django','flask','react','javascript','node','sql','mysql','mongodb',
-    'aws','azure','docker','kubernetes','pandas','numpy','tensorflow','nlp'
-]
+# A full sweep leaves newer tombstones alone: an import in progress
+# tombstones its files until their rows commit
+TOMBSTONE_GRACE = timedelta(minutes=10)
 
 def extract_text_from_pdf(path):
-    text = ""
-    with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            p = page.extract_text()
-            if p:
-                text += p + "\n"
-    return text
+    return extract_pdf_text(path)
 
 def extract_text_from_docx(path):
     doc = Document(path)
@@ -38,11 +36,8 @@ def extract_text_and_skills(path):
     except Exception as e:
         return "", [], {"error": str(e)}
 
-    lower = text.lower()
-    found = []
-    for kw in SKILL_KEYWORDS:
-        if re.search(r'\b' + re.escape(kw) + r'\b', lower):
-            found.append(kw)
+    index = get_skill_index()
+    found = index.names(index.find_ids(text))
 
     summary = {
         "length": len(text),
@@ -52,11 +47,65 @@ def extract_text_and_skills(path):
 # in resumes/utils.py
 
 
-def delete_resumes_by_ids(user, ids):
+def delete_resumes_by_ids(user, ids, wait=False):
+    """
+    Delete the user's resumes among ids. Only the file names are read;
+    the rows (with their reports, skills and postings, by cascade) go in
+    one transaction that also records a tombstone per file. The files are
+    then unlinked by a thread pool in the background, or right away with
+    wait=True. Returns the number of resumes deleted.
+    """
     resumes = Resume.objects.filter(id__in=ids, owner=user)
-    deleted_count = resumes.count()
-    for resume in resumes:
-        if resume.file and default_storage.exists(resume.file.name):
-            default_storage.delete(resume.file.name)
-    resumes.delete()
+    with transaction.atomic():
+        names = [name for name in resumes.values_list("file", flat=True) if name]
+        FileTombstone.objects.bulk_create([FileTombstone(name=name) for name in names], batch_size=1000)
+        deleted_count = resumes.only("id").delete()[1].get(Resume._meta.label, 0)
+    if names:
+        if wait:
+            sweep_file_tombstones(names)
+        else:
+            threading.Thread(target=_sweep_in_background, args=(names,), name="resume-file-sweep", daemon=True).start()
     return deleted_count
+
+
+def _sweep_in_background(names):
+    try:
+        sweep_file_tombstones(names)
+    finally:
+        connection.close()
+
+
+def _unlink(name):
+    try:
+        default_storage.delete(name)
+    except OSError:
+        return False
+    return True
+
+
+def sweep_file_tombstones(names=None, chunk_size=1000):
+    """
+    Unlink tombstoned files, the given names or all those older than
+    TOMBSTONE_GRACE, and drop their tombstones. A name that a live resume
+    uses again is only un-tombstoned, never unlinked. Returns the number of
+    files removed.
+    """
+    tombstones = FileTombstone.objects.all()
+    if names is not None:
+        tombstones = tombstones.filter(name__in=names)
+    else:
+        tombstones = tombstones.filter(created_at__lt=timezone.now() - TOMBSTONE_GRACE)
+    removed = 0
+    last_id = 0
+    with ThreadPoolExecutor(max_workers=settings.FILE_DELETE_WORKERS) as pool:
+        while True:
+            chunk = list(tombstones.filter(id__gt=last_id).order_by("id").values_list("id", "name")[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1][0]
+            live = set(Resume.objects.filter(file__in={name for _, name in chunk}).values_list("file", flat=True))
+            to_unlink = sorted({name for _, name in chunk} - live)
+            unlinked = {name for name, ok in zip(to_unlink, pool.map(_unlink, to_unlink)) if ok}
+            FileTombstone.objects.filter(id__in=[pk for pk, name in chunk if name in unlinked or name in live]).delete()
+            removed += len(unlinked)
+    return removed
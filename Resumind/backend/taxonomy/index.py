@@ -0,0 +1,110 @@
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+from .skills import SKILLS
+
+
+class Skill(NamedTuple):
+    id: int
+    name: str
+    category: str
+    aliases: tuple
+
+
+def normalize(term: str) -> str:
+    return " ".join((term or "").lower().split())
+
+
+def _trie_pattern(node: dict) -> str:
+    """
+    Regex for a character trie. Shared prefixes are factored out, so the
+    engine walks the trie instead of retrying every term at each position.
+    """
+    branches = []
+    for char in sorted(k for k in node if k):
+        char_re = r"\s+" if char == " " else re.escape(char)
+        branches.append(char_re + _trie_pattern(node[char]))
+    if not branches:
+        return ""
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+class SkillIndex:
+    """
+    Immutable in-memory view of the taxonomy: skills by ID, a lookup from
+    every normalized name and alias to its ID, and one compiled regex that
+    finds all of them in a single pass over a text. Matches must stand
+    alone, so "Java" is not found inside "JavaScript".
+    """
+
+    def __init__(self, entries):
+        skills = {}
+        lookup = {}
+        for skill_id, name, category, aliases in entries:
+            if skill_id in skills:
+                raise ValueError(f"Duplicate skill id {skill_id}")
+            skill = Skill(skill_id, sys.intern(name), sys.intern(category), tuple(sys.intern(a) for a in aliases))
+            skills[skill_id] = skill
+            for term in (name, *aliases):
+                key = sys.intern(normalize(term))
+                if lookup.setdefault(key, skill_id) != skill_id:
+                    raise ValueError(f"Skill term {term!r} is used by more than one skill")
+        self._skills = MappingProxyType(skills)
+        self._lookup = MappingProxyType(lookup)
+        self.max_id = max(skills, default=0)
+
+        trie = {}
+        for term in lookup:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self._regex = re.compile(r"(?<![\w+#])" + _trie_pattern(trie) + r"(?![\w+#])", re.IGNORECASE)
+
+    def __len__(self):
+        return len(self._skills)
+
+    def __iter__(self):
+        return iter(self._skills.values())
+
+    def get(self, skill_id):
+        return self._skills.get(skill_id)
+
+    def id_for(self, term):
+        return self._lookup.get(normalize(term))
+
+    def ids_for(self, terms):
+        """
+        IDs of the known terms, de-duplicated, in input order.
+        """
+        ids = {}
+        for term in terms:
+            skill_id = self._lookup.get(normalize(term))
+            if skill_id is not None:
+                ids.setdefault(skill_id, None)
+        return tuple(ids)
+
+    def names(self, ids):
+        return [self._skills[skill_id].name for skill_id in ids if skill_id in self._skills]
+
+    def find_ids(self, text):
+        """
+        IDs of every skill mentioned in text, in order of first appearance.
+        """
+        found = {}
+        for match in self._regex.finditer(text or ""):
+            skill_id = self._lookup.get(normalize(match.group(0)))
+            if skill_id is not None:
+                found.setdefault(skill_id, None)
+        return tuple(found)
+
+
+@lru_cache(maxsize=None)
+def get_skill_index():
+    return SkillIndex(SKILLS)
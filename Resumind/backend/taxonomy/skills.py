@@ -0,0 +1,143 @@
+# Canonical skill taxonomy: (id, name, category, aliases).
+# IDs are stored alongside parsed resumes; never renumber or reuse one.
+SKILLS = (
+    # Programming
+    (1, "Python", "Programming", ()),
+    (2, "Java", "Programming", ()),
+    (3, "Git", "Programming", ()),
+    (4, "C++", "Programming", ("cpp",)),
+    (5, "SQL", "Programming", ()),
+    (6, "JavaScript", "Programming", ("JS",)),
+    (7, "Django", "Programming", ()),
+    (8, "Flask", "Programming", ()),
+    (9, "React", "Programming", ("React.js", "ReactJS")),
+    (10, "Node.js", "Programming", ("NodeJS",)),
+    (11, "MySQL", "Programming", ()),
+    (12, "MongoDB", "Programming", ("Mongo",)),
+    # Data
+    (20, "Excel", "Data", ("MS Excel", "Microsoft Excel")),
+    (21, "Tableau", "Data", ()),
+    (22, "Analytics", "Data", ("Data Analytics",)),
+    (23, "Power BI", "Data", ("PowerBI",)),
+    (24, "Pandas", "Data", ()),
+    (25, "NumPy", "Data", ()),
+    (26, "TensorFlow", "Data", ()),
+    (27, "NLP", "Data", ("Natural Language Processing",)),
+    (28, "Data Entry", "Data", ()),
+    (29, "Machine Learning", "Data", ("ML",)),
+    # Cloud & DevOps
+    (40, "AWS", "Cloud & DevOps", ("Amazon Web Services",)),
+    (41, "Azure", "Cloud & DevOps", ("Microsoft Azure",)),
+    (42, "Docker", "Cloud & DevOps", ()),
+    (43, "Kubernetes", "Cloud & DevOps", ("k8s",)),
+    (44, "CI/CD", "Cloud & DevOps", ("CICD", "Continuous Integration")),
+    (45, "Terraform", "Cloud & DevOps", ()),
+    # Design
+    (60, "Figma", "Design", ()),
+    (61, "Adobe XD", "Design", ()),
+    (62, "Wireframing", "Design", ()),
+    (63, "Adobe Photoshop", "Design", ("Photoshop",)),
+    (64, "Illustrator", "Design", ("Adobe Illustrator",)),
+    (65, "Branding", "Design", ()),
+    (66, "Typography", "Design", ()),
+    (67, "Layout Design", "Design", ()),
+    (68, "Motion Graphics", "Design", ()),
+    (69, "Color Theory", "Design", ("Colour Theory",)),
+    # Video & Media
+    (80, "Premiere Pro", "Video & Media", ("Adobe Premiere", "Adobe Premiere Pro")),
+    (81, "After Effects", "Video & Media", ("Adobe After Effects",)),
+    (82, "Color Grading", "Video & Media", ("Colour Grading",)),
+    (83, "Sound Editing", "Video & Media", ()),
+    (84, "Transitions", "Video & Media", ()),
+    # Management
+    (100, "Planning", "Management", ()),
+    (101, "Leadership", "Management", ()),
+    (102, "Risk Management", "Management", ()),
+    (103, "Budgeting", "Management", ()),
+    (104, "Scrum", "Management", ()),
+    (105, "Requirement Gathering", "Management", ("Requirements Gathering",)),
+    (106, "Process Mapping", "Management", ()),
+    (107, "Roadmap Planning", "Management", ()),
+    (108, "Stakeholder Management", "Management", ()),
+    (109, "Logistics", "Management", ()),
+    (110, "Process Improvement", "Management", ()),
+    # HR & Recruiting
+    (120, "Recruitment", "HR & Recruiting", ()),
+    (121, "Payroll", "HR & Recruiting", ()),
+    (122, "Employee Engagement", "HR & Recruiting", ()),
+    (123, "Onboarding", "HR & Recruiting", ()),
+    (124, "Candidate Sourcing", "HR & Recruiting", ()),
+    (125, "Interviewing", "HR & Recruiting", ()),
+    (126, "ATS", "HR & Recruiting", ("Applicant Tracking System", "Applicant Tracking Systems")),
+    (127, "Job Descriptions", "HR & Recruiting", ()),
+    (128, "Training", "HR & Recruiting", ()),
+    # Marketing & Sales
+    (140, "SEO", "Marketing & Sales", ("Search Engine Optimization",)),
+    (141, "Content Marketing", "Marketing & Sales", ()),
+    (142, "Brand Management", "Marketing & Sales", ()),
+    (143, "Social Media Strategy", "Marketing & Sales", ()),
+    (144, "Email Marketing", "Marketing & Sales", ()),
+    (145, "Campaign Planning", "Marketing & Sales", ()),
+    (146, "Content Creation", "Marketing & Sales", ()),
+    (147, "Community Management", "Marketing & Sales", ()),
+    (148, "Advertising", "Marketing & Sales", ()),
+    (149, "CRM", "Marketing & Sales", ("Customer Relationship Management",)),
+    (150, "Lead Generation", "Marketing & Sales", ()),
+    (151, "Customer Retention", "Marketing & Sales", ()),
+    (152, "Networking", "Marketing & Sales", ()),
+    # Writing
+    (170, "Writing", "Writing", ()),
+    (171, "Research", "Writing", ()),
+    (172, "Editing", "Writing", ()),
+    (173, "Copywriting", "Writing", ()),
+    (174, "Blogging", "Writing", ()),
+    (175, "Storytelling", "Writing", ()),
+    (176, "Content Strategy", "Writing", ()),
+    (177, "Technical Writing", "Writing", ()),
+    (178, "Documentation", "Writing", ()),
+    # Finance
+    (190, "Accounting", "Finance", ()),
+    (191, "Financial Modeling", "Finance", ("Financial Modelling",)),
+    (192, "Forecasting", "Finance", ()),
+    (193, "Valuation", "Finance", ()),
+    (194, "Investment Analysis", "Finance", ()),
+    (195, "Taxation", "Finance", ()),
+    (196, "Reporting", "Finance", ("Financial Reporting",)),
+    (197, "Bookkeeping", "Finance", ()),
+    (198, "Financial Statements", "Finance", ()),
+    # Legal & Compliance
+    (210, "Regulations", "Legal & Compliance", ()),
+    (211, "Audit", "Legal & Compliance", ("Auditing",)),
+    (212, "Policy", "Legal & Compliance", ()),
+    (213, "Risk Assessment", "Legal & Compliance", ()),
+    (214, "Internal Controls", "Legal & Compliance", ()),
+    (215, "Legal Compliance", "Legal & Compliance", ()),
+    (216, "Contract Law", "Legal & Compliance", ()),
+    (217, "Compliance", "Legal & Compliance", ()),
+    (218, "Intellectual Property", "Legal & Compliance", ()),
+    (219, "Corporate Law", "Legal & Compliance", ()),
+    (220, "Litigation Support", "Legal & Compliance", ()),
+    (221, "Drafting Legal Documents", "Legal & Compliance", ()),
+    (222, "Audit Compliance", "Legal & Compliance", ()),
+    # Support
+    (240, "Troubleshooting", "Support", ()),
+    (241, "Hardware/Software Knowledge", "Support", ()),
+    (242, "Remote Assistance", "Support", ()),
+    (243, "System Configuration", "Support", ()),
+    (244, "Product Knowledge", "Support", ()),
+    (245, "Ticketing Systems", "Support", ("Ticketing System",)),
+    # Administration
+    (260, "Organization", "Administration", ("Organisation",)),
+    (261, "Scheduling", "Administration", ()),
+    (262, "Office Management", "Administration", ()),
+    (263, "Meeting Coordination", "Administration", ()),
+    # Soft skills
+    (280, "Problem Solving", "Soft Skills", ()),
+    (281, "Communication", "Soft Skills", ()),
+    (282, "Time Management", "Soft Skills", ()),
+    (283, "Conflict Resolution", "Soft Skills", ()),
+    (284, "Creativity", "Soft Skills", ()),
+    (285, "Negotiation", "Soft Skills", ()),
+    (286, "Patience", "Soft Skills", ()),
+    (287, "Active Listening", "Soft Skills", ()),
+)
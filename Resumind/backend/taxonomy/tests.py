@@ -0,0 +1,49 @@
+from django.test import SimpleTestCase
+from .index import SkillIndex, get_skill_index
+
+
+class FindIdsTests(SimpleTestCase):
+    def setUp(self):
+        self.index = get_skill_index()
+
+    def names(self, text):
+        return self.index.names(self.index.find_ids(text))
+
+    def test_matches_stand_alone(self):
+        self.assertEqual(self.names("JavaScript developer"), ["JavaScript"])
+        self.assertEqual(self.names("Java and JavaScript"), ["Java", "JavaScript"])
+        self.assertEqual(self.names("Hosted on GitHub"), [])
+        self.assertEqual(self.names("Git, GitHub"), ["Git"])
+        self.assertEqual(self.names("Managed SEOs"), [])
+        self.assertEqual(self.names("Led SEO."), ["SEO"])
+
+    def test_plus_and_hash_suffixes(self):
+        self.assertEqual(self.names("C++, Python"), ["C++", "Python"])
+        self.assertEqual(self.names("C+++"), [])
+        index = SkillIndex([(1, "C", "Programming", ()), (2, "C#", "Programming", ())])
+        self.assertEqual(index.find_ids("C# and C"), (2, 1))
+        self.assertEqual(index.find_ids("C#x"), ())
+
+    def test_aliases_map_to_canonical_skill_in_first_appearance_order(self):
+        text = "reactjs, Machine   Learning, CI/CD, React.js, Python, ML, cpp"
+        self.assertEqual(self.names(text), ["React", "Machine Learning", "CI/CD", "Python", "C++"])
+
+    def test_empty_text(self):
+        self.assertEqual(self.index.find_ids(""), ())
+        self.assertEqual(self.index.find_ids(None), ())
+
+
+class SkillIndexTests(SimpleTestCase):
+    def test_duplicate_id_is_rejected(self):
+        with self.assertRaisesMessage(ValueError, "Duplicate skill id 1"):
+            SkillIndex([(1, "Python", "Programming", ()), (1, "Java", "Programming", ())])
+
+    def test_term_shared_between_skills_is_rejected(self):
+        with self.assertRaisesMessage(ValueError, "more than one skill"):
+            SkillIndex([(1, "Python", "Programming", ("Py",)), (2, "PyPy", "Programming", ("py",))])
+
+    def test_lookup_normalizes_terms(self):
+        index = SkillIndex([(1, "Machine Learning", "Data", ("ML",)), (2, "Python", "Programming", ())])
+        self.assertEqual(index.id_for("  machine   LEARNING "), 1)
+        self.assertEqual(index.ids_for(["ml", "python", "Machine Learning", "Cobol"]), (1, 2))
+        self.assertIsNone(index.id_for("Cobol"))
@@ -17,16 +17,15 @@ function Reports({ clearTrigger }) {
     const [modalReport, setModalReport] = useState(null);
     const [selectedReport, setSelectedReport] = useState(null);
     const [modalOpen, setModalOpen] = useState(false);
+    const [nextCursor, setNextCursor] = useState(null);
 
-    const fetchReports = async () => {
+    // Pages arrive already ranked by the server (score, then newest upload)
+    const fetchReports = async (cursor = null) => {
         try {
-            const res = await api.get("/reports/");
-            let data = res.data || [];
-            data = data.sort((a, b) => {
-                if (b.score !== a.score) return b.score - a.score;
-                return new Date(b.date) - new Date(a.date);
-            });
-            setReports(data);
+            const res = await api.get("/reports/", { params: cursor ? { cursor } : {} });
+            const data = res.data?.results || [];
+            setReports((prev) => (cursor ? [...prev, ...data] : data));
+            setNextCursor(res.data?.next_cursor || null);
         } catch (err) {
             console.error("Error fetching reports:", err);
             toast.error("Failed to fetch reports");
@@ -138,6 +137,16 @@ function Reports({ clearTrigger }) {
                                     })}
                                 </tbody>
                             </table>
+                            {nextCursor && (
+                                <div className="text-center mt-4">
+                                    <button
+                                        className="px-4 py-2 bg-yellow-500 text-gray-900 rounded-lg font-semibold hover:bg-yellow-400"
+                                        onClick={() => fetchReports(nextCursor)}
+                                    >
+                                        Load more
+                                    </button>
+                                </div>
+                            )}
                         </div>
 
                         <div className="grid grid-cols-1 md:grid-cols-2 gap-6 mb-12">
@@ -12,6 +12,7 @@ function ResumeList({ clearTrigger }) {
     const [selectedIds, setSelectedIds] = useState([]);
     const [selectAll, setSelectAll] = useState(false);
     const [showScrollTop, setShowScrollTop] = useState(false);
+    const [nextCursor, setNextCursor] = useState(null);
 
     const navigate = useNavigate();
 
@@ -23,30 +24,13 @@ function ResumeList({ clearTrigger }) {
 
     const handleScroll = () => setShowScrollTop(window.scrollY > 100);
 
-    const fetchResumes = async () => {
+    // Lean, paginated list; duplicates are already rejected at upload
+    const fetchResumes = async (cursor = null) => {
         try {
-            const res = await api.get("/resumes/");
-            let data = res.data || [];
-
-            // Filter duplicates based on email + phone + linkedin + github + name
-            const seen = new Set();
-            data = data.filter((r) => {
-                const key =
-                    (r.summary?.email || "") +
-                    "|" +
-                    (r.summary?.phone || "") +
-                    "|" +
-                    (r.summary?.linkedin || "") +
-                    "|" +
-                    (r.summary?.github || "") +
-                    "|" +
-                    (r.summary?.name || "");
-                if (seen.has(key)) return false;
-                seen.add(key);
-                return true;
-            });
-
-            setResumes(data);
+            const res = await api.get("/resumes/", { params: cursor ? { cursor } : {} });
+            const data = res.data?.results || [];
+            setResumes((prev) => (cursor ? [...prev, ...data] : data));
+            setNextCursor(res.data?.next_cursor || null);
         } catch (err) {
             console.error("Fetch resumes error:", err.response || err);
             toast.error("Failed to load resumes. Please try again.");
@@ -55,6 +39,17 @@ function ResumeList({ clearTrigger }) {
         }
     };
 
+    // Contact details and skills come from the full detail endpoint
+    const handleViewDetails = async (resume) => {
+        try {
+            const res = await api.get(`/resumes/${resume.id}/`);
+            setSelectedResume(res.data);
+        } catch (err) {
+            console.error("Fetch resume error:", err.response || err);
+            toast.error("Failed to load resume details.");
+        }
+    };
+
     const handleOpenResume = (resume) => {
         let url = resume.file_url;
         if (url) {
@@ -129,7 +124,7 @@ function ResumeList({ clearTrigger }) {
                                     className="text-lg font-semibold mb-2 text-white cursor-pointer hover:underline"
                                     onClick={() => !deleteMode && handleOpenResume(resume)}
                                 >
-                                    {resume.summary?.name || resume.filename}
+                                    {resume.name}
                                 </h3>
                                 <p
                                     className={`mt-2 inline-block px-3 py-1 text-sm font-medium rounded-full ${
@@ -143,7 +138,7 @@ function ResumeList({ clearTrigger }) {
                                 {!deleteMode && (
                                     <button
                                         className="mt-4 w-full bg-yellow-500 hover:bg-yellow-600 text-white py-2 rounded transition"
-                                        onClick={() => setSelectedResume(resume)}
+                                        onClick={() => handleViewDetails(resume)}
                                     >
                                         View Details
                                     </button>
@@ -152,6 +147,16 @@ function ResumeList({ clearTrigger }) {
                         ))}
                     </div>
                 )}
+                {nextCursor && (
+                    <div className="mt-8 text-center">
+                        <button
+                            className="bg-gray-700 hover:bg-gray-600 text-white px-4 py-2 rounded transition"
+                            onClick={() => fetchResumes(nextCursor)}
+                        >
+                            Load more
+                        </button>
+                    </div>
+                )}
             </div>
 
             <div className="mt-12 flex justify-center gap-6 pb-8">
@@ -113,7 +113,7 @@ const Upload = () => {
             });
             const extracted = res.data.extracted || [];
             const firstName = extracted[0]?.name || extracted[0]?.filename || "Resume";
-            toast.success(`✅ Uploaded & parsed: ${firstName}`);
+            toast.success(`✅ Uploaded: ${firstName} — parsing in background`);
             setSingleFile(null);
             setMultiFiles([]);
             navigate("/resumes");